@@ -0,0 +1,297 @@
+'''
+AST-level constant folding.
+
+In 3.6 all folding happens late, in the bytecode peephole optimizer. This
+module does it on the tree instead, before compile() ever sees it:
+
+    tree = optimize(ast.parse(source))
+    code = compile(tree, filename, 'exec')
+
+It folds constant unary and binary operations, comparisons, tuples and
+subscripts, and drops `if` branches whose test is a constant. Every fold is
+bounded (see the MAX_* limits) so that something like `'x' * 10**9` is
+left alone instead of eating all the memory.
+'''
+import ast
+
+
+# -- Limits, same as the ones of the AST optimizer in CPython 3.7 (ast_opt.c)
+MAX_COLLECTION_SIZE = 256
+MAX_STR_SIZE = 4096
+MAX_INT_BITS = 128
+
+_UNARY = {
+    ast.UAdd: lambda v: +v,
+    ast.USub: lambda v: -v,
+    ast.Invert: lambda v: ~v,
+    ast.Not: lambda v: not v,
+}
+
+_COMPARE = {
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+    ast.Lt: lambda a, b: a < b,
+    ast.LtE: lambda a, b: a <= b,
+    ast.Gt: lambda a, b: a > b,
+    ast.GtE: lambda a, b: a >= b,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+
+class _NotConstant(Exception):
+    pass
+
+
+def constant_value(node):
+    '''
+    The value of a constant node, whichever node type holds it.
+    Raises _NotConstant for anything else.
+    '''
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Num):
+        return node.n
+    if isinstance(node, (ast.Str, ast.Bytes)):
+        return node.s
+    if isinstance(node, ast.NameConstant):
+        return node.value
+    if isinstance(node, ast.Ellipsis):
+        return Ellipsis
+    raise _NotConstant
+
+
+def _check_size(value):
+    '''
+    Folding must not produce huge constants: they bloat co_consts and the
+    .pyc, and building them can take a long time.
+    '''
+    if isinstance(value, int) and not isinstance(value, bool):
+        if value.bit_length() > MAX_INT_BITS:
+            raise _NotConstant
+    elif isinstance(value, (str, bytes)):
+        if len(value) > MAX_STR_SIZE:
+            raise _NotConstant
+    elif isinstance(value, (tuple, frozenset)):
+        if len(value) > MAX_COLLECTION_SIZE:
+            raise _NotConstant
+    return value
+
+
+def _safe_binop(op, left, right):
+    '''
+    Evaluate `left <op> right`, refusing before doing the work when the
+    result would be too big.
+    '''
+    if isinstance(op, ast.Mult):
+        for seq, n in ((left, right), (right, left)):
+            if isinstance(seq, (str, bytes, tuple)) and isinstance(n, int):
+                if n > 0 and len(seq) * n > (
+                        MAX_STR_SIZE if not isinstance(seq, tuple)
+                        else MAX_COLLECTION_SIZE):
+                    raise _NotConstant
+        return left * right
+    if isinstance(op, ast.Pow):
+        if isinstance(left, int) and isinstance(right, int) and right > 0:
+            if left.bit_length() * right > MAX_INT_BITS:
+                raise _NotConstant
+        return left ** right
+    if isinstance(op, ast.LShift):
+        if isinstance(left, int) and isinstance(right, int):
+            if right < 0 or left.bit_length() + right > MAX_INT_BITS:
+                raise _NotConstant
+        return left << right
+    if isinstance(op, ast.Mod) and isinstance(left, (str, bytes)):
+        # -- '%s' % x is string formatting, leave it to runtime
+        raise _NotConstant
+    if isinstance(op, ast.MatMult):
+        raise _NotConstant
+    return {
+        ast.Add: lambda: left + right,
+        ast.Sub: lambda: left - right,
+        ast.Div: lambda: left / right,
+        ast.FloorDiv: lambda: left // right,
+        ast.Mod: lambda: left % right,
+        ast.RShift: lambda: left >> right,
+        ast.BitOr: lambda: left | right,
+        ast.BitXor: lambda: left ^ right,
+        ast.BitAnd: lambda: left & right,
+    }[type(op)]()
+
+
+def _binds_or_yields(stmts):
+    '''
+    Removing code that binds a name changes the scope of that name, and
+    removing a `yield` turns a generator into a plain function, even when
+    the code itself could never run.
+    '''
+    for stmt in stmts:
+        for node in ast.walk(stmt):
+            if isinstance(node, (ast.Yield, ast.YieldFrom, ast.Await,
+                                 ast.Global, ast.Nonlocal, ast.FunctionDef,
+                                 ast.AsyncFunctionDef, ast.ClassDef,
+                                 ast.Import, ast.ImportFrom)):
+                return True
+            if isinstance(node, ast.Name) and not isinstance(node.ctx,
+                                                             ast.Load):
+                return True
+            if isinstance(node, ast.ExceptHandler) and node.name:
+                return True
+    return False
+
+
+def _is_docstring(stmt):
+    '''
+    A bare string statement: in first position it becomes the docstring.
+    '''
+    if not isinstance(stmt, ast.Expr):
+        return False
+    try:
+        return isinstance(constant_value(stmt.value), str)
+    except _NotConstant:
+        return False
+
+
+def _comparable(a, b):
+    return type(a) is type(b) or (isinstance(a, (int, float)) and
+                                  isinstance(b, (int, float)))
+
+
+class ConstantFolder(ast.NodeTransformer):
+    '''
+    Fold constant expressions bottom-up. Folded nodes are replaced by
+    ast.Constant nodes carrying the location of the original node.
+    '''
+
+    def __init__(self):
+        # -- first statements of bodies that have no docstring: folding
+        #    must not turn them into one
+        self._no_docstring = set()
+
+    def _visit_scope(self, node):
+        if node.body and not _is_docstring(node.body[0]):
+            self._no_docstring.add(node.body[0])
+        self.generic_visit(node)
+        return node
+
+    visit_Module = visit_ClassDef = _visit_scope
+    visit_FunctionDef = visit_AsyncFunctionDef = _visit_scope
+
+    def visit_Expr(self, node):
+        value = node.value
+        self.generic_visit(node)
+        if node in self._no_docstring and _is_docstring(node):
+            node.value = value
+        return node
+
+    def fold(self, new_value, node):
+        return ast.copy_location(ast.Constant(value=_check_size(new_value)),
+                                 node)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        try:
+            value = constant_value(node.operand)
+            return self.fold(_UNARY[type(node.op)](value), node)
+        except (_NotConstant, TypeError, ValueError, ArithmeticError):
+            return node
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        try:
+            left = constant_value(node.left)
+            right = constant_value(node.right)
+            return self.fold(_safe_binop(node.op, left, right), node)
+        except (_NotConstant, TypeError, ValueError, ArithmeticError):
+            return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        # -- `x in [1, 2]` -> `x in (1, 2)`, a constant tuple
+        last = node.comparators[-1]
+        if (isinstance(node.ops[-1], (ast.In, ast.NotIn)) and
+                isinstance(last, ast.List)):
+            node.comparators[-1] = self.visit_Tuple(ast.copy_location(
+                ast.Tuple(elts=last.elts, ctx=ast.Load()), last))
+        try:
+            left = constant_value(node.left)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = constant_value(comparator)
+                if isinstance(op, (ast.In, ast.NotIn)) and isinstance(
+                        right, tuple):
+                    items = right
+                else:
+                    items = (right,)
+                for item in items:
+                    if not _comparable(left, item):
+                        # -- mixed types (say b'' == ''): can warn under -b
+                        raise _NotConstant
+                if type(op) not in _COMPARE:
+                    # -- `is` depends on object identity: not ours to decide
+                    raise _NotConstant
+                if not _COMPARE[type(op)](left, right):
+                    return self.fold(False, node)
+                left = right
+            return self.fold(True, node)
+        except (_NotConstant, TypeError, ValueError, ArithmeticError):
+            return node
+
+    def visit_Tuple(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.ctx, ast.Load):
+            return node
+        try:
+            return self.fold(tuple(constant_value(elt) for elt in node.elts),
+                             node)
+        except _NotConstant:
+            return node
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.ctx, ast.Load):
+            return node
+        if not isinstance(node.slice, ast.Index):
+            return node
+        try:
+            value = constant_value(node.value)
+            index = constant_value(node.slice.value)
+            if not isinstance(value, (str, bytes, tuple)):
+                raise _NotConstant
+            return self.fold(value[index], node)
+        except (_NotConstant, TypeError, IndexError, KeyError):
+            return node
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        try:
+            test = constant_value(node.test)
+        except _NotConstant:
+            return node
+        keep, drop = (node.body, node.orelse) if test else (node.orelse,
+                                                             node.body)
+        if _binds_or_yields([ast.Expr(value=drop)]):
+            return node
+        return keep
+
+    def visit_If(self, node):
+        self.generic_visit(node)
+        try:
+            test = constant_value(node.test)
+        except _NotConstant:
+            return node
+        keep, drop = (node.body, node.orelse) if test else (node.orelse,
+                                                             node.body)
+        if _binds_or_yields(drop):
+            return node
+        if node in self._no_docstring and keep and _is_docstring(keep[0]):
+            return node
+        # -- an emptied block still needs a statement
+        return keep or ast.copy_location(ast.Pass(), node)
+
+
+def optimize(tree):
+    '''
+    Fold constants in tree (in place) and return it, ready for compile().
+    '''
+    tree = ConstantFolder().visit(tree)
+    return ast.fix_missing_locations(tree)
@@ -1,5 +1,7 @@
 import ast, astor, codegen, dis
 
+import optimizer, profiler
+
 
 # def f(x):
 #     return 1+2+3+4+x
@@ -70,11 +72,42 @@ def part_b(source):
     # print(codegen.to_source(node))
 
 
-def part_c():
+def part_c(source):
     '''
     Example of constant folding!
     '''
-    pass
+    print('\n\n# ---------------------------- PART C ----------------------------')
+
+    # -- STEP 1: parse code into AST
+    node = ast.parse(source, mode='eval')
+    print('\n# -------------- STEP 1: parse code into AST')
+    print(ast.dump(node))
+
+    # -- STEP 2: fold constants in the AST, before compile() sees it
+    node = optimizer.optimize(node)
+    print('\n# -------------- STEP 2: fold constants in the AST')
+    print(ast.dump(node))
+
+    # -- STEP 3: compile into a code object, nothing left to compute
+    compiled = compile(node, '<string>', mode='eval')
+    print('\n# -------------- STEP 3: compile into a code object')
+    print('co_consts', compiled.co_consts)
+    print(dis.dis(compiled))
+
+    # -- STEP 4: run the code object
+    print('\n# -------------- STEP 4: run the code object')
+    print(eval(compiled))
+
+
+def part_d(source):
+    '''
+    What does each of those steps cost?
+    '''
+    print('\n\n# ---------------------------- PART D ----------------------------')
+    data = source.encode('utf-8')
+    record = {'file': '<string>', 'bytes': len(data),
+              'stages': profiler.profile_source(data, execute=True)}
+    print(profiler.format_table([record], profiler.aggregate([record])))
 
 
 def main():
@@ -90,7 +123,9 @@ def main():
     part_a(source)
     part_b(source)
     part_b(source_with_cf)
-    part_c()
+    part_c(source_with_cf)
+    part_c("('may the force ' + 'be with you')[4:] if not 0 else None")
+    part_d(source)
 
 
     # OTHA STUFF:
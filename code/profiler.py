@@ -0,0 +1,192 @@
+'''
+Where does the time go? Profile each stage of the source -> running code
+pipeline over a corpus:
+
+    tokenize -> parse -> transform -> compile -> marshal -> unmarshal -> exec
+
+Prints a per-file table and the aggregate, and can write it all as JSON.
+
+    python profiler.py tmp_rtrip/json tmp_rtrip/ast.py --exec --json out.json
+'''
+import argparse, ast, io, json, marshal, os, sys, time, tokenize, tracemalloc
+
+import optimizer
+
+
+STAGES = ('tokenize', 'parse', 'transform', 'compile', 'marshal',
+          'unmarshal', 'exec')
+
+
+def _stage(results, name, memory, func, *args):
+    '''
+    Run func(*args) as stage `name`, recording its time and, if asked, the
+    peak memory it allocated.
+    '''
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        value = func(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = None
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        results[name] = {'seconds': elapsed, 'peak': peak}
+    return value
+
+
+def _exec(code, filename, module_name):
+    # -- run it the way an import would, minus sys.modules
+    namespace = {'__name__': module_name, '__file__': filename,
+                 '__builtins__': __builtins__}
+    if '.' in module_name:
+        namespace['__package__'] = module_name.rpartition('.')[0]
+    exec(code, namespace)
+
+
+def profile_source(data, filename='<string>', module_name='__profiled__',
+                   transform=True, execute=False, memory=False, results=None):
+    '''
+    Push data (bytes) through every stage. Returns {stage: {'seconds',
+    'peak'}}; stages that were not run are left out. Stages are recorded
+    into results as they finish, if given, so they survive an exception.
+    '''
+    if results is None:
+        results = {}
+    _stage(results, 'tokenize', memory, lambda: list(
+        tokenize.tokenize(io.BytesIO(data).readline)))
+    tree = _stage(results, 'parse', memory, ast.parse, data, filename)
+    if transform:
+        tree = _stage(results, 'transform', memory, optimizer.optimize, tree)
+    code = _stage(results, 'compile', memory, compile, tree, filename, 'exec')
+    dumped = _stage(results, 'marshal', memory, marshal.dumps, code)
+    code = _stage(results, 'unmarshal', memory, marshal.loads, dumped)
+    if execute:
+        _stage(results, 'exec', memory, _exec, code, filename, module_name)
+    return results
+
+
+def collect(paths):
+    '''
+    (filename, module name) for every .py file in paths, walking directories.
+    '''
+    for path in paths:
+        if os.path.isfile(path):
+            yield path, os.path.splitext(os.path.basename(path))[0]
+            continue
+        base = os.path.dirname(os.path.abspath(path))
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith('.py'):
+                    filename = os.path.join(dirpath, name)
+                    module = os.path.relpath(filename, base)[:-3].replace(
+                        os.sep, '.')
+                    if module.endswith('.__init__'):
+                        module = module[:-len('.__init__')]
+                    yield filename, module
+
+
+def profile_files(paths, transform=True, execute=False, memory=False):
+    '''
+    Profile every file. Returns a list of per-file records; files that fail
+    at some stage get an 'error' entry and keep the stages that did run.
+    '''
+    records = []
+    for filename, module in collect(paths):
+        with open(filename, 'rb') as f:
+            data = f.read()
+        record = {'file': filename, 'bytes': len(data), 'stages': {}}
+        try:
+            profile_source(data, filename, module, transform, execute, memory,
+                           record['stages'])
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            record['error'] = '%s: %s' % (type(e).__name__, e)
+        records.append(record)
+    return records
+
+
+def aggregate(records):
+    '''
+    Total seconds and max peak per stage, over all records.
+    '''
+    total = {}
+    for record in records:
+        for name, stage in record['stages'].items():
+            into = total.setdefault(name, {'seconds': 0.0, 'peak': None})
+            into['seconds'] += stage['seconds']
+            if stage['peak'] is not None:
+                into['peak'] = max(into['peak'] or 0, stage['peak'])
+    return total
+
+
+def format_table(records, total, memory=False):
+    stages = [name for name in STAGES if name in total]
+    width = max([len(os.path.basename(r['file'])) for r in records] + [5])
+    lines = []
+    header = '%-*s %9s' % (width, 'file', 'bytes') + ''.join(
+        ' %10s' % name for name in stages)
+    lines.append(header)
+    lines.append('-' * len(header))
+    for record in records:
+        cells = []
+        for name in stages:
+            stage = record['stages'].get(name)
+            if stage is None:
+                cells.append(' %10s' % '-')
+            elif memory:
+                cells.append(' %10s' % ('%.1fK' % (stage['peak'] / 1024)))
+            else:
+                cells.append(' %10.2f' % (stage['seconds'] * 1000))
+        line = '%-*s %9d' % (width, os.path.basename(record['file']),
+                             record['bytes']) + ''.join(cells)
+        if 'error' in record:
+            line += '  ! ' + record['error']
+        lines.append(line)
+
+    # -- aggregate: where does the time go?
+    lines.append('-' * len(header))
+    overall = sum(stage['seconds'] for stage in total.values()) or 1.0
+    nbytes = sum(r['bytes'] for r in records)
+    lines.append('%-*s %9d' % (width, 'total (ms)', nbytes) + ''.join(
+        ' %10.1f' % (total[name]['seconds'] * 1000) for name in stages))
+    lines.append('%-*s %9s' % (width, 'share', '') + ''.join(
+        ' %9.1f%%' % (100 * total[name]['seconds'] / overall)
+        for name in stages))
+    if memory:
+        lines.append('%-*s %9s' % (width, 'max peak (K)', '') + ''.join(
+            ' %10.1f' % ((total[name]['peak'] or 0) / 1024)
+            for name in stages))
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('paths', nargs='+', help='files or directories')
+    parser.add_argument('--exec', action='store_true', dest='execute',
+                        help='also execute each module, like an import')
+    parser.add_argument('--no-transform', action='store_true',
+                        help='skip the constant folding stage')
+    parser.add_argument('-m', '--memory', action='store_true',
+                        help='show peak memory per stage (tracing slows '
+                             'every stage down)')
+    parser.add_argument('--json', metavar='FILE',
+                        help='also write the results as JSON')
+    args = parser.parse_args()
+
+    records = profile_files(args.paths, not args.no_transform, args.execute,
+                            args.memory)
+    total = aggregate(records)
+    print(format_table(records, total, args.memory))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version, 'files': records,
+                       'total': total}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+'''
+Round-trip every module in a tree: parse -> to_source -> parse -> compare.
+
+The work is spread over a process pool, and files that already passed are
+remembered in a content-hash cache so that unchanged modules are skipped on
+the next run.
+
+    python rtrip.py tmp_rtrip -j 8
+'''
+import argparse, ast, hashlib, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+import astor
+
+
+CACHE_NAME = '.rtrip_cache.json'
+
+
+def cache_tag():
+    '''
+    Results are only reusable with the same interpreter and unparser.
+    '''
+    return '%s/astor-%s' % (sys.version.split()[0], astor.__version__)
+
+
+def collect(root):
+    '''
+    Every .py file below root, sorted so runs are reproducible.
+    '''
+    names = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith('.py'):
+                names.append(os.path.join(dirpath, name))
+    return names
+
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('tag') != cache_tag():
+        return {}
+    return data.get('passed', {})
+
+
+def save_cache(path, passed):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'tag': cache_tag(), 'passed': passed}, f, indent=0,
+                  sort_keys=True)
+    os.replace(tmp, path)
+
+
+def check_roundtrip(data, filename):
+    '''
+    Same check as test_unparse's ASTTestCase.check_roundtrip.
+    Returns None on success, or a short description of the failure.
+    '''
+    try:
+        ast1 = compile(data, filename, 'exec', ast.PyCF_ONLY_AST)
+    except (SyntaxError, ValueError):
+        # -- nothing to round-trip (badsyntax_*.py and friends)
+        return None
+    try:
+        source = astor.to_source(ast1)
+        ast2 = compile(source, filename, 'exec', ast.PyCF_ONLY_AST)
+    except Exception as e:
+        return '%s: %s' % (type(e).__name__, e)
+    if ast.dump(ast1) != ast.dump(ast2):
+        return 'AST mismatch'
+    return None
+
+
+def check_batch(batch):
+    '''
+    Worker entry point: a list of (filename, data) -> list of (filename, error).
+    '''
+    return [(filename, check_roundtrip(data, filename))
+            for filename, data in batch]
+
+
+def batches(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def run(root, workers=None, cache_path=None, batch_size=16, verbose=False):
+    '''
+    Round-trip all modules under root. Returns the list of failures.
+    '''
+    start = time.perf_counter()
+    passed = load_cache(cache_path) if cache_path else {}
+
+    # -- STEP 1: hash everything, keep only what changed since the last pass
+    todo = []
+    cached = 0
+    digests = {}
+    total_bytes = 0
+    for filename in collect(root):
+        with open(filename, 'rb') as f:
+            data = f.read()
+        key = os.path.relpath(filename, root)
+        digest = hashlib.sha1(data).hexdigest()
+        if passed.get(key) == digest:
+            cached += 1
+            continue
+        digests[filename] = key, digest
+        total_bytes += len(data)
+        todo.append((filename, data))
+
+    # -- STEP 2: round-trip the rest in the pool, biggest files first
+    todo.sort(key=lambda item: -len(item[1]))
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(check_batch, batches(todo, batch_size)):
+            for filename, error in results:
+                key, digest = digests[filename]
+                if error is None:
+                    passed[key] = digest
+                    if verbose:
+                        print('ok   %s' % key)
+                else:
+                    passed.pop(key, None)
+                    failures.append((key, error))
+                    print('FAIL %s: %s' % (key, error))
+
+    if cache_path:
+        save_cache(cache_path, passed)
+
+    # -- STEP 3: throughput
+    elapsed = time.perf_counter() - start
+    checked = len(todo)
+    print('%d checked, %d cached, %d failed in %.2fs' % (
+        checked, cached, len(failures), elapsed))
+    if elapsed > 0:
+        print('%.1f files/s, %.1f KiB/s' % (
+            checked / elapsed, total_bytes / 1024 / elapsed))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('root', nargs='?', default=os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'tmp_rtrip'))
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='number of worker processes (default: all cores)')
+    parser.add_argument('-b', '--batch-size', type=int, default=16,
+                        help='files sent to a worker at a time')
+    parser.add_argument('--cache', default=None,
+                        help='cache file (default: <root>/%s)' % CACHE_NAME)
+    parser.add_argument('--no-cache', action='store_true',
+                        help='check every file, ignore and keep no cache')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache or os.path.join(args.root, CACHE_NAME)
+    failures = run(args.root, args.workers, cache_path, args.batch_size,
+                   args.verbose)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
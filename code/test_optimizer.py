@@ -0,0 +1,132 @@
+'''
+Tests for optimizer.py, the AST constant folder.
+
+    python -m unittest test_optimizer
+'''
+import ast
+import unittest
+
+import optimizer
+
+
+def folded(source):
+    '''
+    The optimized tree of source, as an ast.dump() string.
+    '''
+    return ast.dump(optimizer.optimize(ast.parse(source)))
+
+
+def run(source):
+    '''
+    Compile and run the optimized source, returning its namespace.
+    '''
+    namespace = {}
+    exec(compile(optimizer.optimize(ast.parse(source)), '<test>', 'exec'),
+         namespace)
+    return namespace
+
+
+class FoldTests(unittest.TestCase):
+
+    def assertFolds(self, expr, value):
+        tree = optimizer.optimize(ast.parse(expr, mode='eval'))
+        folded_value = optimizer.constant_value(tree.body)
+        self.assertEqual(folded_value, value, expr)
+        self.assertIs(type(folded_value), type(value))
+
+    def assertKeeps(self, expr):
+        tree = optimizer.optimize(ast.parse(expr, mode='eval'))
+        with self.assertRaises(optimizer._NotConstant, msg=expr):
+            optimizer.constant_value(tree.body)
+
+    def test_unary(self):
+        self.assertFolds('-1', -1)
+        self.assertFolds('~5', -6)
+        self.assertFolds('not 0', True)
+        self.assertKeeps('-x')
+        self.assertKeeps('-"a"')
+
+    def test_binop(self):
+        self.assertFolds('1 + 2 * 3', 7)
+        self.assertFolds('"a" + "b"', 'ab')
+        self.assertFolds('2 ** 10', 1024)
+        self.assertFolds('7 // 2', 3)
+        self.assertKeeps('1 / 0')
+        self.assertKeeps('"%s" % 1')
+        self.assertKeeps('x + 1')
+
+    def test_limits(self):
+        self.assertKeeps('"x" * 10 ** 9')
+        self.assertKeeps('2 ** 1000')
+        self.assertKeeps('1 << 1000')
+        self.assertKeeps('(1,) * 1000')
+        self.assertFolds('"x" * 3', 'xxx')
+
+    def test_compare(self):
+        self.assertFolds('1 < 2 < 3', True)
+        self.assertFolds('1 < 2 > 3', False)
+        self.assertFolds('2 in (1, 2)', True)
+        self.assertKeeps('b"" == ""')
+        self.assertKeeps('None is None')
+        tree = optimizer.optimize(ast.parse('x in [1, 2]', mode='eval'))
+        self.assertIsInstance(tree.body.comparators[0], ast.Constant)
+        self.assertEqual(tree.body.comparators[0].value, (1, 2))
+
+    def test_tuple_and_subscript(self):
+        self.assertFolds('(1, 2 + 3)', (1, 5))
+        self.assertFolds('"abc"[1]', 'b')
+        self.assertFolds('(1, 2)[-1]', 2)
+        self.assertKeeps('(1, x)')
+        self.assertKeeps('"abc"[5]')
+        self.assertKeeps('"abc"[1:]')
+
+    def test_ifexp(self):
+        self.assertFolds('1 if True else 2', 1)
+        self.assertFolds('1 if 0 else 2', 2)
+        self.assertKeeps('1 if x else 2')
+        self.assertKeeps('1 if True else (yield)')
+
+    def test_if(self):
+        self.assertEqual(folded('if True:\n    x = 1\nelse:\n    f()\n'),
+                         folded('x = 1\n'))
+        self.assertEqual(folded('f()\nif 1:\n    g()\nelse:\n    h()\n'),
+                         folded('f()\ng()\n'))
+        self.assertEqual(folded('f()\nif 0:\n    g()\n'),
+                         folded('f()\npass\n'))
+        # -- removing a binding would change the scope of the name
+        self.assertIn('If(', folded('def f():\n    if 0:\n        x = 1\n'))
+
+    def test_semantics(self):
+        ns = run('x = 3 * (2 + 1)\ny = "ab"[0] if 1 < 2 else None\n')
+        self.assertEqual((ns['x'], ns['y']), (9, 'a'))
+
+
+class DocstringTests(unittest.TestCase):
+
+    def test_fold_does_not_create_docstring(self):
+        ns = run('def f():\n    "a" + "b"\n'
+                 'class C:\n    "a" * 2\n')
+        self.assertIsNone(ns['f'].__doc__)
+        self.assertIsNone(ns['C'].__doc__)
+        self.assertIsNone(run('"a" + "b"\n').get('__doc__'))
+
+    def test_if_does_not_create_docstring(self):
+        ns = run('def f():\n    if True:\n        "doc"\n'
+                 'def g():\n    if 0:\n        pass\n    else:\n'
+                 '        if 1:\n            "a" + "b"\n        return 1\n')
+        self.assertIsNone(ns['f'].__doc__)
+        self.assertIsNone(ns['g'].__doc__)
+        self.assertEqual(ns['g'](), 1)
+
+    def test_folds_after_first_statement(self):
+        tree = optimizer.optimize(ast.parse(
+            'def f():\n    x\n    "a" + "b"\n'))
+        self.assertIsInstance(tree.body[0].body[1].value, ast.Constant)
+
+    def test_keeps_docstring(self):
+        ns = run('def f():\n    "doc"\n    if True:\n        "other"\n')
+        self.assertEqual(ns['f'].__doc__, 'doc')
+
+
+if __name__ == '__main__':
+    unittest.main()
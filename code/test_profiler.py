@@ -0,0 +1,52 @@
+'''
+Tests for profiler.py, the per-stage pipeline profiler.
+
+    python -m unittest test_profiler
+'''
+import os
+import shutil
+import tempfile
+import unittest
+
+import profiler
+
+
+class ProfileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, name, source):
+        filename = os.path.join(self.directory, name)
+        with open(filename, 'w') as f:
+            f.write(source)
+        return filename
+
+    def test_profile_source(self):
+        results = profiler.profile_source(b'x = 1 + 2\n', execute=True)
+        self.assertEqual(sorted(results), sorted(profiler.STAGES))
+        results = profiler.profile_source(b'x = 1\n', transform=False)
+        self.assertNotIn('transform', results)
+        self.assertNotIn('exec', results)
+
+    def test_failing_stage_keeps_earlier_stages(self):
+        good = self.write('good.py', 'x = 1\n')
+        bad = self.write('bad.py', 'x = 1\nraise ValueError("boom")\n')
+        records = profiler.profile_files([good, bad], execute=True)
+        self.assertEqual([r['file'] for r in records], [good, bad])
+        self.assertNotIn('error', records[0])
+        self.assertEqual(records[1]['error'], 'ValueError: boom')
+        self.assertEqual(sorted(records[1]['stages']), sorted(profiler.STAGES))
+        total = profiler.aggregate(records)
+        self.assertEqual(sorted(total), sorted(profiler.STAGES))
+
+    def test_syntax_error(self):
+        bad = self.write('bad.py', 'x = = 1\n')
+        record, = profiler.profile_files([bad])
+        self.assertTrue(record['error'].startswith('SyntaxError'))
+        self.assertEqual(sorted(record['stages']), ['parse', 'tokenize'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,79 @@ def parse(source, filename='<unknown>', mode='exec'):
     return compile(source, filename, mode, PyCF_ONLY_AST)
 
 
+def reparse(tree, source, start, end, text, filename='<unknown>'):
+    """
+    Update the module *tree* parsed from *source* for an edit that replaces
+    ``source[start:end]`` with *text*, and return a ``(tree, new_source)``
+    tuple.  Only the top-level statements touched by the edit are parsed
+    again and spliced into ``tree.body``; the statements after them are
+    moved with `increment_lineno`.  If the edit can't be confined to whole
+    statements, for example because it opens a bracket or a string, the new
+    source is parsed in full and a new tree is returned instead.
+    """
+    new_source = source[:start] + text + source[end:]
+    if not isinstance(tree, Module):
+        return parse(new_source, filename), new_source
+    from bisect import bisect_right
+    body = tree.body
+    starts = [_stmt_start(stmt) for stmt in body]
+    first = source.count('\n', 0, start) + 1
+    last = first + source.count('\n', start, end)
+    i = bisect_right(starts, first) - 1
+    while i >= 0 and (body[i].col_offset < 0 or i > 0 and starts[i - 1] ==
+        starts[i]):
+        i -= 1
+    j = bisect_right(starts, last)
+    while j < len(body) and (body[j].col_offset < 0 or j > 0 and starts[j -
+        1] == starts[j]):
+        j += 1
+    lo = starts[i] if i >= 0 else 1
+    lo_offset = _line_offset(source, start, first, lo)
+    if j < len(body):
+        hi_offset = _line_offset(source, end, last, starts[j]) + len(text) - (
+            end - start)
+    else:
+        hi_offset = len(new_source)
+    try:
+        new_body = parse(new_source[lo_offset:hi_offset], filename).body
+    except SyntaxError:
+        return parse(new_source, filename), new_source
+    for stmt in new_body:
+        increment_lineno(stmt, lo - 1)
+    delta = text.count('\n') - (last - first)
+    if delta:
+        for stmt in body[j:]:
+            increment_lineno(stmt, delta)
+    body[max(i, 0):j] = new_body
+    return tree, new_source
+
+
+def _stmt_start(stmt):
+    """Return the first line of *stmt*, including its decorators."""
+    lineno = stmt.lineno
+    for decorator in getattr(stmt, 'decorator_list', ()):
+        lineno = min(lineno, decorator.lineno)
+    return lineno
+
+
+def _line_offset(source, pos, lineno, target):
+    """
+    Return the offset in *source* of the start of line *target*, given that
+    offset *pos* is on line *lineno*.  Only the lines in between are scanned.
+    """
+    if target <= lineno:
+        for _ in range(lineno - target + 1):
+            pos = source.rfind('\n', 0, pos)
+            if pos < 0:
+                return 0
+        return pos + 1
+    for _ in range(target - lineno):
+        pos = source.find('\n', pos) + 1
+        if pos == 0:
+            return len(source)
+    return pos
+
+
 _NUM_TYPES = int, float, complex
 
 
@@ -87,6 +160,96 @@ def literal_eval(node_or_string):
     return _convert(node_or_string)
 
 
+def literal_eval_many(strings, memo=None):
+    """
+    Evaluate each item of the iterable *strings* with `literal_eval` and
+    return a list of the results.  Strings made only of ints, floats,
+    double-quoted strings without escapes, lists and dicts with string keys
+    are read by the JSON scanner without building an AST; anything else,
+    including every error, goes through `literal_eval`.
+
+    If *memo* is given, it must be a dict-like object that maps strings to
+    their values.  It is consulted before and updated after evaluating each
+    string, and can be kept across calls.  Results read from the memo are
+    shared, so they should not be mutated.
+    """
+    results = []
+    append = results.append
+    for source in strings:
+        if memo is not None and isinstance(source, str):
+            try:
+                append(memo[source])
+                continue
+            except KeyError:
+                pass
+        if isinstance(source, str):
+            try:
+                value = _fast_literal_eval(source)
+            except Exception:
+                value = literal_eval(source)
+            if memo is not None:
+                memo[source] = value
+        else:
+            value = literal_eval(source)
+        append(value)
+    return results
+
+
+_literal_decoder = None
+_brackets = None
+_MAX_FAST_NESTING = 92
+
+
+def _fast_literal_eval(source):
+    """
+    Evaluate the literal *source* with the JSON scanner, which accepts the
+    Python literals made of ints, floats, double-quoted strings without
+    escapes, lists and dicts with string keys.  Raise an exception for
+    anything the scanner would read differently from `literal_eval`,
+    including brackets nested deeper than the parser can take.
+    """
+    global _literal_decoder
+    if _literal_decoder is None:
+        import json
+        _literal_decoder = json.JSONDecoder(parse_constant=_reject_constant)
+    if (source.lstrip('\r\n')[:1] in ' \t\x0c' or '\\' in source or 'true' in
+        source or 'false' in source or 'null' in source or _has_surrogates(
+        source)):
+        raise ValueError(source)
+    if (source.count('[') + source.count('{') > _MAX_FAST_NESTING and
+        _nesting(source) > _MAX_FAST_NESTING):
+        raise ValueError(source)
+    return _literal_decoder.decode(source)
+
+
+def _nesting(source):
+    global _brackets
+    if _brackets is None:
+        import re
+        _brackets = re.compile('[][{}]')
+    depth = deepest = 0
+    for bracket in _brackets.findall(source):
+        if bracket in '[{':
+            depth += 1
+            if depth > deepest:
+                deepest = depth
+        else:
+            depth -= 1
+    return deepest
+
+
+def _reject_constant(name):
+    raise ValueError(name)
+
+
+def _has_surrogates(source):
+    try:
+        source.encode('utf-8')
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
 def dump(node, annotate_fields=True, include_attributes=False):
     """
     Return a formatted dump of the tree in *node*.  This is mainly useful for
@@ -116,14 +279,109 @@ def dump(node, annotate_fields=True, include_attributes=False):
     return _format(node)
 
 
+_REPR_COMPARED = float, complex, tuple, frozenset
+_MISSING = object()
+_CLOSE = object()
+
+
+class _Field(str):
+    pass
+
+
+def first_difference(a, b, include_attributes=False):
+    """
+    Compare the trees *a* and *b* structurally and return the path of the
+    first difference found, such as ``'body[0].value.left'``, or None if they
+    are equal.  Nodes are equal under the same conditions as their `dump`
+    output, so the comparison stops early instead of formatting both trees.
+    Attributes such as line numbers and column offsets are only compared if
+    *include_attributes* is true.
+    """
+    todo = [('', a, b)]
+    while todo:
+        path, a, b = todo.pop()
+        if isinstance(a, AST):
+            if a.__class__ is not b.__class__:
+                return path
+            names = a._fields
+            if include_attributes:
+                names = names + a._attributes
+            for name in reversed(names):
+                x = getattr(a, name, _MISSING)
+                y = getattr(b, name, _MISSING)
+                if x is _MISSING or y is _MISSING:
+                    if x is not y:
+                        return '%s.%s' % (path, name) if path else name
+                    continue
+                todo.append(('%s.%s' % (path, name) if path else name, x, y))
+        elif isinstance(a, list):
+            if not isinstance(b, list) or len(a) != len(b):
+                return path
+            for i in range(len(a) - 1, -1, -1):
+                todo.append(('%s[%d]' % (path, i), a[i], b[i]))
+        elif a.__class__ is not b.__class__:
+            return path
+        elif isinstance(a, _REPR_COMPARED):
+            if repr(a) != repr(b):
+                return path
+        elif a != b:
+            return path
+    return None
+
+
+def compare(a, b, include_attributes=False):
+    """
+    Return True if the trees *a* and *b* are structurally equal.  See
+    `first_difference` for the details.
+    """
+    return first_difference(a, b, include_attributes) is None
+
+
+def structural_hash(node, include_attributes=False):
+    """
+    Return a hash of the tree *node* that is equal for trees that `compare`
+    equal.  Unlike `hash()` it is stable across processes and interpreter
+    runs, so it can be used as a key of persistent caches.  Attributes are
+    only taken into account if *include_attributes* is true.
+    """
+    import hashlib
+    h = hashlib.blake2b(digest_size=8)
+    update = h.update
+    todo = [node]
+    while todo:
+        node = todo.pop()
+        if isinstance(node, AST):
+            update(b'(' + node.__class__.__name__.encode())
+            names = node._fields
+            if include_attributes:
+                names = names + node._attributes
+            todo.append(_CLOSE)
+            for name in reversed(names):
+                value = getattr(node, name, _MISSING)
+                if value is not _MISSING:
+                    todo.append(value)
+                    todo.append(_Field(name))
+        elif isinstance(node, _Field):
+            update(b'.' + node.encode())
+        elif node is _CLOSE:
+            update(b')')
+        elif isinstance(node, list):
+            update(b'[%d' % len(node))
+            todo.extend(reversed(node))
+        else:
+            update(('%s:%r;' % (node.__class__.__name__, node)).encode(
+                'utf-8', 'backslashreplace'))
+    return int.from_bytes(h.digest(), 'big')
+
+
 def copy_location(new_node, old_node):
     """
-    Copy source location (`lineno` and `col_offset` attributes) from
-    *old_node* to *new_node* if possible, and return *new_node*.
+    Copy source location (`lineno`, `col_offset` and any other location
+    attributes) from *old_node* to *new_node* if possible, and return
+    *new_node*.
     """
-    for attr in ('lineno', 'col_offset'):
-        if (attr in old_node._attributes and attr in new_node._attributes and
-            hasattr(old_node, attr)):
+    for attr in old_node._attributes:
+        if attr in new_node._attributes and hasattr(old_node, attr):
             setattr(new_node, attr, getattr(old_node, attr))
     return new_node
 
@@ -136,22 +394,7 @@ def fix_missing_locations(node):
     recursively where not already set, by setting them to the values of the
     parent node.  It works recursively starting at *node*.
     """
-
-    def _fix(node, lineno, col_offset):
-        if 'lineno' in node._attributes:
-            if not hasattr(node, 'lineno'):
-                node.lineno = lineno
-            else:
-                lineno = node.lineno
-        if 'col_offset' in node._attributes:
-            if not hasattr(node, 'col_offset'):
-                node.col_offset = col_offset
-            else:
-                col_offset = node.col_offset
-        for child in iter_child_nodes(node):
-            _fix(child, lineno, col_offset)
-    _fix(node, 1, 0)
-    return node
+    return _move_locations(node, 0, 0, None, True)
 
 
 def increment_lineno(node, n=1):
@@ -159,10 +402,67 @@ def increment_lineno(node, n=1):
     Increment the line number of each node in the tree starting at *node* by *n*.
     This is useful to "move code" to a different location in a file.
     """
-    for child in walk(node):
-        if 'lineno' in child._attributes:
-            child.lineno = getattr(child, 'lineno', 0) + n
-    return node
+    return _move_locations(node, n, 0, None, False)
+
+
+def normalize_locations(node, n=0, col=0, parent=None):
+    """
+    Fill in missing location attributes and move the tree starting at *node*
+    by *n* lines and *col* columns, in a single non-recursive pass.  This
+    does the work of `fix_missing_locations` and `increment_lineno` at once,
+    and handles every attribute in ``_attributes``, including end positions
+    where the node classes have them.
+
+    Missing attributes are copied from the closest ancestor that has location
+    attributes, after that ancestor was moved.  The ancestors of *node* are
+    not visited: to normalize only a subtree that was changed in a big tree,
+    pass the subtree as *node* and its parent as *parent*.  Without *parent*,
+    lines default to 1 and columns to 0.
+    """
+    return _move_locations(node, n, col, parent, True)
+
+
+_location_kinds_cache = {}
+
+
+def _location_kinds(cls):
+    """
+    Return ``(name, is_line)`` pairs for the location attributes of the node
+    class *cls*, computed once per class.
+    """
+    try:
+        return _location_kinds_cache[cls]
+    except KeyError:
+        kinds = tuple((name, 'lineno' in name) for name in cls._attributes)
+        _location_kinds_cache[cls] = kinds
+        return kinds
+
+
+def _move_locations(root, n, col, parent, fill):
+    todo = [(root, parent)]
+    pop = todo.pop
+    push = todo.append
+    while todo:
+        node, parent = pop()
+        kinds = _location_kinds(node.__class__)
+        if kinds:
+            for name, is_line in kinds:
+                value = getattr(node, name, _MISSING)
+                if value is not _MISSING:
+                    if is_line:
+                        if n:
+                            setattr(node, name, value + n)
+                    elif col:
+                        setattr(node, name, value + col)
+                elif fill:
+                    setattr(node, name, getattr(parent, name, 1 if is_line else
+                        0))
+                elif name == 'lineno':
+                    node.lineno = n
+            parent = node
+        for child in _iter_children(node):
+            push((child, parent))
+    return root
 
 
 def iter_fields(node):
@@ -224,10 +524,59 @@ def walk(node):
     todo = deque([node])
     while todo:
         node = todo.popleft()
-        todo.extend(iter_child_nodes(node))
+        todo.extend(_iter_children(node))
         yield node
 
 
+_SCALAR_FIELDS = {'FunctionDef': ('name',), 'AsyncFunctionDef': ('name',),
+    'ClassDef': ('name',), 'ImportFrom': ('module', 'level'), 'Global': (
+    'names',), 'Nonlocal': ('names',), 'Num': ('n',), 'Str': ('s',),
+    'Bytes': ('s',), 'FormattedValue': ('conversion',), 'NameConstant': (
+    'value',), 'Constant': ('value',), 'Attribute': ('attr',), 'Name': (
+    'id',), 'comprehension': ('is_async',), 'AnnAssign': ('simple',),
+    'ExceptHandler': ('name',), 'arg': ('arg',), 'keyword': ('arg',),
+    'alias': ('name', 'asname')}
+_child_fields_cache = {}
+
+
+def _child_fields(cls):
+    """
+    Return the names of the fields of the node class *cls* that can hold
+    child nodes, leaving out identifiers, numbers and other plain values.
+    The result is computed once per class.
+    """
+    try:
+        return _child_fields_cache[cls]
+    except KeyError:
+        pass
+    scalars = ()
+    for base in cls.__mro__:
+        if base.__name__ in _SCALAR_FIELDS and base.__module__ == '_ast':
+            scalars = _SCALAR_FIELDS[base.__name__]
+            break
+    fields = tuple(f for f in cls._fields or () if f not in scalars)
+    _child_fields_cache[cls] = fields
+    return fields
+
+
+def _iter_children(node):
+    """
+    Return a list of the direct child nodes of *node* in field order.  This
+    is `iter_child_nodes` without the generator overhead.
+    """
+    children = []
+    for name in _child_fields(node.__class__):
+        field = getattr(node, name, None)
+        if isinstance(field, AST):
+            children.append(field)
+        elif isinstance(field, list):
+            children.extend(item for item in field if isinstance(item, AST))
+    return children
+
+
+_visit_names = {}
+
+
 class NodeVisitor(object):
     """
     A node visitor base class that walks the abstract syntax tree and calls a
@@ -243,6 +592,9 @@ class NodeVisitor(object):
     the `visit` method.  If no visitor function exists for a node
     (return value `None`) the `generic_visit` visitor is used instead.
 
+    `traverse` offers a non-recursive alternative to `visit` for read-only
+    passes over very deep trees.
+
     Don't use the `NodeVisitor` if you want to apply changes to nodes during
     traversing.  For this a special visitor exists (`NodeTransformer`) that
     allows modifications.
@@ -250,10 +602,40 @@ class NodeVisitor(object):
 
     def visit(self, node):
         """Visit a node."""
-        method = 'visit_' + node.__class__.__name__
+        try:
+            method = _visit_names[node.__class__]
+        except KeyError:
+            method = _visit_names[node.__class__
+                ] = 'visit_' + node.__class__.__name__
         visitor = getattr(self, method, self.generic_visit)
         return visitor(node)
 
+    def traverse(self, node):
+        """
+        Visit *node* and all of its descendants in depth-first order without
+        recursing, so arbitrarily deep trees can be processed.  The same
+        ``visit_`` methods are called as by `visit`, but children are always
+        visited after the method for their parent returns, so these methods
+        must not call `generic_visit` themselves.  Nodes without a visitor
+        method are simply descended into.  Return values are ignored.
+        """
+        names = _visit_names
+        stack = [node]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            try:
+                method = names[node.__class__]
+            except KeyError:
+                method = names[node.__class__
+                    ] = 'visit_' + node.__class__.__name__
+            visitor = getattr(self, method, None)
+            if visitor is not None:
+                visitor(node)
+            children = _iter_children(node)
+            children.reverse()
+            stack.extend(children)
+
     def generic_visit(self, node):
         """Called if no explicit visitor function exists for a node."""
         for field, value in iter_fields(node):
@@ -322,3 +704,330 @@ class NodeTransformer(NodeVisitor):
                 else:
                     setattr(node, field, new_node)
         return node
+
+
+
+_BINARY_MAGIC = b'AST\x00'
+_BINARY_VERSION = 2
+_BINARY_HEADER = '<4sBBBBIII'
+(_T_NONE, _T_NODE, _T_LEAF, _T_LIST, _T_STR, _T_BYTES, _T_INT, _T_BIGINT,
+    _T_FLOAT, _T_COMPLEX, _T_TRUE, _T_FALSE, _T_ELLIPSIS, _T_TUPLE,
+    _T_FROZENSET, _T_MISSING) = range(16)
+_SIZED = _T_NODE, _T_LIST, _T_TUPLE, _T_FROZENSET
+_SMALL_INT = 1 << 27
+
+
+def dumpb(node):
+    """
+    Serialize the tree *node* into a compact binary format and return it as
+    bytes.  Strings are interned in a table and the nodes are laid out in a
+    flat array of 32-bit words, so the result can be loaded back with
+    `loadb`, or read selectively with ``loadb(data, lazy=True)`` straight
+    from a buffer such as a memory-mapped file.  Location attributes are
+    always included.  The format depends on the Python version, which is
+    checked when loading.
+    """
+    import struct, sys
+    from array import array
+    if not isinstance(node, AST):
+        raise TypeError('expected AST, got %r' % node.__class__.__name__)
+    strings = []
+    string_index = {}
+    words = array('i')
+    append = words.append
+    extend = words.extend
+    double_words = struct.Struct('<ii').unpack
+    pack_double = struct.Struct('<d').pack
+
+    def intern(kind, value):
+        key = kind, value
+        try:
+            return string_index[key]
+        except KeyError:
+            index = string_index[key] = len(strings)
+            if kind == _T_STR:
+                value = value.encode('utf-8', 'surrogatepass')
+            strings.append(value)
+            return index
+
+    def sized(tag, payload, items):
+        start = len(words)
+        append(payload << 4 | tag)
+        append(0)
+        for item in items:
+            _write(item)
+        words[start + 1] = len(words) - start
+
+    def _write(value):
+        if isinstance(value, AST):
+            cls = value.__class__
+            name = cls.__name__
+            if _ast_class(name) is not cls:
+                raise TypeError('cannot serialize %r node' % name)
+            names = cls._fields + cls._attributes
+            if not names:
+                append(intern(_T_STR, name) << 4 | _T_LEAF)
+                return
+            start = len(words)
+            append(intern(_T_STR, name) << 4 | _T_NODE)
+            append(0)
+            for field in names:
+                _write(getattr(value, field, _MISSING))
+            words[start + 1] = len(words) - start
+        elif value is None:
+            append(_T_NONE)
+        elif value is True:
+            append(_T_TRUE)
+        elif value is False:
+            append(_T_FALSE)
+        elif value is _MISSING:
+            append(_T_MISSING)
+        elif value is ...:
+            append(_T_ELLIPSIS)
+        elif isinstance(value, list):
+            sized(_T_LIST, len(value), value)
+        elif isinstance(value, str):
+            append(intern(_T_STR, value) << 4 | _T_STR)
+        elif isinstance(value, bytes):
+            append(intern(_T_BYTES, value) << 4 | _T_BYTES)
+        elif isinstance(value, int):
+            if -_SMALL_INT <= value < _SMALL_INT:
+                append(value << 4 | _T_INT)
+            else:
+                append(intern(_T_STR, repr(value)) << 4 | _T_BIGINT)
+        elif isinstance(value, float):
+            append(_T_FLOAT)
+            extend(double_words(pack_double(value)))
+        elif isinstance(value, complex):
+            append(_T_COMPLEX)
+            extend(double_words(pack_double(value.real)))
+            extend(double_words(pack_double(value.imag)))
+        elif isinstance(value, tuple):
+            sized(_T_TUPLE, len(value), value)
+        elif isinstance(value, frozenset):
+            sized(_T_FROZENSET, len(value), value)
+        else:
+            raise TypeError('cannot serialize %r value' % value.__class__.
+                __name__)
+    _write(node)
+    index = array('i')
+    if isinstance(getattr(node, 'body', None), list):
+        pos = 2
+        for field in node._fields:
+            if field == 'body':
+                end = pos + words[pos + 1]
+                pos += 2
+                while pos < end:
+                    index.append(pos)
+                    pos = _binary_skip(words, pos)
+                break
+            pos = _binary_skip(words, pos)
+    offsets = array('i', [0])
+    for value in strings:
+        offsets.append(offsets[-1] + len(value))
+    header = struct.pack(_BINARY_HEADER, _BINARY_MAGIC, _BINARY_VERSION,
+        sys.version_info[0], sys.version_info[1], sys.byteorder == 'little',
+        len(strings), len(index), len(words))
+    return b''.join([header, offsets.tobytes(), index.tobytes(), words.
+        tobytes()] + strings)
+
+
+def _binary_skip(words, pos):
+    tag = words[pos] & 15
+    if tag in _SIZED:
+        return pos + words[pos + 1]
+    if tag == _T_FLOAT:
+        return pos + 3
+    if tag == _T_COMPLEX:
+        return pos + 5
+    return pos + 1
+
+
+def _ast_class(name):
+    import _ast
+    return getattr(_ast, name, None)
+
+
+def loadb(data, lazy=False):
+    """
+    Load a tree serialized with `dumpb` from the bytes-like object *data*.
+    If *lazy* is true, return a read-only view of the tree instead, which
+    builds nodes only on demand.
+    """
+    if lazy:
+        return _LazyTree(data)
+    return _LazyTree(data).load()
+
+
+class _LazyTree(object):
+    """
+    A read-only view of a tree serialized with `dumpb`, which builds nodes
+    only on demand.  *data* may be any bytes-like object, including a
+    memory-mapped file; the node table is used in place without copying.
+
+    The tree's top-level statements, that is the items of ``Module.body``,
+    can be accessed by index without loading the rest of the tree::
+
+       tree = loadb(data, lazy=True)
+       for kind, name, lineno in tree.definitions():
+           ...
+       node = tree[5]
+
+    `load` builds and returns the complete tree.
+    """
+
+    def __init__(self, data):
+        import struct, sys
+        view = memoryview(data).cast('B')
+        size = struct.calcsize(_BINARY_HEADER)
+        if len(view) < size:
+            raise ValueError('truncated AST data')
+        magic, version, major, minor, little, nstrings, nindex, nwords = (
+            struct.unpack_from(_BINARY_HEADER, view))
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+            raise ValueError('not a binary AST of a supported version')
+        if (major, minor) != sys.version_info[:2]:
+            raise ValueError('binary AST was written by Python %d.%d' % (
+                major, minor))
+        end = size + 4 * (nstrings + 1 + nindex + nwords)
+        if len(view) < end:
+            raise ValueError('truncated AST data')
+        words = view[size:end]
+        if (sys.byteorder == 'little') != bool(little):
+            from array import array
+            words = array('i', words.tobytes())
+            words.byteswap()
+            words = memoryview(words)
+        else:
+            words = words.cast('i')
+        self._offsets = words[:nstrings + 1]
+        self._index = words[nstrings + 1:nstrings + 1 + nindex]
+        self._words = words[nstrings + 1 + nindex:]
+        self._blob = view[end:]
+        self._strings = [None] * nstrings
+        self._classes = {}
+        self._double = struct.Struct('<d').unpack
+        self._double_words = struct.Struct('<ii').pack
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, index):
+        """Build and return the top-level statement *index*."""
+        return self._read(self._index[index])[0]
+
+    def kind(self, index):
+        """Return the class name of the top-level statement *index*."""
+        return self._string(self._words[self._index[index]] >> 4)
+
+    def field(self, index, name):
+        """
+        Build and return only the field *name* of the top-level statement
+        *index*, skipping over the fields that precede it.
+        """
+        words = self._words
+        pos = self._index[index]
+        cls, names = self._class(words[pos] >> 4)
+        pos += 2
+        for field in names:
+            if field == name:
+                value = self._read(pos)[0]
+                if value is _MISSING:
+                    break
+                return value
+            pos = _binary_skip(words, pos)
+        raise AttributeError('%r object has no attribute %r' % (cls.
+            __name__, name))
+
+    def definitions(self):
+        """
+        Return a list of ``(kind, name, lineno)`` tuples for the top-level
+        function and class definitions, without building their nodes.
+        """
+        result = []
+        for i in range(len(self._index)):
+            kind = self.kind(i)
+            if kind in ('FunctionDef', 'AsyncFunctionDef', 'ClassDef'):
+                result.append((kind, self.field(i, 'name'), self.field(i,
+                    'lineno')))
+        return result
+
+    def load(self):
+        """Build and return the complete tree."""
+        return self._read(0)[0]
+
+    def _string(self, index):
+        value = self._strings[index]
+        if value is None:
+            offsets = self._offsets
+            value = self._strings[index] = bytes(self._blob[offsets[index]:
+                offsets[index + 1]]).decode('utf-8', 'surrogatepass')
+        return value
+
+    def _class(self, index):
+        try:
+            return self._classes[index]
+        except KeyError:
+            cls = _ast_class(self._string(index))
+            if cls is None:
+                raise ValueError('unknown node class %r' % self._string(index))
+            info = self._classes[index] = cls, cls._fields + cls._attributes
+            return info
+
+    def _read(self, pos):
+        words = self._words
+        word = words[pos]
+        tag = word & 15
+        if tag == _T_NODE:
+            cls, names = self._class(word >> 4)
+            node = cls()
+            pos += 2
+            for field in names:
+                value, pos = self._read(pos)
+                if value is not _MISSING:
+                    setattr(node, field, value)
+            return node, pos
+        if tag == _T_INT:
+            return word >> 4, pos + 1
+        if tag == _T_LEAF:
+            return self._class(word >> 4)[0](), pos + 1
+        if tag == _T_STR:
+            return self._string(word >> 4), pos + 1
+        if tag == _T_LIST or tag == _T_TUPLE or tag == _T_FROZENSET:
+            items = []
+            end = pos + words[pos + 1]
+            pos += 2
+            while pos < end:
+                value, pos = self._read(pos)
+                items.append(value)
+            if tag == _T_TUPLE:
+                return tuple(items), pos
+            if tag == _T_FROZENSET:
+                return frozenset(items), pos
+            return items, pos
+        if tag == _T_NONE:
+            return None, pos + 1
+        if tag == _T_MISSING:
+            return _MISSING, pos + 1
+        if tag == _T_TRUE:
+            return True, pos + 1
+        if tag == _T_FALSE:
+            return False, pos + 1
+        if tag == _T_ELLIPSIS:
+            return ..., pos + 1
+        if tag == _T_BYTES:
+            offsets = self._offsets
+            index = word >> 4
+            return bytes(self._blob[offsets[index]:offsets[index + 1]]
+                ), pos + 1
+        if tag == _T_BIGINT:
+            return int(self._string(word >> 4)), pos + 1
+        if tag == _T_FLOAT:
+            return self._float(pos + 1), pos + 3
+        if tag == _T_COMPLEX:
+            return complex(self._float(pos + 1), self._float(pos + 3)), pos + 5
+        raise ValueError('corrupt AST data at word %d' % pos)
+
+    def _float(self, pos):
+        words = self._words
+        return self._double(self._double_words(words[pos], words[pos + 1]))[0]
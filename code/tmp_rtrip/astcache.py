@@ -0,0 +1,245 @@
+"""Persistent cache of parsed syntax trees.
+
+Tools that analyse source code tend to parse the same unchanged modules on
+every run.  This module keeps the trees on disk in the compact format of
+`ast.dumpb`, keyed on the file's path, modification time and size and on
+the interpreter version, so that a repeated run over a large tree of
+sources can skip parsing for every file that did not change.
+
+The cache directory is taken from the PYTHONASTCACHE environment variable.
+If it is not set, `parse` simply parses the file.  The cache is bounded:
+once it grows beyond its size limit the least recently used entries are
+removed.
+"""
+import ast
+import binascii
+import hashlib
+import os
+import sys
+import tokenize
+__all__ = ['ASTCache', 'parse', 'clearcache', 'getcache']
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+_SUFFIX = '.ast'
+
+
+class ASTCache:
+    """A directory of serialized syntax trees with LRU eviction.
+
+    *directory* is created if needed.  *max_size* is the total size in
+    bytes the entries may take; the least recently used entries are removed
+    when a store would exceed it.
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+    def __repr__(self):
+        return '<%s %r hits=%d misses=%d>' % (self.__class__.__name__, self
+            .directory, self.hits, self.misses)
+
+    def key(self, filename, mode='exec'):
+        """Return the cache key of *filename*.
+
+        None is returned if the file can't be stat'ed.
+        """
+        try:
+            fullname = os.path.abspath(filename)
+            st = os.stat(fullname)
+        except OSError:
+            return None
+        ident = '%s\x00%d\x00%d\x00%s\x00%s\x00%d' % (fullname, st.st_mtime_ns,
+            st.st_size, sys.implementation.cache_tag, mode, ast.
+            _BINARY_VERSION)
+        return hashlib.sha1(ident.encode('utf-8', 'surrogateescape')
+            ).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, filename, mode='exec'):
+        """Return the cached tree for *filename*, or None."""
+        key = self.key(filename, mode)
+        if key is None:
+            return None
+        return self._get(key)
+
+    def _get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            if binascii.crc32(data[4:]) != int.from_bytes(data[:4], 'little'):
+                raise ValueError('bad checksum')
+            tree = ast.loadb(data[4:])
+        except Exception:
+            self.misses += 1
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return tree
+
+    def put(self, filename, tree, mode='exec'):
+        """Store *tree* as the parsed form of *filename*."""
+        key = self.key(filename, mode)
+        if key is not None:
+            self._put(key, tree)
+
+    def _put(self, key, tree):
+        data = ast.dumpb(tree)
+        data = binascii.crc32(data).to_bytes(4, 'little') + data
+        path = self._path(key)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        if self._size is not None:
+            self._size += len(data)
+        if self._size is None or self._size > self.max_size:
+            self.evict(keep=path)
+
+    def parse(self, filename, mode='exec'):
+        """Return the tree of *filename*, from the cache if possible.
+
+        The key is computed before the file is read, so a file changed in
+        between is stored under its old key and parsed again next time.
+        """
+        key = self.key(filename, mode)
+        tree = None if key is None else self._get(key)
+        if tree is None:
+            with tokenize.open(filename) as f:
+                source = f.read()
+            tree = ast.parse(source, filename, mode)
+            if key is not None:
+                self._put(key, tree)
+        return tree
+
+    def _entries(self):
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        yield st.st_mtime_ns, st.st_size, entry.path
+        except OSError:
+            return
+
+    def evict(self, keep=None):
+        """Remove the least recently used entries until under the limit.
+
+        The entry at path *keep*, if given, is never removed.
+        """
+        entries = sorted(self._entries())
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """Remove every entry."""
+        for mtime, size, path in list(self._entries()):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+_cache = None
+
+
+def getcache():
+    """Return the ASTCache selected by PYTHONASTCACHE, or None."""
+    global _cache
+    directory = os.environ.get('PYTHONASTCACHE')
+    if not directory:
+        return None
+    if _cache is None or _cache.directory != directory:
+        _cache = ASTCache(directory)
+    return _cache
+
+
+def parse(filename, mode='exec'):
+    """Parse the source file *filename*, using the cache if one is set."""
+    cache = getcache()
+    if cache is None:
+        with tokenize.open(filename) as f:
+            source = f.read()
+        return ast.parse(source, filename, mode)
+    return cache.parse(filename, mode)
+
+
+def clearcache():
+    """Remove every entry of the cache selected by PYTHONASTCACHE."""
+    cache = getcache()
+    if cache is not None:
+        cache.clear()
+
+
+def _main(args=None):
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description=
+        'Fill the AST cache for the given files and directories.')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('-d', '--directory', default=os.environ.get(
+        'PYTHONASTCACHE'), help='cache directory (default: $PYTHONASTCACHE)')
+    args = parser.parse_args(args)
+    if not args.directory:
+        parser.error('no cache directory given')
+    cache = ASTCache(args.directory)
+    start = time.perf_counter()
+    count = 0
+    for path in args.paths:
+        if os.path.isdir(path):
+            names = [os.path.join(dirpath, name) for dirpath, dirnames,
+                filenames in os.walk(path) for name in filenames if name.
+                endswith('.py')]
+        else:
+            names = [path]
+        for name in names:
+            try:
+                cache.parse(name)
+            except (OSError, SyntaxError, ValueError) as e:
+                print('%s: %s' % (name, e), file=sys.stderr)
+                continue
+            count += 1
+    print('%d files, %d cached, %d parsed in %.2fs' % (count, cache.hits,
+        count - cache.hits, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    _main()
@@ -12,9 +12,12 @@ See module py_compile for details of the actual byte-compilation.
 """
 import os
 import sys
+import hashlib
 import importlib.util
+import json
 import py_compile
 import struct
+import time
 try:
     from concurrent.futures import ProcessPoolExecutor
 except ImportError:
@@ -51,8 +54,251 @@ def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0):
                 1, quiet=quiet)
 
 
+def _walk_manifest(dir, maxlevels, quiet, directories, visited, caches,
+    legacy=False):
+    if isinstance(dir, os.PathLike):
+        dir = os.fspath(dir)
+    if not quiet:
+        print('Listing {!r}...'.format(dir))
+    try:
+        mtime = os.stat(dir).st_mtime_ns
+    except OSError:
+        mtime = None
+    record = directories.get(dir)
+    if mtime is not None and record is not None and record['mtime'] == mtime:
+        files, subdirs = record['files'], record['dirs']
+    else:
+        try:
+            names = os.listdir(dir)
+        except OSError:
+            if quiet < 2:
+                print("Can't list {!r}".format(dir))
+            names = []
+        names.sort()
+        files, subdirs = [], []
+        for name in names:
+            if name == '__pycache__':
+                continue
+            fullname = os.path.join(dir, name)
+            if not os.path.isdir(fullname):
+                if name.endswith('.py'):
+                    files.append(name)
+            elif name not in (os.curdir, os.pardir) and not os.path.islink(
+                fullname):
+                subdirs.append(name)
+    if mtime is not None:
+        visited[dir] = {'mtime': mtime, 'files': files, 'dirs': subdirs}
+        if files:
+            caches[dir] = _cache_listing(dir, legacy, record, visited[dir])
+    for name in files:
+        yield os.path.join(dir, name)
+    if maxlevels > 0:
+        for name in subdirs:
+            yield from _walk_manifest(os.path.join(dir, name), maxlevels - 1,
+                quiet, directories, visited, caches, legacy)
+
+
+def _cache_listing(dir, legacy, record, new_record):
+    """Return the byte-code file names cached for *dir* and whether they
+    are known to be current.
+
+    The mtime and listing of the directory holding the byte-code are
+    stored in *new_record*; the listing of *record*, the previous run, is
+    reused while that mtime is unchanged.
+    """
+    cachedir = dir if legacy else os.path.join(dir, '__pycache__')
+    try:
+        mtime = os.stat(cachedir).st_mtime_ns
+    except OSError:
+        return frozenset(), False
+    same = record is not None and record.get('cache_mtime') == mtime
+    if same:
+        names = record['cache']
+    else:
+        try:
+            names = sorted(name for name in os.listdir(cachedir) if name.
+                endswith(('.pyc', '.pyo')))
+        except OSError:
+            names = []
+    new_record['cache_mtime'] = mtime
+    new_record['cache'] = names
+    return frozenset(names), same
+
+
+def _cache_file(fullname, legacy, optimize):
+    if legacy:
+        return fullname + 'c'
+    if optimize >= 0:
+        opt = optimize if optimize >= 1 else ''
+        return importlib.util.cache_from_source(fullname, optimization=opt)
+    return importlib.util.cache_from_source(fullname)
+
+
+def _pyc_header(mtime_ns, size):
+    return importlib.util.MAGIC_NUMBER + struct.pack('<LL', mtime_ns // 
+        1000000000 & 4294967295, size & 4294967295)
+
+
+def _pyc_matches(cfile, mtime_ns, size):
+    try:
+        with open(cfile, 'rb') as chandle:
+            header = chandle.read(12)
+    except OSError:
+        return False
+    return header == _pyc_header(mtime_ns, size)
+
+
+def _pyc_current(fullname, record, caches, legacy, optimize):
+    names, same = caches.get(os.path.dirname(fullname), (frozenset(), False))
+    cfile = _cache_file(fullname, legacy, optimize)
+    if os.path.basename(cfile) not in names:
+        return False
+    return same or _pyc_matches(cfile, *record[:2])
+
+
+def _chunksize(count, workers):
+    workers = workers or os.cpu_count() or 1
+    return max(1, count // (workers * 4))
+
+
+def _manifest_settings(ddir, legacy, optimize):
+    if optimize < 0:
+        optimize = sys.flags.optimize
+    return {'version': 2, 'magic': importlib.util.MAGIC_NUMBER.hex(),
+        'ddir': ddir and os.fspath(ddir), 'legacy': bool(legacy),
+        'optimize': optimize}
+
+
+def _load_manifest(filename, settings):
+    try:
+        with open(filename, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict) or data.get('settings') != settings:
+        return {}, {}
+    return data.get('directories', {}), data.get('files', {})
+
+
+def _save_manifest(filename, settings, directories, files):
+    data = json.dumps({'settings': settings, 'directories': directories,
+        'files': files}, sort_keys=True)
+    tmp = '{}.{}.tmp'.format(filename, os.getpid())
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, filename)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def _compile_recorded(item, ddir=None, force=False, quiet=0, legacy=False,
+    optimize=-1):
+    """Bring the byte-code file of one source file up to date.
+
+    *item* is the source file name and its manifest record, or None.
+    Returns the file name, its new record and what was done: 'current',
+    'restamped', 'compiled' or 'failed'.  Restamping is possible when only
+    the source's modification time changed since the byte-code file was
+    written: the byte-code is kept and only its header is rewritten.
+    """
+    fullname, record = item
+    try:
+        with open(fullname, 'rb') as f:
+            st = os.fstat(f.fileno())
+            source = f.read()
+    except OSError:
+        return fullname, None, None
+    digest = hashlib.sha1(source).hexdigest()
+    new_record = [st.st_mtime_ns, st.st_size, digest, True]
+    cfile = _cache_file(fullname, legacy, optimize)
+    if not force:
+        try:
+            with open(cfile, 'rb') as chandle:
+                header = chandle.read(12)
+                if header[:8] == _pyc_header(st.st_mtime_ns, st.st_size)[:8]:
+                    return fullname, new_record, 'current'
+                data = None
+                if record is not None and record[2:] == [digest, True
+                    ] and header == _pyc_header(record[0], record[1]):
+                    data = _pyc_header(st.st_mtime_ns, st.st_size
+                        ) + chandle.read()
+            if data is not None:
+                mode = importlib._bootstrap_external._calc_mode(fullname)
+                importlib._bootstrap_external._write_atomic(cfile, data, mode)
+                return fullname, new_record, 'restamped'
+        except OSError:
+            pass
+    if compile_file(fullname, ddir, True, None, quiet, legacy, optimize):
+        return fullname, new_record, 'compiled'
+    new_record[3] = False
+    return fullname, new_record, 'failed'
+
+
+def _compile_dir_manifest(dir, maxlevels, ddir, force, rx, quiet, legacy,
+    optimize, workers, manifest):
+    start = time.perf_counter()
+    settings = _manifest_settings(ddir, legacy, optimize)
+    directories, files = _load_manifest(manifest, settings)
+    visited = {}
+    caches = {}
+    records = {}
+    todo = []
+    for fullname in _walk_manifest(dir, maxlevels, quiet, directories,
+        visited, caches, legacy):
+        if rx is not None and rx.search(fullname):
+            continue
+        record = files.get(fullname)
+        if not force and record is not None and record[3]:
+            try:
+                st = os.stat(fullname)
+            except OSError:
+                continue
+            if record[:2] == [st.st_mtime_ns, st.st_size] and _pyc_current(
+                fullname, record, caches, legacy, optimize):
+                records[fullname] = record
+                continue
+        todo.append((fullname, record))
+    counts = dict.fromkeys(('unchanged', 'current', 'restamped', 'compiled',
+        'failed'), 0)
+    counts['unchanged'] = len(records)
+    compile_one = partial(_compile_recorded, ddir=ddir, force=force, quiet=
+        quiet, legacy=legacy, optimize=optimize)
+    if (workers is not None and workers != 1 and ProcessPoolExecutor is not
+        None and len(todo) > 1):
+        workers = workers or None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compile_one, todo, chunksize=_chunksize
+                (len(todo), workers)))
+    else:
+        results = map(compile_one, todo)
+    for fullname, record, action in results:
+        if record is not None:
+            records[fullname] = record
+            counts[action] += 1
+    files = {name: record for name, record in files.items() if os.path.
+        dirname(name) not in visited}
+    files.update(records)
+    directories = dict(directories)
+    directories.update(visited)
+    if not _save_manifest(manifest, settings, directories, files
+        ) and quiet < 2:
+        print("Can't write manifest {!r}".format(manifest))
+    if not quiet:
+        print(
+            '{} files: {unchanged} unchanged, {current} up to date, {restamped} restamped, {compiled} compiled, {failed} failed in {:.2f}s'
+            .format(sum(counts.values()), time.perf_counter() - start, **
+            counts))
+    return not counts['failed']
+
+
 def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None, quiet=0,
-    legacy=False, optimize=-1, workers=1):
+    legacy=False, optimize=-1, workers=1, manifest=None):
     """Byte-compile all modules in the given directory tree.
 
     Arguments (only dir is required):
@@ -67,18 +313,25 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None, quiet=0,
     legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
     optimize:  optimization level or -1 for level of the interpreter
     workers:   maximum number of parallel workers
+    manifest:  if given, the name of a file recording the state of every
+               source file and directory in the tree, so that unchanged
+               files are skipped without looking at their byte-code files
     """
     if workers is not None and workers < 0:
         raise ValueError('workers must be greater or equal to 0')
+    if manifest is not None:
+        return _compile_dir_manifest(dir, maxlevels, ddir, force, rx, quiet,
+            legacy, optimize, workers, manifest)
     files = _walk_dir(dir, quiet=quiet, maxlevels=maxlevels, ddir=ddir)
     success = True
     if (workers is not None and workers != 1 and ProcessPoolExecutor is not
         None):
         workers = workers or None
+        files = list(files)
         with ProcessPoolExecutor(max_workers=workers) as executor:
             results = executor.map(partial(compile_file, ddir=ddir, force=
                 force, rx=rx, quiet=quiet, legacy=legacy, optimize=optimize
-                ), files)
+                ), files, chunksize=_chunksize(len(files), workers))
             success = min(results, default=True)
     else:
         for file in files:
@@ -116,16 +369,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0, legacy
         if mo:
             return success
     if os.path.isfile(fullname):
-        if legacy:
-            cfile = fullname + 'c'
-        else:
-            if optimize >= 0:
-                opt = optimize if optimize >= 1 else ''
-                cfile = importlib.util.cache_from_source(fullname,
-                    optimization=opt)
-            else:
-                cfile = importlib.util.cache_from_source(fullname)
-            cache_dir = os.path.dirname(cfile)
+        cfile = _cache_file(fullname, legacy, optimize)
         head, tail = name[:-3], name[-3:]
         if tail == '.py':
             if not force:
@@ -230,6 +474,9 @@ def main():
         )
     parser.add_argument('-j', '--workers', default=1, type=int, help=
         'Run compileall concurrently')
+    parser.add_argument('--manifest', metavar='FILE', default=None, help=
+        'record the state of the compiled trees in FILE and use it to skip unchanged files and directories on the next run'
+        )
     args = parser.parse_args()
     compile_dests = args.compile_dest
     if args.rx:
@@ -259,7 +506,8 @@ def main():
                         rx, args.quiet, args.legacy):
                         success = False
                 elif not compile_dir(dest, maxlevels, args.ddir, args.force,
-                    args.rx, args.quiet, args.legacy, workers=args.workers):
+                    args.rx, args.quiet, args.legacy, workers=args.workers,
+                    manifest=args.manifest):
                     success = False
             return success
         else:
@@ -12,7 +12,6 @@ corresponding to PATTERN.  (It does not compile it.)
 import os
 import posixpath
 import re
-import functools
 __all__ = ['filter', 'fnmatch', 'fnmatchcase', 'translate']
 
 
@@ -36,15 +35,19 @@ def fnmatch(name, pat):
     return fnmatchcase(name, pat)
 
 
-@functools.lru_cache(maxsize=256, typed=True)
 def _compile_pattern(pat):
-    if isinstance(pat, bytes):
-        pat_str = str(pat, 'ISO-8859-1')
-        res_str = translate(pat_str)
-        res = bytes(res_str, 'ISO-8859-1')
-    else:
-        res = translate(pat)
-    return re.compile(res).match
+    key = _compile_pattern, type(pat), pat
+    match = re._cache_get(key)
+    if match is None:
+        if isinstance(pat, bytes):
+            pat_str = str(pat, 'ISO-8859-1')
+            res_str = translate(pat_str)
+            res = bytes(res_str, 'ISO-8859-1')
+        else:
+            res = translate(pat)
+        match = re.compile(res).match
+        re._cache_add(key, match)
+    return match
 
 
 def filter(names, pat):
@@ -89,6 +89,14 @@ def _path_isdir(path):
     return _path_is_mode_type(path, 16384)
 
 
+def _path_isabs(path):
+    """Replacement for os.path.isabs."""
+    if path.startswith(tuple(path_separators)):
+        return True
+    return len(path_separators) > 1 and path[1:2] == ':' and path[2:3
+        ] != '' and path[2:3] in path_separators
+
+
 def _write_atomic(path, data, mode=438):
     """Best-effort function to write data to a path atomically.
     Be prepared to handle a FileExistsError if concurrent writing of the
@@ -112,6 +120,8 @@ _code_type = type(_write_atomic.__code__)
 MAGIC_NUMBER = (3379).to_bytes(2, 'little') + b'\r\n'
 _RAW_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER, 'little')
 _PYCACHE = '__pycache__'
+_INDEX_TAG = 'directory index', 2
+_import_profiler = None
 _OPT = 'opt-'
 SOURCE_SUFFIXES = ['.py']
 BYTECODE_SUFFIXES = ['.pyc']
@@ -342,7 +352,12 @@ def _validate_bytecode_header(data, source_stats=None, name=None, path=None):
 
 def _compile_bytecode(data, name=None, bytecode_path=None, source_path=None):
     """Compile bytecode as returned by _validate_bytecode_header()."""
-    code = marshal.loads(data)
+    profiler = _import_profiler
+    if profiler is None:
+        code = marshal.loads(data)
+    else:
+        with profiler.phase(name, 'unmarshal'):
+            code = marshal.loads(data)
     if isinstance(code, _code_type):
         _bootstrap._verbose_message('code object from {!r}', bytecode_path)
         if source_path is not None:
@@ -504,12 +519,22 @@ class _LoaderBasics:
 
     def exec_module(self, module):
         """Execute the module."""
-        code = self.get_code(module.__name__)
+        profiler = _import_profiler
+        if profiler is not None:
+            with profiler.phase(module.__name__, 'load'):
+                code = self.get_code(module.__name__)
+        else:
+            code = self.get_code(module.__name__)
         if code is None:
             raise ImportError(
                 'cannot load module {!r} when get_code() returns None'.
                 format(module.__name__))
-        _bootstrap._call_with_frames_removed(exec, code, module.__dict__)
+        if profiler is not None:
+            with profiler.phase(module.__name__, 'exec'):
+                _bootstrap._call_with_frames_removed(exec, code, module.
+                    __dict__)
+        else:
+            _bootstrap._call_with_frames_removed(exec, code, module.__dict__)
 
     def load_module(self, fullname):
         """This module is deprecated."""
@@ -609,7 +634,12 @@ class SourceLoader(_LoaderBasics):
                             bytecode_path=bytecode_path, source_path=
                             source_path)
         source_bytes = self.get_data(source_path)
-        code_object = self.source_to_code(source_bytes, source_path)
+        profiler = _import_profiler
+        if profiler is not None:
+            with profiler.phase(fullname, 'compile'):
+                code_object = self.source_to_code(source_bytes, source_path)
+        else:
+            code_object = self.source_to_code(source_bytes, source_path)
         _bootstrap._verbose_message('code object from {}', source_path)
         if (not sys.dont_write_bytecode and bytecode_path is not None and 
             source_mtime is not None):
@@ -734,8 +764,14 @@ class ExtensionFileLoader(FileLoader, _LoaderBasics):
 
     def create_module(self, spec):
         """Create an unitialized extension module"""
-        module = _bootstrap._call_with_frames_removed(_imp.create_dynamic, spec
-            )
+        profiler = _import_profiler
+        if profiler is not None:
+            with profiler.phase(spec.name, 'load'):
+                module = _bootstrap._call_with_frames_removed(_imp.
+                    create_dynamic, spec)
+        else:
+            module = _bootstrap._call_with_frames_removed(_imp.
+                create_dynamic, spec)
         _bootstrap._verbose_message('extension module {!r} loaded from {!r}',
             spec.name, self.path)
         return module
@@ -950,7 +986,12 @@ class PathFinder:
         """
         if path is None:
             path = sys.path
-        spec = cls._get_spec(fullname, path, target)
+        profiler = _import_profiler
+        if profiler is not None:
+            with profiler.phase(fullname, 'find'):
+                spec = cls._get_spec(fullname, path, target)
+        else:
+            spec = cls._get_spec(fullname, path, target)
         if spec is None:
             return None
         elif spec.loader is None:
@@ -985,7 +1026,15 @@ class FileFinder:
     Interactions with the file system are cached for performance, being
     refreshed when the directory the finder is handling has been modified.
 
+    The directory listings can also be shared through an index of absolute
+    directory paths, which load_index() reads from a file and save_index()
+    writes back, so that a new process does not have to list directories
+    that did not change since the index was saved.
+
     """
+    _index = None
+    _index_changed = False
+    _index_clock = None
 
     def __init__(self, path, *loader_details):
         """Initialize with the path to search on and a variable number of
@@ -1034,7 +1083,7 @@ class FileFinder:
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         if _relax_case():
             cache = self._relaxed_path_cache
@@ -1066,13 +1115,27 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
+    def _fill_cache(self, mtime=-1):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            contents = []
+        index = FileFinder._index
+        indexed = index is not None and mtime != -1 and _path_isabs(path)
+        contents = None
+        if indexed:
+            entry = index.get(path)
+            if entry is not None and entry[0] == mtime:
+                contents = entry[1]
+        if contents is None:
+            if indexed:
+                listed = FileFinder._index_clock()
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                contents = []
+            else:
+                if indexed and mtime < int(listed):
+                    index[path] = mtime, tuple(contents), listed
+                    FileFinder._index_changed = True
         if not sys.platform.startswith('win'):
             self._path_cache = set(contents)
         else:
@@ -1088,6 +1151,51 @@ class FileFinder:
         if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
             self._relaxed_path_cache = {fn.lower() for fn in contents}
 
+    @staticmethod
+    def load_index(filename):
+        """Start using the directory index saved in *filename*.
+
+        Entries for directories modified since the index was saved are
+        ignored, as are listings taken in the same second as the directory
+        was last modified: the directory may have changed again within the
+        resolution of its modification time.  A missing or unreadable file
+        gives an empty index, which is filled as directories are listed.
+        """
+        if FileFinder._index_clock is None:
+            time = sys.modules.get('time')
+            if time is None:
+                try:
+                    time = _bootstrap._builtin_from_name('time')
+                except ImportError:
+                    return
+            FileFinder._index_clock = time.time
+        index = {}
+        try:
+            with _io.FileIO(filename, 'r') as file:
+                saved = _os.stat(filename).st_mtime
+                tag, entries = marshal.loads(file.read())
+            if tag == _INDEX_TAG:
+                for path, entry in entries.items():
+                    if entry[0] < saved and entry[0] < int(entry[2]):
+                        index[path] = entry
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+        FileFinder._index = index
+        FileFinder._index_changed = False
+
+    @staticmethod
+    def save_index(filename):
+        """Write the directory index to *filename*.
+
+        Nothing is written when the index did not change since it was
+        loaded.  Returns whether the file was written.
+        """
+        if FileFinder._index is None or not FileFinder._index_changed:
+            return False
+        _write_atomic(filename, marshal.dumps((_INDEX_TAG, FileFinder._index)))
+        FileFinder._index_changed = False
+        return True
+
     @classmethod
     def path_hook(cls, *loader_details):
         """A class method which returns a closure to use on sys.path_hook
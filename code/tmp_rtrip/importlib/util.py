@@ -1,5 +1,7 @@
 """Utility code for constructing importers, etc."""
 from . import abc
+from . import _bootstrap
+from . import _bootstrap_external
 from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
@@ -12,6 +14,7 @@ from ._bootstrap_external import spec_from_file_location
 from contextlib import contextmanager
 import functools
 import sys
+import time
 import types
 import warnings
 
@@ -208,6 +211,7 @@ class _LazyModule(types.ModuleType):
         attrs_then = self.__spec__.loader_state['__dict__']
         original_type = self.__spec__.loader_state['__class__']
         attrs_now = self.__dict__
+        on_load = self.__spec__.loader_state.get('on_load')
         attrs_updated = {}
         for key, value in attrs_now.items():
             if key not in attrs_then:
@@ -221,6 +225,8 @@ class _LazyModule(types.ModuleType):
                     f'module object for {original_name!r} substituted in sys.modules during a lazy load'
                     )
         self.__dict__.update(attrs_updated)
+        if on_load is not None:
+            on_load(self, attr)
         return getattr(self, attr)
 
     def __delattr__(self, attr):
@@ -259,3 +265,231 @@ class LazyLoader(abc.Loader):
         loader_state['__class__'] = module.__class__
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class _ReportingLazyLoader(LazyLoader):
+    """A lazy loader telling its LazyFinder when the module gets loaded."""
+
+    def __init__(self, loader, finder):
+        super().__init__(loader)
+        self.finder = finder
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        super().exec_module(module)
+        spec.loader_state['on_load'] = self.finder._loaded
+
+
+class LazyFinder(abc.MetaPathFinder):
+    """A meta path finder which makes the import of selected modules lazy.
+
+    *patterns* are module names.  A name ending in '.*' selects every
+    submodule of that package, but not the package itself, and '*' selects
+    every module.  Any other name selects just that module.
+
+    While the finder is installed, importing a selected module that is not
+    yet in sys.modules creates the module without executing it, like
+    LazyLoader does; the module is executed when one of its attributes is
+    first used.  The specs are found by the other finders on sys.meta_path,
+    and only modules loaded from source or bytecode files are made lazy.
+
+    Using ``from module import name`` is safe: looking up the name loads the
+    module.  This also means that a from-import of a selected module is not
+    lazy, while a from-import of a selected submodule from its package is.
+
+    *lazy* lists the names of the modules made lazy, in import order, and
+    *loaded* maps the names of those that were loaded since to a tuple of
+    the attribute and the file name and line number of the code which
+    triggered the load.  report() summarizes both.
+    """
+
+    def __init__(self, patterns):
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        self.names = set()
+        self.prefixes = []
+        for pattern in patterns:
+            if pattern == '*':
+                self.prefixes.append('')
+            elif pattern.endswith('.*'):
+                self.prefixes.append(pattern[:-1])
+            else:
+                self.names.add(pattern)
+        self.prefixes = tuple(self.prefixes)
+        self.lazy = []
+        self.loaded = {}
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    def install(self):
+        """Insert the finder at the front of sys.meta_path."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Remove the finder from sys.meta_path.
+
+        Modules which were made lazy stay lazy until they are used.
+        """
+        while self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def matches(self, fullname):
+        """Return True if *fullname* is selected by the patterns."""
+        return fullname in self.names or fullname.startswith(self.prefixes)
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the spec with the other finders and make its loader lazy."""
+        if fullname in sys.modules or not self.matches(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or isinstance(finder, LazyFinder):
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                spec = _bootstrap._find_spec_legacy(finder, fullname, path)
+            else:
+                spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if isinstance(loader, _bootstrap_external.FileLoader
+            ) and not isinstance(loader, _bootstrap_external.
+            ExtensionFileLoader):
+            spec.loader = _ReportingLazyLoader(loader, self)
+            self.lazy.append(fullname)
+        return spec
+
+    def _loaded(self, module, attr):
+        frame = sys._getframe(1)
+        while frame is not None and (frame.f_code.co_filename.startswith(
+            '<frozen') or frame.f_globals.get('__name__', '').startswith(
+            'importlib')):
+            frame = frame.f_back
+        if frame is None:
+            where = None, None
+        else:
+            where = frame.f_code.co_filename, frame.f_lineno
+        self.loaded[module.__spec__.name] = (attr,) + where
+
+    def report(self):
+        """Return a summary of the lazy modules which were or were not loaded.
+        """
+        lines = ['{} lazy modules: {} loaded, {} not loaded'.format(len(
+            self.lazy), len(self.loaded), len(self.lazy) - len(self.loaded))]
+        for name in self.lazy:
+            if name in self.loaded:
+                attr, filename, lineno = self.loaded[name]
+                lines.append('  loaded     {} (.{} at {}:{})'.format(name,
+                    attr, filename, lineno))
+        for name in self.lazy:
+            if name not in self.loaded:
+                lines.append('  not loaded {}'.format(name))
+        return '\n'.join(lines)
+
+
+class _ImportPhase:
+    """One timed phase of importing one module."""
+
+    def __init__(self, profiler, name, kind):
+        self.profiler = profiler
+        self.name = name
+        self.kind = kind
+        self.nested = 0.0
+
+    def __enter__(self):
+        self.profiler._stack.append(self)
+        self.start = self.profiler.timer()
+
+    def __exit__(self, *exc_info):
+        elapsed = self.profiler.timer() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        times = self.profiler.stats.get(self.name)
+        if times is None:
+            times = self.profiler.stats[self.name] = dict.fromkeys(self.
+                profiler.PHASES, 0.0)
+        times[self.kind] += elapsed - self.nested
+
+
+class ImportProfiler:
+    """Attribute the time spent importing modules to each import phase.
+
+    While the profiler is running, the path based import machinery reports
+    the time it spends finding each module, loading its code from a file,
+    unmarshalling or compiling that code and executing it.  Time spent
+    importing other modules from within a phase is charged to those
+    modules, so the times add up to the total import time.
+
+    The results are in *stats*, which maps module names to dicts of seconds
+    per phase, and format() turns them into a table.
+    """
+    PHASES = 'find', 'load', 'unmarshal', 'compile', 'exec'
+
+    def __init__(self, timer=time.perf_counter):
+        self.timer = timer
+        self.stats = {}
+        self._stack = []
+        self._previous = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start reporting the phases of imports to this profiler."""
+        self._previous = _bootstrap_external._import_profiler
+        _bootstrap_external._import_profiler = self
+
+    def stop(self):
+        """Stop profiling and restore the previously running profiler."""
+        _bootstrap_external._import_profiler = self._previous
+        self._previous = None
+
+    def phase(self, name, kind):
+        """Return a context manager timing phase *kind* of importing *name*."""
+        return _ImportPhase(self, name, kind)
+
+    def totals(self):
+        """Return the seconds spent in each phase over all modules."""
+        totals = dict.fromkeys(self.PHASES, 0.0)
+        for times in self.stats.values():
+            for kind, seconds in times.items():
+                totals[kind] += seconds
+        return totals
+
+    def format(self, limit=None):
+        """Return a table of the milliseconds spent per module and phase.
+
+        The modules that took the longest come first; *limit* restricts
+        the table to that many modules.
+        """
+        width = max([len(name) for name in self.stats] + [6])
+
+        def row(name, times):
+            cells = [times[kind] for kind in self.PHASES]
+            cells.append(sum(cells))
+            return '{:<{}}'.format(name, width) + ''.join(' {:9.2f}'.format(
+                seconds * 1000) for seconds in cells)
+        header = '{:<{}}'.format('module', width) + ''.join(' {:>9}'.
+            format(kind) for kind in self.PHASES + ('total',))
+        rows = sorted(self.stats.items(), key=lambda item: sum(item[1].
+            values()), reverse=True)
+        lines = [header, '-' * len(header)]
+        lines.extend(row(name, times) for name, times in rows[:limit])
+        lines.append('-' * len(header))
+        lines.append(row('total', self.totals()))
+        return '\n'.join(lines)
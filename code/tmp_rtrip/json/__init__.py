@@ -54,6 +54,12 @@ Decoding JSON::
     >>> io = StringIO('["streaming API"]')
     >>> json.load(io)[0] == 'streaming API'
     True
+    >>> io = StringIO('[1, "two", {"three": 3}]')
+    >>> for item in json.iterload(io):
+    ...     print(item)
+    1
+    two
+    {'three': 3}
 
 Specializing JSON object decoding::
 
@@ -96,10 +102,10 @@ Using json.tool from the shell to validate and pretty-print::
     Expecting property name enclosed in double quotes: line 1 column 3 (char 2)
 """
 __version__ = '2.0.9'
-__all__ = ['dump', 'dumps', 'load', 'loads', 'JSONDecoder',
-    'JSONDecodeError', 'JSONEncoder']
+__all__ = ['dump', 'dumps', 'load', 'loads', 'iterload', 'JSONDecoder',
+    'JSONDecodeError', 'JSONEncoder', 'DecoderContext']
 __author__ = 'Bob Ippolito <bob@redivi.com>'
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, DecoderContext
 from .encoder import JSONEncoder
 import codecs
 _default_encoder = JSONEncoder(skipkeys=False, ensure_ascii=True,
@@ -154,16 +160,15 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
     if (not skipkeys and ensure_ascii and check_circular and allow_nan and 
         cls is None and indent is None and separators is None and default is
         None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=
             indent, separators=separators, default=default, sort_keys=
-            sort_keys, **kw).iterencode(obj)
-    for chunk in iterable:
-        fp.write(chunk)
+            sort_keys, **kw)
+    encoder.dump(obj, fp)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -271,6 +276,65 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None, parse_int=
         object_pairs_hook=object_pairs_hook, **kw)
 
 
+def _read_chunks(fp, size):
+    read = fp.read
+    chunk = read(size)
+    if isinstance(chunk, str):
+        if chunk.startswith('\ufeff'):
+            raise JSONDecodeError(
+                'Unexpected UTF-8 BOM (decode using utf-8-sig)', chunk, 0)
+        while chunk:
+            yield chunk
+            chunk = read(size)
+    else:
+        while 0 < len(chunk) < 4:
+            more = read(size)
+            if not more:
+                break
+            chunk += more
+        decoder = codecs.getincrementaldecoder(detect_encoding(chunk))(
+            'surrogatepass')
+        while chunk:
+            yield decoder.decode(chunk)
+            chunk = read(size)
+        yield decoder.decode(b'', True)
+
+
+def iterload(fp, *, lines=False, chunk_size=65536, cls=None, object_hook=
+    None, parse_float=None, parse_int=None, parse_constant=None,
+    object_pairs_hook=None, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting file-like object
+    containing a JSON array) to an iterator over the array's items.
+
+    ``fp`` is read ``chunk_size`` characters or bytes at a time and each
+    item is yielded as soon as it is complete, so that only about one item
+    is held in memory at once.  If ``lines`` is true, ``fp`` contains
+    newline-delimited JSON instead, and the value of each line is yielded.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    if (cls is None and object_hook is None and parse_int is None and 
+        parse_float is None and parse_constant is None and 
+        object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    return decoder.iterdecode(_read_chunks(fp, chunk_size), lines)
+
+
 def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
     parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
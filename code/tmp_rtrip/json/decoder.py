@@ -6,7 +6,7 @@ try:
     from _json import scanstring as c_scanstring
 except ImportError:
     c_scanstring = None
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'DecoderContext']
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 NaN = float('nan')
 PosInf = float('inf')
@@ -222,6 +222,105 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
     return values, end
 
 
+class _TextStream:
+    """The unread part of JSON text arriving in chunks.
+
+    Text before ``pos`` is dropped whenever more is read; ``offset``,
+    ``lineno`` and ``colno`` locate the start of ``buf`` in the whole text
+    so that errors report positions in it.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.offset = 0
+        self.lineno = 1
+        self.colno = 0
+
+    def fill(self):
+        """Read at least as much text again as is unread.
+
+        Doubling the unread text keeps the rescanning of a value that spans
+        many chunks linear.  Return False at the end of the text.
+        """
+        if self.eof:
+            return False
+        pos = self.pos
+        newlines = self.buf.count('\n', 0, pos)
+        if newlines:
+            self.lineno += newlines
+            self.colno = pos - self.buf.rfind('\n', 0, pos) - 1
+        else:
+            self.colno += pos
+        self.offset += pos
+        parts = [self.buf[pos:]]
+        want = max(len(parts[0]), 1)
+        for chunk in self.chunks:
+            parts.append(chunk)
+            want -= len(chunk)
+            if want <= 0:
+                break
+        else:
+            self.eof = True
+        self.buf = ''.join(parts)
+        self.pos = 0
+        return True
+
+    def peek(self, _w=WHITESPACE.match):
+        """Skip whitespace and return the next character, or '' at the end."""
+        while True:
+            self.pos = _w(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def error(self, msg, pos):
+        """Return a JSONDecodeError for position pos of buf."""
+        buf = self.buf
+        err = JSONDecodeError(msg, buf, pos)
+        if err.lineno == 1:
+            err.colno += self.colno
+        err.lineno += self.lineno - 1
+        err.pos += self.offset
+        err.args = '%s: line %d column %d (char %d)' % (msg, err.lineno,
+            err.colno, err.pos),
+        return err
+
+    def scan(self, scan_once, delimiters, lookahead=10, _w=WHITESPACE.match):
+        """Return the value starting at pos, reading more text as needed.
+
+        A value is complete when it is followed by one of *delimiters*.  One
+        that is not, such as the '1' in '1.5' cut after the '.', may continue
+        in the next chunk, and so may one that fails to decode within
+        *lookahead* characters of the end of the text or with an
+        unterminated string.
+        """
+        while True:
+            if self.peek() == '':
+                raise self.error('Expecting value', self.pos)
+            try:
+                value, end = scan_once(self.buf, self.pos)
+            except StopIteration as err:
+                msg, pos = 'Expecting value', err.value
+            except JSONDecodeError as err:
+                msg, pos = err.msg, err.pos
+            else:
+                nextpos = _w(self.buf, end).end()
+                if self.eof or nextpos < len(self.buf) and (self.buf[
+                    nextpos] in delimiters or nextpos < len(self.buf) -
+                    lookahead):
+                    self.pos = end
+                    return value
+                msg = pos = None
+            if msg is not None and (self.eof or pos < len(self.buf) -
+                lookahead and not msg.startswith('Unterminated string')):
+                raise self.error(msg, pos)
+            self.fill()
+
+
 class JSONDecoder(object):
     """Simple JSON <http://json.org> decoder
 
@@ -326,3 +425,214 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise JSONDecodeError('Expecting value', s, err.value) from None
         return obj, end
+
+    def iterdecode(self, chunks, lines=False):
+        """Return an iterator over the values of JSON text given in pieces.
+
+        ``chunks`` is an iterable of ``str`` which together form a JSON
+        array; its items are yielded as soon as they are complete.  If
+        ``lines`` is true, the text is newline-delimited JSON instead, and
+        the value of each non-blank line is yielded.
+
+        Only the unread text is kept, so the memory used is bounded by the
+        size of the largest item rather than the size of the whole text.
+
+        """
+        stream = _TextStream(chunks)
+        if lines:
+            return self._iterdecode_lines(stream)
+        return self._iterdecode_array(stream)
+
+    def _iterdecode_array(self, stream, _w=WHITESPACE.match):
+        scan_once = self.scan_once
+        nextchar = stream.peek()
+        if nextchar != '[':
+            raise stream.error("Expecting '['", stream.pos)
+        stream.pos += 1
+        if stream.peek() == ']':
+            stream.pos += 1
+        else:
+            while True:
+                buf = stream.buf
+                try:
+                    value, end = scan_once(buf, _w(buf, stream.pos).end())
+                    end = _w(buf, end).end()
+                    nextchar = buf[end]
+                except (StopIteration, JSONDecodeError, IndexError):
+                    nextchar = None
+                if nextchar == ',' or nextchar == ']':
+                    stream.pos = end + 1
+                else:
+                    value = stream.scan(scan_once, ',]')
+                    nextchar = stream.peek()
+                    stream.pos += 1
+                yield value
+                if nextchar == ']':
+                    break
+                elif nextchar != ',':
+                    raise stream.error("Expecting ',' delimiter", stream.
+                        pos - 1)
+        if stream.peek() != '':
+            raise stream.error('Extra data', stream.pos)
+
+    def _iterdecode_lines(self, stream, _w=WHITESPACE.match):
+        while True:
+            buf = stream.buf
+            pos = stream.pos
+            end = buf.find('\n', pos)
+            if end < 0:
+                if stream.fill():
+                    continue
+                end = len(buf)
+                if pos >= end:
+                    return
+            stream.pos = end + 1
+            line = buf[pos:end]
+            idx = _w(line).end()
+            if idx == len(line):
+                continue
+            try:
+                obj, idx = self.scan_once(line, idx)
+            except StopIteration as err:
+                raise stream.error('Expecting value', pos + err.value
+                    ) from None
+            except JSONDecodeError as err:
+                raise stream.error(err.msg, pos + err.pos) from None
+            idx = _w(line, idx).end()
+            if idx != len(line):
+                raise stream.error('Extra data', pos + idx)
+            yield obj
+
+
+def _schema_fields(target):
+    """Return the field names objects decoded as *target* must have."""
+    if isinstance(target, tuple):
+        return target
+    fields = getattr(target, '_fields', None)
+    if isinstance(target, type) and issubclass(target, tuple
+        ) and fields is not None:
+        return tuple(fields)
+    fields = []
+    for klass in reversed(getattr(target, '__mro__', ())):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = slots,
+        for name in slots:
+            if name not in ('__dict__', '__weakref__') and name not in fields:
+                fields.append(name)
+    if not fields:
+        raise TypeError('schema entries must be tuples of field names, '
+            'named tuple classes or classes with __slots__, not {!r}'.
+            format(target))
+    return tuple(fields)
+
+
+def _slot_setter(target, name):
+    """Return the __set__ of the slot descriptor *name* of *target*."""
+    for klass in target.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = slots,
+        if name in slots:
+            stripped = klass.__name__.lstrip('_')
+            if name.startswith('__') and not name.endswith('__') and stripped:
+                name = '_' + stripped + name
+            return klass.__dict__[name].__set__
+    raise AttributeError(name)
+
+
+def _make_builder(target, fields, keys):
+    """Return a function building *target* from values for these *keys*."""
+    order = tuple([keys.index(name) for name in fields])
+    if order == tuple(range(len(keys))):
+        if isinstance(target, tuple):
+            return tuple
+        if issubclass(target, tuple):
+            new = tuple.__new__
+            return lambda values: new(target, values)
+    else:
+        if isinstance(target, tuple):
+            return lambda values: tuple([values[i] for i in order])
+        if issubclass(target, tuple):
+            new = tuple.__new__
+            return lambda values: new(target, [values[i] for i in order])
+    new = target.__new__
+    setters = [_slot_setter(target, key) for key in keys]
+
+    def build(values):
+        obj = new(target)
+        for setter, value in zip(setters, values):
+            setter(obj, value)
+        return obj
+    return build
+
+
+class DecoderContext(JSONDecoder):
+    """A JSONDecoder for decoding many documents of the same shape.
+
+    The keys of JSON objects are interned in ``keys`` across all the calls
+    to ``decode``, so the objects decoded by all of them share their key
+    strings instead of each document having its own copies.  No more than
+    ``max_keys`` keys are kept.
+
+    ``schema`` is an iterable of targets for JSON objects: tuples of field
+    names, named tuple classes or classes with ``__slots__``.  An object
+    whose keys are exactly the fields of a target, in any order, is built
+    directly from the decoded key and value pairs: as a tuple of the values
+    in field order, as a named tuple, or as an instance of the class with
+    its slots set, without calling ``__init__``.  Other objects are decoded
+    into dicts as usual, and passed to ``object_hook`` if it is given.
+
+    The other arguments are those of ``JSONDecoder``, except for
+    ``object_pairs_hook``, which the context uses itself.
+
+    """
+
+    def __init__(self, *, schema=(), max_keys=65536, **kw):
+        if kw.get('object_pairs_hook') is not None:
+            raise TypeError('DecoderContext does not take object_pairs_hook')
+        kw['object_pairs_hook'] = self._object_from_pairs
+        self.keys = {}
+        self.max_keys = max_keys
+        self._targets = {}
+        for target in schema:
+            fields = _schema_fields(target)
+            if len(set(fields)) != len(fields):
+                raise ValueError('duplicate field names in {!r}'.format(
+                    target))
+            fieldset = frozenset(fields)
+            if fieldset in self._targets:
+                raise ValueError('{!r} and {!r} have the same fields'.
+                    format(self._targets[fieldset][0], target))
+            self._targets[fieldset] = target, fields
+        self._builders = {}
+        super().__init__(**kw)
+
+    def _builder(self, keys):
+        """Return the builder for objects with keys in this order."""
+        target = self._targets.get(frozenset(keys))
+        if target is not None and len(keys) == len(target[1]):
+            builder = _make_builder(target[0], target[1], keys)
+        else:
+            memo = self.keys
+            if len(memo) + len(keys) <= self.max_keys:
+                memo_get = memo.setdefault
+                keys = tuple([memo_get(key, key) for key in keys])
+            object_hook = self.object_hook
+            if object_hook is None:
+                builder = lambda values: dict(zip(keys, values))
+            else:
+                builder = lambda values: object_hook(dict(zip(keys, values)))
+        if len(self._builders) < self.max_keys:
+            self._builders[keys] = builder
+        return builder
+
+    def _object_from_pairs(self, pairs):
+        if not pairs:
+            return self._builder(())(())
+        keys, values = zip(*pairs)
+        try:
+            builder = self._builders[keys]
+        except KeyError:
+            builder = self._builder(keys)
+        return builder(values)
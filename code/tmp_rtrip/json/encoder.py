@@ -206,22 +206,7 @@ class JSONEncoder(object):
             _encoder = encode_basestring_ascii
         else:
             _encoder = encode_basestring
-
-        def floatstr(o, allow_nan=self.allow_nan, _repr=float.__repr__,
-            _inf=INFINITY, _neginf=-INFINITY):
-            if o != o:
-                text = 'NaN'
-            elif o == _inf:
-                text = 'Infinity'
-            elif o == _neginf:
-                text = '-Infinity'
-            else:
-                return _repr(o)
-            if not allow_nan:
-                raise ValueError(
-                    'Out of range float values are not JSON compliant: ' +
-                    repr(o))
-            return text
+        floatstr = _make_floatstr(self.allow_nan)
         if _one_shot and c_make_encoder is not None and self.indent is None:
             _iterencode = c_make_encoder(markers, self.default, _encoder,
                 self.indent, self.key_separator, self.item_separator, self.
@@ -232,6 +217,73 @@ class JSONEncoder(object):
                 item_separator, self.sort_keys, self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def dump(self, o, fp):
+        """Write the JSON representation of ``o`` to ``fp`` (a
+        ``.write()``-supporting file-like object).
+
+        The output is the same as that of ``iterencode``, but it is collected
+        in a list and written in large pieces rather than one call to
+        ``fp.write`` per token.  Without ``indent``, each item of the
+        outermost list or dict is encoded at once by the C accelerator if it
+        is available.
+
+        """
+        if type(self).iterencode is not JSONEncoder.iterencode:
+            _write_joined(self.iterencode(o), fp.write)
+            return
+        if self.check_circular:
+            markers = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        if c_make_encoder is not None and self.indent is None:
+            _nested = c_make_encoder(markers, self.default, _encoder, self.
+                indent, self.key_separator, self.item_separator, self.
+                sort_keys, self.skipkeys, self.allow_nan)
+        else:
+            _nested = None
+        _encode = _make_encode_into(markers, self.default, _encoder, self.
+            indent, _make_floatstr(self.allow_nan), self.key_separator, self.
+            item_separator, self.sort_keys, self.skipkeys, fp.write, _nested)
+        _encode(o)
+
+
+_WRITE_PIECES = 4096
+
+
+def _write_joined(chunks, write, _max_pieces=_WRITE_PIECES):
+    pieces = []
+    append = pieces.append
+    for chunk in chunks:
+        append(chunk)
+        if len(pieces) >= _max_pieces:
+            write(''.join(pieces))
+            del pieces[:]
+    if pieces:
+        write(''.join(pieces))
+
+
+def _make_floatstr(allow_nan):
+
+    def floatstr(o, allow_nan=allow_nan, _repr=float.__repr__, _inf=
+        INFINITY, _neginf=-INFINITY):
+        if o != o:
+            text = 'NaN'
+        elif o == _inf:
+            text = 'Infinity'
+        elif o == _neginf:
+            text = '-Infinity'
+        else:
+            return _repr(o)
+        if not allow_nan:
+            raise ValueError(
+                'Out of range float values are not JSON compliant: ' + repr(o))
+        return text
+    return floatstr
+
 
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
     _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
@@ -394,3 +446,203 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
             if markers is not None:
                 del markers[markerid]
     return _iterencode
+
+
+def _make_encode_into(markers, _default, _encoder, _indent, _floatstr,
+    _key_separator, _item_separator, _sort_keys, _skipkeys, _write,
+    _nested=None, _max_pieces=_WRITE_PIECES, ValueError=ValueError, dict=
+    dict, float=float, id=id, int=int, isinstance=isinstance, len=len, list=
+    list, str=str, tuple=tuple, _intstr=int.__str__):
+    """Return a function writing the pieces _make_iterencode would yield.
+
+    The pieces are appended to a list by plain recursive calls instead of
+    being passed up through a generator per container, and are joined and
+    written once there are _max_pieces of them.  If _nested is given, it
+    returns the pieces for each list or dict within the outermost one.
+    """
+    if _indent is not None and not isinstance(_indent, str):
+        _indent = ' ' * _indent
+    pieces = []
+    append = pieces.append
+    extend = pieces.extend
+    newline_indents = ['\n']
+
+    def _newline_indent(level):
+        while len(newline_indents) <= level:
+            newline_indents.append(newline_indents[-1] + _indent)
+        return newline_indents[level]
+
+    def _flush():
+        _write(''.join(pieces))
+        del pieces[:]
+
+    def _encode_list(lst, _current_indent_level):
+        if not lst:
+            append('[]')
+            return
+        if markers is not None:
+            markerid = id(lst)
+            if markerid in markers:
+                raise ValueError('Circular reference detected')
+            markers[markerid] = lst
+        append('[')
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = _newline_indent(_current_indent_level)
+            separator = _item_separator + newline_indent
+            append(newline_indent)
+        else:
+            newline_indent = None
+            separator = _item_separator
+        first = True
+        for value in lst:
+            if first:
+                first = False
+            else:
+                append(separator)
+            if isinstance(value, str):
+                append(_encoder(value))
+            elif value is None:
+                append('null')
+            elif value is True:
+                append('true')
+            elif value is False:
+                append('false')
+            elif isinstance(value, int):
+                append(_intstr(value))
+            elif isinstance(value, float):
+                append(_floatstr(value))
+            elif isinstance(value, (list, tuple)):
+                if _nested is None:
+                    _encode_list(value, _current_indent_level)
+                else:
+                    extend(_nested(value, _current_indent_level))
+            elif isinstance(value, dict):
+                if _nested is None:
+                    _encode_dict(value, _current_indent_level)
+                else:
+                    extend(_nested(value, _current_indent_level))
+            else:
+                _encode(value, _current_indent_level)
+            if len(pieces) >= _max_pieces:
+                _flush()
+        if newline_indent is not None:
+            append(_newline_indent(_current_indent_level - 1))
+        append(']')
+        if markers is not None:
+            del markers[markerid]
+
+    def _encode_dict(dct, _current_indent_level):
+        if not dct:
+            append('{}')
+            return
+        if markers is not None:
+            markerid = id(dct)
+            if markerid in markers:
+                raise ValueError('Circular reference detected')
+            markers[markerid] = dct
+        append('{')
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = _newline_indent(_current_indent_level)
+            item_separator = _item_separator + newline_indent
+            append(newline_indent)
+        else:
+            newline_indent = None
+            item_separator = _item_separator
+        first = True
+        if _sort_keys:
+            items = sorted(dct.items(), key=lambda kv: kv[0])
+        else:
+            items = dct.items()
+        for key, value in items:
+            if isinstance(key, str):
+                pass
+            elif isinstance(key, float):
+                key = _floatstr(key)
+            elif key is True:
+                key = 'true'
+            elif key is False:
+                key = 'false'
+            elif key is None:
+                key = 'null'
+            elif isinstance(key, int):
+                key = _intstr(key)
+            elif _skipkeys:
+                continue
+            else:
+                raise TypeError('key ' + repr(key) + ' is not a string')
+            if first:
+                first = False
+            else:
+                append(item_separator)
+            append(_encoder(key))
+            append(_key_separator)
+            if isinstance(value, str):
+                append(_encoder(value))
+            elif value is None:
+                append('null')
+            elif value is True:
+                append('true')
+            elif value is False:
+                append('false')
+            elif isinstance(value, int):
+                append(_intstr(value))
+            elif isinstance(value, float):
+                append(_floatstr(value))
+            elif isinstance(value, (list, tuple)):
+                if _nested is None:
+                    _encode_list(value, _current_indent_level)
+                else:
+                    extend(_nested(value, _current_indent_level))
+            elif isinstance(value, dict):
+                if _nested is None:
+                    _encode_dict(value, _current_indent_level)
+                else:
+                    extend(_nested(value, _current_indent_level))
+            else:
+                _encode(value, _current_indent_level)
+            if len(pieces) >= _max_pieces:
+                _flush()
+        if newline_indent is not None:
+            append(_newline_indent(_current_indent_level - 1))
+        append('}')
+        if markers is not None:
+            del markers[markerid]
+
+    def _encode(o, _current_indent_level):
+        if isinstance(o, str):
+            append(_encoder(o))
+        elif o is None:
+            append('null')
+        elif o is True:
+            append('true')
+        elif o is False:
+            append('false')
+        elif isinstance(o, int):
+            append(_intstr(o))
+        elif isinstance(o, float):
+            append(_floatstr(o))
+        elif isinstance(o, (list, tuple)):
+            _encode_list(o, _current_indent_level)
+        elif isinstance(o, dict):
+            _encode_dict(o, _current_indent_level)
+        else:
+            if markers is not None:
+                markerid = id(o)
+                if markerid in markers:
+                    raise ValueError('Circular reference detected')
+                markers[markerid] = o
+            o = _default(o)
+            _encode(o, _current_indent_level)
+            if markers is not None:
+                del markers[markerid]
+
+    def encode_into(o):
+        try:
+            _encode(o, 0)
+            if pieces:
+                _flush()
+        finally:
+            del pieces[:]
+    return encode_into
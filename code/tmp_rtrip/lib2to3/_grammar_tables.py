@@ -0,0 +1,348 @@
+"""Grammar tables written by Grammar.dump_module(); do not edit.
+
+Rebuild them with python -m lib2to3.pgen2.driver --tables.
+"""
+source_hash = '2713b32f014ddd6268ed4396ee95f960123e6e7d'
+symbol2number = (('file_input', 256), ('and_expr', 257), ('and_test', 258),
+                 ('annassign', 259), ('arglist', 260), ('argument', 261),
+                 ('arith_expr', 262), ('assert_stmt', 263),
+                 ('async_funcdef', 264), ('async_stmt', 265), ('atom', 266),
+                 ('augassign', 267), ('break_stmt', 268), ('classdef', 269),
+                 ('comp_for', 270), ('comp_if', 271), ('comp_iter', 272),
+                 ('comp_op', 273), ('comparison', 274), ('compound_stmt', 275),
+                 ('continue_stmt', 276), ('decorated', 277),
+                 ('decorator', 278), ('decorators', 279), ('del_stmt', 280),
+                 ('dictsetmaker', 281), ('dotted_as_name', 282),
+                 ('dotted_as_names', 283), ('dotted_name', 284),
+                 ('encoding_decl', 285), ('eval_input', 286),
+                 ('except_clause', 287), ('exec_stmt', 288), ('expr', 289),
+                 ('expr_stmt', 290), ('exprlist', 291), ('factor', 292),
+                 ('flow_stmt', 293), ('for_stmt', 294), ('funcdef', 295),
+                 ('global_stmt', 296), ('if_stmt', 297),
+                 ('import_as_name', 298), ('import_as_names', 299),
+                 ('import_from', 300), ('import_name', 301),
+                 ('import_stmt', 302), ('lambdef', 303), ('listmaker', 304),
+                 ('not_test', 305), ('old_lambdef', 306), ('old_test', 307),
+                 ('or_test', 308), ('parameters', 309), ('pass_stmt', 310),
+                 ('power', 311), ('print_stmt', 312), ('raise_stmt', 313),
+                 ('return_stmt', 314), ('shift_expr', 315),
+                 ('simple_stmt', 316), ('single_input', 317), ('sliceop', 318),
+                 ('small_stmt', 319), ('star_expr', 320), ('stmt', 321),
+                 ('subscript', 322), ('subscriptlist', 323), ('suite', 324),
+                 ('term', 325), ('test', 326), ('testlist', 327),
+                 ('testlist1', 328), ('testlist_gexp', 329),
+                 ('testlist_safe', 330), ('testlist_star_expr', 331),
+                 ('tfpdef', 332), ('tfplist', 333), ('tname', 334),
+                 ('trailer', 335), ('try_stmt', 336), ('typedargslist', 337),
+                 ('varargslist', 338), ('vfpdef', 339), ('vfplist', 340),
+                 ('vname', 341), ('while_stmt', 342), ('with_item', 343),
+                 ('with_stmt', 344), ('with_var', 345), ('xor_expr', 346),
+                 ('yield_arg', 347), ('yield_expr', 348), ('yield_stmt', 349))
+states = ((((1, 1), (2, 0), (3, 0)), ((0, 1),)),
+          (((42, 1),), ((43, 0), (0, 1))), (((44, 1),), ((45, 0), (0, 1))),
+          (((46, 1),), ((47, 2),), ((48, 3), (0, 2)), ((47, 4),), ((0, 4),)),
+          (((49, 1),), ((50, 2), (0, 1)), ((49, 1), (0, 2))),
+          (((51, 1), (52, 2), (47, 3)), ((53, 2),), ((0, 2),),
+           ((48, 4), (54, 2), (0, 3)), ((47, 2),)),
+          (((55, 1),), ((6, 0), (7, 0), (0, 1))),
+          (((12, 1),), ((47, 2),), ((50, 3), (0, 2)), ((47, 4),), ((0, 4),)),
+          (((37, 1),), ((56, 2),), ((0, 2),)),
+          (((37, 1),), ((57, 2), (56, 2), (58, 2)), ((0, 2),)),
+          (((4, 1), (8, 2), (10, 3), (11, 4), (35, 5), (39, 6), (40, 6),
+            (41, 7)),
+           ((59, 6), (60, 8), (61, 8)), ((8, 9),), ((62, 6), (63, 10)),
+           ((64, 11),), ((65, 6), (66, 12)), ((0, 6),), ((41, 7), (0, 7)),
+           ((59, 6),), ((8, 6),), ((62, 6),), ((11, 6),), ((65, 6),)),
+          (((67, 1), (68, 1), (69, 1), (70, 1), (71, 1), (72, 1), (73, 1),
+            (74, 1), (75, 1), (76, 1), (77, 1), (78, 1), (79, 1)),
+           ((0, 1),)),
+          (((13, 1),), ((0, 1),)),
+          (((14, 1),), ((39, 2),), ((4, 3), (46, 4)), ((59, 5), (80, 6)),
+           ((81, 7),), ((46, 4),), ((59, 5),), ((0, 7),)),
+          (((19, 1), (37, 2)), ((82, 3),), ((19, 1),), ((83, 4),), ((84, 5),),
+           ((85, 6), (0, 5)), ((0, 6),)),
+          (((22, 1),), ((86, 2),), ((85, 3), (0, 2)), ((0, 3),)),
+          (((54, 1), (87, 1)), ((0, 1),)),
+          (((88, 1), (89, 1), (90, 1), (88, 1), (91, 1), (92, 1), (93, 1),
+            (83, 1), (94, 2), (26, 3)),
+           ((0, 1),), ((26, 1), (0, 2)), ((83, 1),)),
+          (((53, 1),), ((95, 0), (0, 1))),
+          (((96, 1), (97, 1), (98, 1), (57, 1), (56, 1), (99, 1), (100, 1),
+            (101, 1), (58, 1)),
+           ((0, 1),)),
+          (((15, 1),), ((0, 1),)),
+          (((102, 1),), ((103, 2), (97, 2), (56, 2)), ((0, 2),)),
+          (((9, 1),), ((104, 2),), ((4, 3), (2, 4)), ((59, 5), (80, 6)),
+           ((0, 4),), ((2, 4),), ((59, 5),)),
+          (((105, 1),), ((105, 1), (0, 1))),
+          (((17, 1),), ((82, 2),), ((0, 2),)),
+          (((51, 1), (52, 2), (47, 3)), ((53, 4),), ((50, 5), (54, 6), (0, 2)),
+           ((50, 5), (46, 7), (54, 6), (0, 3)), ((50, 8), (54, 6), (0, 4)),
+           ((52, 9), (47, 9), (0, 5)), ((0, 6),), ((47, 4),),
+           ((51, 10), (47, 11), (0, 8)), ((50, 5), (0, 9)), ((53, 12),),
+           ((46, 13),), ((50, 8), (0, 12)), ((47, 12),)),
+          (((104, 1),), ((106, 2), (0, 1)), ((39, 3),), ((0, 3),)),
+          (((107, 1),), ((50, 0), (0, 1))), (((39, 1),), ((8, 0), (0, 1))),
+          (((39, 1),), ((0, 1),)), (((108, 1),), ((1, 2), (2, 1)), ((0, 2),)),
+          (((109, 1),), ((47, 2), (0, 1)), ((50, 3), (106, 3), (0, 2)),
+           ((47, 4),), ((0, 4),)),
+          (((18, 1),), ((53, 2),), ((83, 3), (0, 2)), ((47, 4),),
+           ((50, 5), (0, 4)), ((47, 6),), ((0, 6),)),
+          (((110, 1),), ((111, 0), (0, 1))),
+          (((112, 1),), ((48, 2), (113, 3), (114, 4), (0, 1)),
+           ((112, 5), (61, 5)), ((0, 3),), ((108, 3), (61, 3)),
+           ((48, 2), (0, 5))),
+          (((53, 1), (52, 1)), ((50, 2), (0, 1)), ((53, 1), (52, 1), (0, 2))),
+          (((6, 1), (7, 1), (36, 1), (115, 2)), ((116, 2),), ((0, 2),)),
+          (((117, 1), (118, 1), (119, 1), (120, 1), (121, 1)), ((0, 1),)),
+          (((19, 1),), ((82, 2),), ((83, 3),), ((108, 4),), ((46, 5),),
+           ((81, 6),), ((122, 7), (0, 6)), ((46, 8),), ((81, 9),), ((0, 9),)),
+          (((16, 1),), ((39, 2),), ((123, 3),), ((124, 4), (46, 5)),
+           ((47, 6),), ((81, 7),), ((46, 5),), ((0, 7),)),
+          (((21, 1), (25, 1)), ((39, 2),), ((50, 1), (0, 2))),
+          (((22, 1),), ((47, 2),), ((46, 3),), ((81, 4),),
+           ((125, 1), (122, 5), (0, 4)), ((46, 6),), ((81, 7),), ((0, 7),)),
+          (((39, 1),), ((106, 2), (0, 1)), ((39, 3),), ((0, 3),)),
+          (((126, 1),), ((50, 2), (0, 1)), ((126, 1), (0, 2))),
+          (((20, 1),), ((8, 2), (104, 3)), ((8, 2), (23, 4), (104, 3)),
+           ((23, 4),), ((4, 5), (5, 6), (127, 6)), ((127, 7),), ((0, 6),),
+           ((59, 6),)),
+          (((23, 1),), ((128, 2),), ((0, 2),)),
+          (((129, 1), (130, 1)), ((0, 1),)),
+          (((24, 1),), ((46, 2), (131, 3)), ((47, 4),), ((46, 2),), ((0, 4),)),
+          (((52, 1), (47, 1)), ((50, 2), (54, 3), (0, 1)),
+           ((52, 4), (47, 4), (0, 2)), ((0, 3),), ((50, 2), (0, 4))),
+          (((26, 1), (132, 2)), ((44, 2),), ((0, 2),)),
+          (((24, 1),), ((46, 2), (131, 3)), ((86, 4),), ((46, 2),), ((0, 4),)),
+          (((133, 1), (134, 1)), ((0, 1),)), (((135, 1),), ((136, 0), (0, 1))),
+          (((4, 1),), ((59, 2), (137, 3)), ((0, 2),), ((59, 2),)),
+          (((27, 1),), ((0, 1),)),
+          (((38, 1), (138, 2)), ((138, 2),), ((51, 3), (139, 2), (0, 2)),
+           ((116, 4),), ((0, 4),)),
+          (((28, 1),), ((140, 2), (47, 3), (0, 1)), ((47, 4),),
+           ((50, 5), (0, 3)), ((50, 6), (0, 4)), ((47, 3), (0, 5)), ((47, 7),),
+           ((50, 8), (0, 7)), ((47, 7), (0, 8))),
+          (((29, 1),), ((47, 2), (0, 1)), ((50, 3), (20, 4), (0, 2)),
+           ((47, 5),), ((47, 6),), ((50, 4), (0, 5)), ((0, 6),)),
+          (((30, 1),), ((108, 2), (0, 1)), ((0, 2),)),
+          (((141, 1),), ((142, 0), (140, 0), (0, 1))),
+          (((143, 1),), ((144, 2), (2, 3)), ((2, 3), (143, 1)), ((0, 3),)),
+          (((2, 1), (145, 2), (146, 1)), ((0, 1),), ((2, 1),)),
+          (((46, 1),), ((47, 2), (0, 1)), ((0, 2),)),
+          (((147, 1), (148, 1), (149, 1), (150, 1), (151, 1), (152, 1),
+            (153, 1), (154, 1), (155, 1)),
+           ((0, 1),)),
+          (((5, 1),), ((53, 2),), ((0, 2),)),
+          (((145, 1), (146, 1)), ((0, 1),)),
+          (((46, 1), (47, 2)), ((156, 3), (47, 4), (0, 1)), ((46, 1), (0, 2)),
+           ((0, 3),), ((156, 3), (0, 4))),
+          (((157, 1),), ((50, 2), (0, 1)), ((157, 1), (0, 2))),
+          (((2, 1), (146, 2)), ((158, 3),), ((0, 2),), ((3, 4),),
+           ((159, 2), (3, 4))),
+          (((116, 1),),
+           ((160, 0), (5, 0), (161, 0), (162, 0), (9, 0), (0, 1))),
+          (((163, 1), (134, 2)), ((0, 1),), ((22, 3), (0, 2)), ((134, 4),),
+           ((122, 5),), ((47, 1),)),
+          (((47, 1),), ((50, 2), (0, 1)), ((47, 1), (0, 2))),
+          (((47, 1),), ((50, 0), (0, 1))),
+          (((52, 1), (47, 1)), ((50, 2), (54, 3), (0, 1)),
+           ((52, 4), (47, 4), (0, 2)), ((0, 3),), ((50, 2), (0, 4))),
+          (((86, 1),), ((50, 2), (0, 1)), ((86, 3),), ((50, 4), (0, 3)),
+           ((86, 3), (0, 4))),
+          (((52, 1), (47, 1)), ((50, 2), (0, 1)), ((52, 1), (47, 1), (0, 2))),
+          (((4, 1), (164, 2)), ((165, 3),), ((0, 2),), ((59, 2),)),
+          (((166, 1),), ((50, 2), (0, 1)), ((166, 1), (0, 2))),
+          (((39, 1),), ((46, 2), (0, 1)), ((47, 3),), ((0, 3),)),
+          (((4, 1), (8, 2), (10, 3)), ((59, 4), (80, 5)), ((39, 4),),
+           ((167, 6),), ((0, 4),), ((59, 4),), ((62, 4),)),
+          (((31, 1),), ((46, 2),), ((81, 3),), ((168, 4), (169, 5)),
+           ((46, 6),), ((46, 7),), ((81, 8),), ((81, 9),), ((0, 8),),
+           ((122, 10), (168, 4), (169, 5), (0, 9)), ((46, 11),), ((81, 12),),
+           ((168, 4), (0, 12))),
+          (((5, 1), (51, 2), (166, 3)), ((50, 4), (164, 5), (0, 1)),
+           ((164, 6),), ((50, 7), (48, 8), (0, 3)),
+           ((51, 2), (164, 9), (0, 4)), ((50, 4), (0, 5)), ((50, 10), (0, 6)),
+           ((5, 1), (51, 2), (166, 3), (0, 7)), ((47, 11),),
+           ((50, 4), (48, 12), (0, 9)), ((0, 10),), ((50, 7), (0, 11)),
+           ((47, 5),)),
+          (((5, 1), (51, 2), (170, 3)), ((50, 4), (171, 5), (0, 1)),
+           ((171, 6),), ((50, 7), (48, 8), (0, 3)),
+           ((51, 2), (171, 9), (0, 4)), ((50, 4), (0, 5)), ((50, 10), (0, 6)),
+           ((5, 1), (51, 2), (170, 3), (0, 7)), ((47, 11),),
+           ((50, 4), (48, 12), (0, 9)), ((0, 10),), ((50, 7), (0, 11)),
+           ((47, 5),)),
+          (((4, 1), (171, 2)), ((172, 3),), ((0, 2),), ((59, 2),)),
+          (((170, 1),), ((50, 2), (0, 1)), ((170, 1), (0, 2))),
+          (((39, 1),), ((0, 1),)),
+          (((32, 1),), ((47, 2),), ((46, 3),), ((81, 4),), ((122, 5), (0, 4)),
+           ((46, 6),), ((81, 7),), ((0, 7),)),
+          (((47, 1),), ((106, 2), (0, 1)), ((53, 3),), ((0, 3),)),
+          (((33, 1),), ((173, 2),), ((50, 1), (46, 3)), ((81, 4),), ((0, 4),)),
+          (((106, 1),), ((53, 2),), ((0, 2),)),
+          (((174, 1),), ((175, 0), (0, 1))),
+          (((20, 1), (108, 2)), ((47, 2),), ((0, 2),)),
+          (((34, 1),), ((176, 2), (0, 1)), ((0, 2),)),
+          (((61, 1),), ((0, 1),)))
+dfas = ((256, 0,
+         (4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+          23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 1,
+          39, 2, 40, 41)),
+        (257, 1, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (258, 2, (4, 6, 7, 8, 10, 11, 26, 35, 36, 38, 39, 40, 41)),
+        (259, 3, (46,)),
+        (260, 4, (4, 5, 51, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (261, 5, (4, 5, 51, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (262, 6, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (263, 7, (12,)), (264, 8, (37,)), (265, 9, (37,)),
+        (266, 10, (4, 8, 10, 11, 35, 39, 40, 41)),
+        (267, 11, (67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79)),
+        (268, 12, (13,)), (269, 13, (14,)), (270, 14, (19, 37)),
+        (271, 15, (22,)), (272, 16, (19, 22, 37)),
+        (273, 17, (88, 89, 90, 91, 92, 93, 83, 94, 26)),
+        (274, 18, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (275, 19, (9, 14, 16, 19, 22, 31, 32, 33, 37)), (276, 20, (15,)),
+        (277, 21, (9,)), (278, 22, (9,)), (279, 23, (9,)), (280, 24, (17,)),
+        (281, 25, (4, 5, 51, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (282, 26, (39,)), (283, 27, (39,)), (284, 28, (39,)), (285, 29, (39,)),
+        (286, 30, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (287, 31, (109,)), (288, 32, (18,)),
+        (289, 33, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (290, 34, (4, 5, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (291, 35, (4, 5, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (292, 36, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (293, 37, (13, 15, 29, 30, 34)), (294, 38, (19,)), (295, 39, (16,)),
+        (296, 40, (21, 25)), (297, 41, (22,)), (298, 42, (39,)),
+        (299, 43, (39,)), (300, 44, (20,)), (301, 45, (23,)),
+        (302, 46, (20, 23)), (303, 47, (24,)),
+        (304, 48, (4, 5, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (305, 49, (4, 6, 7, 8, 10, 11, 26, 35, 36, 38, 39, 40, 41)),
+        (306, 50, (24,)),
+        (307, 51, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (308, 52, (4, 6, 7, 8, 10, 11, 26, 35, 36, 38, 39, 40, 41)),
+        (309, 53, (4,)), (310, 54, (27,)),
+        (311, 55, (4, 8, 10, 11, 35, 38, 39, 40, 41)), (312, 56, (28,)),
+        (313, 57, (29,)), (314, 58, (30,)),
+        (315, 59, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (316, 60,
+         (4, 5, 6, 7, 8, 10, 11, 12, 13, 15, 17, 18, 20, 21, 23, 24, 25, 26,
+          27, 28, 29, 30, 34, 35, 36, 38, 39, 40, 41)),
+        (317, 61,
+         (4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+          23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39,
+          2, 40, 41)),
+        (318, 62, (46,)),
+        (319, 63,
+         (4, 5, 6, 7, 8, 10, 11, 12, 13, 15, 17, 18, 20, 21, 23, 24, 25, 26,
+          27, 28, 29, 30, 34, 35, 36, 38, 39, 40, 41)),
+        (320, 64, (5,)),
+        (321, 65,
+         (4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+          23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39,
+          40, 41)),
+        (322, 66, (4, 6, 7, 8, 46, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (323, 67, (4, 6, 7, 8, 46, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (324, 68,
+         (4, 5, 6, 7, 8, 10, 11, 12, 13, 15, 17, 18, 20, 21, 23, 24, 25, 26,
+          27, 28, 29, 30, 34, 35, 36, 38, 39, 2, 40, 41)),
+        (325, 69, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (326, 70, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (327, 71, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (328, 72, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (329, 73, (4, 5, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (330, 74, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (331, 75, (4, 5, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (332, 76, (4, 39)), (333, 77, (4, 39)), (334, 78, (39,)),
+        (335, 79, (4, 8, 10)), (336, 80, (31,)), (337, 81, (4, 5, 51, 39)),
+        (338, 82, (4, 5, 51, 39)), (339, 83, (4, 39)), (340, 84, (4, 39)),
+        (341, 85, (39,)), (342, 86, (32,)),
+        (343, 87, (4, 6, 7, 8, 10, 11, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (344, 88, (33,)), (345, 89, (106,)),
+        (346, 90, (4, 6, 7, 8, 10, 11, 35, 36, 38, 39, 40, 41)),
+        (347, 91, (4, 6, 7, 8, 10, 11, 20, 24, 26, 35, 36, 38, 39, 40, 41)),
+        (348, 92, (34,)), (349, 93, (34,)))
+labels = ((0, 'EMPTY'), (0, None), (4, None), (321, None), (7, None),
+          (16, None), (14, None), (15, None), (23, None), (50, None),
+          (9, None), (25, None), (1, 'assert'), (1, 'break'), (1, 'class'),
+          (1, 'continue'), (1, 'def'), (1, 'del'), (1, 'exec'), (1, 'for'),
+          (1, 'from'), (1, 'global'), (1, 'if'), (1, 'import'), (1, 'lambda'),
+          (1, 'nonlocal'), (1, 'not'), (1, 'pass'), (1, 'print'), (1, 'raise'),
+          (1, 'return'), (1, 'try'), (1, 'while'), (1, 'with'), (1, 'yield'),
+          (26, None), (32, None), (57, None), (56, None), (1, None), (2, None),
+          (3, None), (315, None), (19, None), (305, None), (1, 'and'),
+          (11, None), (326, None), (22, None), (261, None), (12, None),
+          (36, None), (320, None), (289, None), (270, None), (325, None),
+          (295, None), (294, None), (344, None), (8, None), (329, None),
+          (348, None), (10, None), (304, None), (328, None), (27, None),
+          (281, None), (41, None), (42, None), (47, None), (39, None),
+          (37, None), (38, None), (49, None), (40, None), (45, None),
+          (46, None), (51, None), (44, None), (43, None), (260, None),
+          (324, None), (291, None), (1, 'in'), (330, None), (272, None),
+          (307, None), (271, None), (29, None), (20, None), (30, None),
+          (28, None), (21, None), (31, None), (1, 'is'), (273, None),
+          (265, None), (269, None), (277, None), (297, None), (336, None),
+          (342, None), (279, None), (264, None), (284, None), (278, None),
+          (1, 'as'), (282, None), (327, None), (1, 'except'), (346, None),
+          (18, None), (331, None), (259, None), (267, None), (311, None),
+          (292, None), (268, None), (276, None), (313, None), (314, None),
+          (349, None), (1, 'else'), (309, None), (55, None), (1, 'elif'),
+          (298, None), (299, None), (283, None), (300, None), (301, None),
+          (338, None), (274, None), (306, None), (308, None), (258, None),
+          (1, 'or'), (337, None), (266, None), (335, None), (35, None),
+          (262, None), (34, None), (319, None), (13, None), (275, None),
+          (316, None), (263, None), (280, None), (288, None), (290, None),
+          (293, None), (296, None), (302, None), (310, None), (312, None),
+          (318, None), (322, None), (5, None), (6, None), (24, None),
+          (17, None), (48, None), (303, None), (334, None), (333, None),
+          (332, None), (323, None), (1, 'finally'), (287, None), (339, None),
+          (341, None), (340, None), (343, None), (257, None), (33, None),
+          (347, None))
+keywords = (('assert', 12), ('break', 13), ('class', 14), ('continue', 15),
+            ('def', 16), ('del', 17), ('exec', 18), ('for', 19), ('from', 20),
+            ('global', 21), ('if', 22), ('import', 23), ('lambda', 24),
+            ('nonlocal', 25), ('not', 26), ('pass', 27), ('print', 28),
+            ('raise', 29), ('return', 30), ('try', 31), ('while', 32),
+            ('with', 33), ('yield', 34), ('and', 45), ('in', 83), ('is', 94),
+            ('as', 106), ('except', 109), ('else', 122), ('elif', 125),
+            ('or', 136), ('finally', 168))
+tokens = ((0, 1), (4, 2), (7, 4), (16, 5), (14, 6), (15, 7), (23, 8), (50, 9),
+          (9, 10), (25, 11), (26, 35), (32, 36), (57, 37), (56, 38), (1, 39),
+          (2, 40), (3, 41), (19, 43), (11, 46), (22, 48), (12, 50), (36, 51),
+          (8, 59), (10, 62), (27, 65), (41, 67), (42, 68), (47, 69), (39, 70),
+          (37, 71), (38, 72), (49, 73), (40, 74), (45, 75), (46, 76), (51, 77),
+          (44, 78), (43, 79), (29, 88), (20, 89), (30, 90), (28, 91), (21, 92),
+          (31, 93), (18, 111), (55, 124), (35, 140), (34, 142), (13, 144),
+          (5, 158), (6, 159), (24, 160), (17, 161), (48, 162), (33, 175))
+symbol2label = (('stmt', 3), ('shift_expr', 42), ('not_test', 44),
+                ('test', 47), ('argument', 49), ('star_expr', 52),
+                ('expr', 53), ('comp_for', 54), ('term', 55), ('funcdef', 56),
+                ('for_stmt', 57), ('with_stmt', 58), ('testlist_gexp', 60),
+                ('yield_expr', 61), ('listmaker', 63), ('testlist1', 64),
+                ('dictsetmaker', 66), ('arglist', 80), ('suite', 81),
+                ('exprlist', 82), ('testlist_safe', 84), ('comp_iter', 85),
+                ('old_test', 86), ('comp_if', 87), ('comp_op', 95),
+                ('async_stmt', 96), ('classdef', 97), ('decorated', 98),
+                ('if_stmt', 99), ('try_stmt', 100), ('while_stmt', 101),
+                ('decorators', 102), ('async_funcdef', 103),
+                ('dotted_name', 104), ('decorator', 105),
+                ('dotted_as_name', 107), ('testlist', 108), ('xor_expr', 110),
+                ('testlist_star_expr', 112), ('annassign', 113),
+                ('augassign', 114), ('power', 115), ('factor', 116),
+                ('break_stmt', 117), ('continue_stmt', 118),
+                ('raise_stmt', 119), ('return_stmt', 120), ('yield_stmt', 121),
+                ('parameters', 123), ('import_as_name', 126),
+                ('import_as_names', 127), ('dotted_as_names', 128),
+                ('import_from', 129), ('import_name', 130),
+                ('varargslist', 131), ('comparison', 132),
+                ('old_lambdef', 133), ('or_test', 134), ('and_test', 135),
+                ('typedargslist', 137), ('atom', 138), ('trailer', 139),
+                ('arith_expr', 141), ('small_stmt', 143),
+                ('compound_stmt', 145), ('simple_stmt', 146),
+                ('assert_stmt', 147), ('del_stmt', 148), ('exec_stmt', 149),
+                ('expr_stmt', 150), ('flow_stmt', 151), ('global_stmt', 152),
+                ('import_stmt', 153), ('pass_stmt', 154), ('print_stmt', 155),
+                ('sliceop', 156), ('subscript', 157), ('lambdef', 163),
+                ('tname', 164), ('tfplist', 165), ('tfpdef', 166),
+                ('subscriptlist', 167), ('except_clause', 169),
+                ('vfpdef', 170), ('vname', 171), ('vfplist', 172),
+                ('with_item', 173), ('and_expr', 174), ('yield_arg', 176))
+start = 256
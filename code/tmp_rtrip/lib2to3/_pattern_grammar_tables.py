@@ -0,0 +1,35 @@
+"""Grammar tables written by Grammar.dump_module(); do not edit.
+
+Rebuild them with python -m lib2to3.pgen2.driver --tables.
+"""
+source_hash = '041737c50fea84e67817c63b81e0d1e336fe2465'
+symbol2number = (('Matcher', 256), ('Alternative', 257), ('Alternatives', 258),
+                 ('Details', 259), ('NegatedUnit', 260), ('Repeater', 261),
+                 ('Unit', 262))
+states = ((((1, 1),), ((2, 2),), ((0, 2),)),
+          (((8, 1), (9, 1)), ((8, 1), (9, 1), (0, 1))),
+          (((10, 1),), ((11, 0), (0, 1))),
+          (((12, 1),), ((1, 2),), ((13, 3),), ((0, 3),)),
+          (((5, 1),), ((3, 2), (6, 3), (7, 4)), ((1, 5),), ((14, 4), (0, 3)),
+           ((0, 4),), ((15, 4),)),
+          (((16, 1), (17, 1), (18, 2)), ((0, 1),), ((19, 3),),
+           ((20, 4), (21, 1)), ((19, 5),), ((21, 1),)),
+          (((3, 1), (4, 2), (6, 3), (7, 4)), ((1, 5),), ((1, 6),),
+           ((22, 7), (14, 4), (23, 8), (0, 3)), ((23, 8), (0, 4)), ((15, 4),),
+           ((24, 8),), ((3, 1), (4, 2), (6, 9), (7, 4)), ((0, 8),),
+           ((14, 4), (23, 8), (0, 9))))
+dfas = ((256, 0, (3, 4, 5, 6, 7)), (257, 1, (3, 4, 5, 6, 7)),
+        (258, 2, (3, 4, 5, 6, 7)), (259, 3, (12,)), (260, 4, (5,)),
+        (261, 5, (16, 17, 18)), (262, 6, (3, 4, 6, 7)))
+labels = ((0, 'EMPTY'), (258, None), (0, None), (7, None), (9, None),
+          (1, 'not'), (1, None), (3, None), (260, None), (262, None),
+          (257, None), (18, None), (20, None), (21, None), (259, None),
+          (8, None), (16, None), (14, None), (26, None), (2, None), (12, None),
+          (27, None), (22, None), (261, None), (10, None))
+keywords = (('not', 5),)
+tokens = ((0, 2), (7, 3), (9, 4), (1, 6), (3, 7), (18, 11), (20, 12), (21, 13),
+          (8, 15), (16, 16), (14, 17), (26, 18), (2, 19), (12, 20), (27, 21),
+          (22, 22), (10, 24))
+symbol2label = (('Alternatives', 1), ('NegatedUnit', 8), ('Unit', 9),
+                ('Alternative', 10), ('Details', 14), ('Repeater', 23))
+start = 256
@@ -58,6 +58,15 @@ class BaseFix(object):
         """
         self.filename = filename
 
+    def cache_key(self, filename):
+        """Return what the output depends on besides the source.
+
+        The refactoring cache adds this to the key of every file.  Fixers
+        that look at anything other than the tree, like the files next to
+        filename, must override this.
+        """
+        return None
+
     def match(self, node):
         """Returns match for a given parse tree node.
 
@@ -68,7 +77,7 @@ class BaseFix(object):
         Subclass may override.
         """
         results = {'node': node}
-        return self.pattern.match(node, results) and results
+        return self.pattern.compile()(node, results) and results
 
     def transform(self, node, results):
         """Returns the transformation for a given parse tree node.
@@ -226,7 +226,7 @@ def in_special_context(node):
     patterns = [p0, p1, p2]
     for pattern, parent in zip(patterns, attr_chain(node, 'parent')):
         results = {}
-        if pattern.match(parent, results) and results['node'] is node:
+        if pattern.compile()(parent, results) and results['node'] is node:
             return True
     return False
 
@@ -78,12 +78,13 @@ class FixDict(fixer_base.BaseFix):
         if node.parent is None:
             return False
         results = {}
-        if node.parent.parent is not None and self.p1.match(node.parent.
-            parent, results) and results['node'] is node:
+        if node.parent.parent is not None and self.p1.compile()(node.
+            parent.parent, results) and results['node'] is node:
             if isiter:
                 return results['func'].value in iter_exempt
             else:
                 return results['func'].value in fixer_util.consuming_calls
         if not isiter:
             return False
-        return self.p2.match(node.parent, results) and results['node'] is node
+        return self.p2.compile()(node.parent, results) and results['node'
+            ] is node
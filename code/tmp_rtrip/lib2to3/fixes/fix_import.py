@@ -10,6 +10,7 @@ Becomes:
     from . import spam
 """
 from .. import fixer_base
+import os
 from os.path import dirname, join, exists, sep
 from ..fixer_util import FromImport, syms, token
 
@@ -35,6 +36,7 @@ def traverse_imports(names):
 
 class FixImport(fixer_base.BaseFix):
     BM_compatible = True
+    LOCAL_EXTENSIONS = '.py', '.pyc', '.so', '.sl', '.pyd'
     PATTERN = """
     import_from< 'from' imp=any 'import' ['('] any [')'] >
     |
@@ -71,6 +73,17 @@ class FixImport(fixer_base.BaseFix):
             new.prefix = node.prefix
             return new
 
+    def cache_key(self, filename):
+        base_path = dirname(filename)
+        try:
+            names = os.listdir(base_path or os.curdir)
+        except OSError:
+            return None
+        if '__init__.py' not in names:
+            return ()
+        return sorted(name for name in names if name.endswith(self.
+            LOCAL_EXTENSIONS) or os.path.isdir(join(base_path, name)))
+
     def probably_a_local_import(self, imp_name):
         if imp_name.startswith('.'):
             return False
@@ -79,7 +92,7 @@ class FixImport(fixer_base.BaseFix):
         base_path = join(base_path, imp_name)
         if not exists(join(dirname(base_path), '__init__.py')):
             return False
-        for ext in ['.py', sep, '.pyc', '.so', '.sl', '.pyd']:
+        for ext in (sep,) + self.LOCAL_EXTENSIONS:
             if exists(base_path + ext):
                 return True
         return False
@@ -54,7 +54,8 @@ class FixXrange(fixer_base.BaseFix):
         if node.parent is None:
             return False
         results = {}
-        if node.parent.parent is not None and self.p1.match(node.parent.
-            parent, results) and results['node'] is node:
+        if node.parent.parent is not None and self.p1.compile()(node.
+            parent.parent, results) and results['node'] is node:
             return results['func'].value in consuming_calls
-        return self.p2.match(node.parent, results) and results['node'] is node
+        return self.p2.compile()(node.parent, results) and results['node'
+            ] is node
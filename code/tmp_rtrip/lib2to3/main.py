@@ -167,6 +167,10 @@ def main(fixer_pkg, args=None):
         '', help=
         "Append this string to all output filenames. Requires -n if non-empty.  ex: --add-suffix='3' will generate .py3 files."
         )
+    parser.add_option('--cache-dir', action='store', type='str', default=
+        '', help=
+        'Keep refactoring results in this directory and reuse them for files that did not change.'
+        )
     refactor_stdin = False
     flags = {}
     options, args = parser.parse_args(args)
@@ -202,6 +206,8 @@ def main(fixer_pkg, args=None):
             return 2
     if options.print_function:
         flags['print_function'] = True
+    if options.cache_dir:
+        flags['cache_dir'] = options.cache_dir
     level = logging.DEBUG if options.verbose else logging.INFO
     logging.basicConfig(format='%(name)s: %(message)s', level=level)
     logger = logging.getLogger('lib2to3.main')
@@ -237,7 +243,7 @@ def main(fixer_pkg, args=None):
         else:
             try:
                 rt.refactor(args, options.write, options.doctests_only,
-                    options.processes)
+                    options.processes, batched=True)
             except refactor.MultiprocessingUnsupported:
                 assert options.processes > 1
                 print("Sorry, -j isn't supported on this platform.", file=
@@ -6,6 +6,7 @@ This provides a high-level interface to parse a file into a syntax tree.
 __author__ = 'Guido van Rossum <guido@python.org>'
 __all__ = ['Driver', 'load_grammar']
 import codecs
+import hashlib
 import io
 import os
 import logging
@@ -26,6 +27,7 @@ class Driver(object):
         """Parse a series of tokens and return the syntax tree."""
         p = parse.Parser(self.grammar, self.convert)
         p.setup()
+        intern = sys.intern
         lineno = 1
         column = 0
         type = value = start = end = line_text = None
@@ -51,6 +53,10 @@ class Driver(object):
                 continue
             if type == token.OP:
                 type = grammar.opmap[value]
+            elif type == token.NAME:
+                value = intern(value)
+            if prefix:
+                prefix = intern(prefix)
             if debug:
                 self.logger.debug('%s %r (prefix=%r)', token.tok_name[type],
                     value, prefix)
@@ -98,11 +104,31 @@ def _generate_pickle_name(gt):
     return head + tail + '.'.join(map(str, sys.version_info)) + '.pickle'
 
 
+def _generate_tables_name(gt):
+    head, tail = os.path.split(gt)
+    name = os.path.splitext(tail)[0]
+    name = ''.join('_' + c.lower() if c.isupper() else c for c in name)
+    return os.path.join(head, '_%s_tables.py' % name.lstrip('_'))
+
+
+def _hash_file(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
 def load_grammar(gt='Grammar.txt', gp=None, save=True, force=False, logger=None
     ):
-    """Load the grammar (maybe from a pickle)."""
+    """Load the grammar (maybe from a pickle).
+
+    If a tables module written by generate_tables() is found next to the
+    grammar file, it is used unless the grammar file has changed since.
+    """
     if logger is None:
         logger = logging.getLogger()
+    if not force:
+        g = _load_tables(gt, logger)
+        if g is not None:
+            return g
     gp = _generate_pickle_name(gt) if gp is None else gp
     if force or not _newer(gp, gt):
         logger.info('Generating grammar tables from %s', gt)
@@ -119,6 +145,33 @@ def load_grammar(gt='Grammar.txt', gp=None, save=True, force=False, logger=None
     return g
 
 
+def _load_tables(gt, logger):
+    tables = _generate_tables_name(gt)
+    if not os.path.exists(tables):
+        return None
+    g = grammar.Grammar()
+    try:
+        source_hash = g.load_module(tables)
+    except (OSError, SyntaxError, KeyError, ValueError) as e:
+        logger.info('Loading %s failed: %s', tables, e)
+        return None
+    if os.path.exists(gt) and _hash_file(gt) != source_hash:
+        logger.info('%s is out of date', tables)
+        return None
+    return g
+
+
+def generate_tables(gt, logger=None):
+    """Generate the grammar tables module for the grammar file gt."""
+    if logger is None:
+        logger = logging.getLogger()
+    tables = _generate_tables_name(gt)
+    logger.info('Writing grammar tables for %s to %s', gt, tables)
+    g = pgen.generate_grammar(gt)
+    g.dump_module(tables, _hash_file(gt))
+    return tables
+
+
 def _newer(a, b):
     """Inquire whether file a was written since file b."""
     if not os.path.exists(a):
@@ -132,11 +185,17 @@ def main(*args):
     """Main program, when run as a script: produce grammar pickle files.
 
     Calls load_grammar for each argument, a path to a grammar text file.
+    With --tables as the first argument, it writes grammar tables modules
+    instead.
     """
     if not args:
         args = sys.argv[1:]
     logging.basicConfig(level=logging.INFO, stream=sys.stdout, format=
         '%(message)s')
+    if args and args[0] == '--tables':
+        for gt in args[1:]:
+            generate_tables(gt)
+        return True
     for gt in args:
         load_grammar(gt, save=True, force=True)
     return True
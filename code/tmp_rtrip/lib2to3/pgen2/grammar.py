@@ -9,7 +9,9 @@ fallback token code OP, but the parser needs the actual token code.
 
 """
 import collections
+import importlib.machinery
 import pickle
+import pprint
 from . import token, tokenize
 
 
@@ -101,6 +103,61 @@ class Grammar(object):
             d = pickle.load(f)
         self.__dict__.update(d)
 
+    def dump_module(self, filename, source_hash=None):
+        """Dump the grammar tables to a Python module.
+
+        Unlike a pickle, the module does not depend on the Python version.
+        Its tables are tuples of ints and strings, which are constants
+        cached in the module's byte code, so load_module() costs little
+        more than an import.  The dfas refer to their DFA by its index in
+        states.
+        """
+        index = {id(states): i for i, states in enumerate(self.states)}
+        states = tuple(tuple(tuple(arcs) for arcs in dfa) for dfa in self.
+            states)
+        tables = [('symbol2number', tuple(sorted(self.symbol2number.items(),
+            key=lambda item: item[1]))), ('states', states), ('dfas',
+            tuple((number, index[id(dfa)], tuple(first)) for number, (dfa,
+            first) in sorted(self.dfas.items()))), ('labels', tuple(self.
+            labels)), ('keywords', tuple(self.keywords.items())), ('tokens',
+            tuple(self.tokens.items())), ('symbol2label', tuple(self.
+            symbol2label.items())), ('start', self.start)]
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('"""Grammar tables written by Grammar.dump_module(); do not edit.\n\n'
+                )
+            f.write('Rebuild them with python -m lib2to3.pgen2.driver --tables.\n'
+                )
+            f.write('"""\n')
+            f.write('source_hash = %r\n' % (source_hash,))
+            for name, value in tables:
+                indent = len(name) + 3
+                text = pprint.pformat(value, width=79 - indent, compact=True)
+                f.write('%s = %s\n' % (name, text.replace('\n', '\n' + ' ' *
+                    indent)))
+
+    def load_module(self, filename):
+        """Load the grammar tables from a module written by dump_module().
+
+        Returns the source_hash the module was written with.
+        """
+        loader = importlib.machinery.SourceFileLoader('_grammar_tables',
+            filename)
+        code = loader.get_code(loader.name)
+        d = {}
+        exec(code, d)
+        self.symbol2number = dict(d['symbol2number'])
+        self.number2symbol = {number: name for name, number in d[
+            'symbol2number']}
+        self.states = [list(map(list, dfa)) for dfa in d['states']]
+        self.dfas = {number: (self.states[i], dict.fromkeys(first, 1)) for
+            number, i, first in d['dfas']}
+        self.labels = list(d['labels'])
+        self.keywords = dict(d['keywords'])
+        self.tokens = dict(d['tokens'])
+        self.symbol2label = dict(d['symbol2label'])
+        self.start = d['start']
+        return d['source_hash']
+
     def copy(self):
         """
         Copy the grammar.
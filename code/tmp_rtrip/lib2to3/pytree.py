@@ -32,12 +32,14 @@ class Base(object):
     template pattern.
 
     A node may be a subnode of at most one parent.
+
+    Parse trees of large code bases hold millions of nodes, so the node
+    classes use __slots__.  The __dict__ slot is only filled in when other
+    attributes, such as used_names on the root node, are set.
     """
-    type = None
-    parent = None
+    __slots__ = ('type', 'parent', 'fixers_applied', 'was_changed',
+        'was_checked', '__dict__')
     children = ()
-    was_changed = False
-    was_checked = False
 
     def __new__(cls, *args, **kwds):
         """Constructor that prevents Base from being instantiated."""
@@ -195,6 +197,7 @@ class Base(object):
 
 class Node(Base):
     """Concrete implementation for interior nodes."""
+    __slots__ = 'children',
 
     def __init__(self, type, children, context=None, prefix=None,
         fixers_applied=None):
@@ -208,6 +211,9 @@ class Node(Base):
         """
         assert type >= 256, type
         self.type = type
+        self.parent = None
+        self.was_changed = False
+        self.was_checked = False
         self.children = list(children)
         for ch in self.children:
             assert ch.parent is None, repr(ch)
@@ -299,9 +305,7 @@ class Node(Base):
 
 class Leaf(Base):
     """Concrete implementation for leaf nodes."""
-    _prefix = ''
-    lineno = 0
-    column = 0
+    __slots__ = 'value', '_prefix', 'lineno', 'column'
 
     def __init__(self, type, value, context=None, prefix=None,
         fixers_applied=[]):
@@ -314,11 +318,20 @@ class Leaf(Base):
         assert 0 <= type < 256, type
         if context is not None:
             self._prefix, (self.lineno, self.column) = context
+        else:
+            self._prefix = ''
+            self.lineno = self.column = 0
         self.type = type
         self.value = value
+        self.parent = None
+        self.was_changed = False
+        self.was_checked = False
         if prefix is not None:
             self._prefix = prefix
-        self.fixers_applied = fixers_applied[:]
+        if fixers_applied:
+            self.fixers_applied = fixers_applied[:]
+        else:
+            self.fixers_applied = None
 
     def __repr__(self):
         """Return a canonical string representation."""
@@ -400,6 +413,7 @@ class BasePattern(object):
     type = None
     content = None
     name = None
+    _compiled = None
 
     def __new__(cls, *args, **kwds):
         """Constructor that prevents BasePattern from being instantiated."""
@@ -465,6 +479,73 @@ class BasePattern(object):
         if nodes and self.match(nodes[0], r):
             yield 1, r
 
+    def compile(self):
+        """
+        Return a function that does the same as match(), only faster.
+
+        The pattern is turned into nested closures once.  Matching with
+        them builds no generators and no intermediate results dicts, and
+        backtracks through plain calls.  The function is cached, so the
+        pattern must not be changed after it is compiled.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile_match()
+        return self._compiled
+
+    def _head_types(self):
+        """
+        Return the set of types of the first node of any match, or None.
+
+        None means that the type is not known or that the pattern can
+        match an empty sequence.
+        """
+        if self.type is None:
+            return None
+        return {self.type}
+
+    def _compile_match(self):
+        test = self._compile_test()
+
+        def match(node, results=None):
+            try:
+                binds = test(node, None)
+            except RecursionError:
+                return self.match(node, results)
+            if binds is _FAIL:
+                return False
+            if results is not None:
+                _update_results(results, binds)
+            return True
+        return match
+
+    def _compile_test(self):
+        """
+        Return a function test(node, binds) matching a single node.
+
+        It returns binds extended with the named submatches, or _FAIL.
+        binds is a linked list of (name, value, binds) tuples, so that
+        backtracking only has to drop a reference.
+        """
+        raise NotImplementedError
+
+    def _compile_seq(self):
+        """
+        Return a function m(nodes, i, binds, k) matching at nodes[i:].
+
+        For each way the pattern matches nodes[i:j], in the order of
+        generate_matches(), m calls k(j, binds) until that returns True.
+        m returns whether it did.
+        """
+        test = self._compile_test()
+
+        def m(nodes, i, binds, k):
+            if i < len(nodes):
+                binds = test(nodes[i], binds)
+                if binds is not _FAIL:
+                    return k(i + 1, binds)
+            return False
+        return m
+
 
 class LeafPattern(BasePattern):
 
@@ -509,6 +590,21 @@ class LeafPattern(BasePattern):
         """
         return self.content == node.value
 
+    def _compile_test(self):
+        type, content, name = self.type, self.content, self.name
+
+        def test(node, binds):
+            if not isinstance(node, Leaf):
+                return _FAIL
+            if type is not None and node.type != type:
+                return _FAIL
+            if content is not None and content != node.value:
+                return _FAIL
+            if name:
+                return name, node, binds
+            return binds
+        return test
+
 
 class NodePattern(BasePattern):
     wildcards = False
@@ -569,6 +665,55 @@ class NodePattern(BasePattern):
                 return False
         return True
 
+    def _compile_test(self):
+        type, name = self.type, self.name
+        if self.content is None:
+
+            def test(node, binds):
+                if type is not None and node.type != type:
+                    return _FAIL
+                if name:
+                    return name, node, binds
+                return binds
+            return test
+        if self.wildcards:
+            seq = _compile_sequence(self.content)
+
+            def submatch(children, binds):
+                found = []
+
+                def end(j, binds):
+                    if j == len(children):
+                        found.append(binds)
+                        return True
+                    return False
+                if seq(children, 0, binds, end):
+                    return found[0]
+                return _FAIL
+        else:
+            tests = [p._compile_test() for p in self.content]
+            count = len(tests)
+
+            def submatch(children, binds):
+                if len(children) != count:
+                    return _FAIL
+                for test, child in zip(tests, children):
+                    binds = test(child, binds)
+                    if binds is _FAIL:
+                        return _FAIL
+                return binds
+
+        def test(node, binds):
+            if type is not None and node.type != type:
+                return _FAIL
+            binds = submatch(node.children, binds)
+            if binds is _FAIL:
+                return _FAIL
+            if name:
+                return name, node, binds
+            return binds
+        return test
+
 
 class WildcardPattern(BasePattern):
     """
@@ -742,6 +887,117 @@ class WildcardPattern(BasePattern):
                         r.update(r1)
                         yield c0 + c1, r
 
+    def _head_types(self):
+        if self.content is None or self.min == 0 or self.name == 'bare_name':
+            return None
+        types = set()
+        for alt in self.content:
+            heads = alt[0]._head_types()
+            if heads is None:
+                return None
+            types |= heads
+        return types
+
+    def _compile_match(self):
+        seq = self._compile_seq()
+        name = self.name
+        heads = self._head_types()
+
+        def end(j, binds):
+            return j == 1 and (binds,)
+
+        def match(node, results=None):
+            if heads is not None and node.type not in heads:
+                return False
+            try:
+                found = seq([node], 0, None, end)
+            except RecursionError:
+                return self.match(node, results)
+            if found is False:
+                return False
+            if results is not None:
+                _update_results(results, found[0])
+                if name:
+                    results[name] = [node]
+            return True
+        return match
+
+    def _compile_test(self):
+        seq = self._compile_seq()
+
+        def end(j, binds):
+            return j == 1 and (binds,)
+
+        def test(node, binds):
+            found = seq([node], 0, binds, end)
+            if found is False:
+                return _FAIL
+            return found[0]
+        return test
+
+    def _compile_seq(self):
+        low, high, name = self.min, self.max, self.name
+        if self.content is None:
+
+            def m(nodes, i, binds, k):
+                for j in range(i + low, 1 + i + min(len(nodes) - i, high)):
+                    if name:
+                        r = k(j, (name, nodes[i:j], binds))
+                    else:
+                        r = k(j, binds)
+                    if r:
+                        return r
+                return False
+            return m
+        if name == 'bare_name':
+            tests = [alt[0]._compile_test() for alt in self.content]
+
+            def m(nodes, i, binds, k):
+                j = i
+                while j < len(nodes):
+                    for test in tests:
+                        found = test(nodes[j], binds)
+                        if found is not _FAIL:
+                            binds = found
+                            j += 1
+                            break
+                    else:
+                        break
+                return k(j, (name, nodes[i:j], binds))
+            return m
+        alts = []
+        for alt in self.content:
+            alts.append((alt[0]._head_types(), _compile_sequence(alt)))
+        anywhere = [m for heads, m in alts if heads is None]
+        by_type = {}
+        for heads, m in alts:
+            for type in heads or ():
+                by_type[type] = [m for h, m in alts if h is None or type in h]
+
+        def m(nodes, i, binds, k):
+
+            def repeat(j, binds, count):
+                if count >= low:
+                    if name:
+                        r = k(j, (name, nodes[i:j], binds))
+                    else:
+                        r = k(j, binds)
+                    if r:
+                        return r
+                if count < high:
+                    if j < len(nodes):
+                        candidates = by_type.get(nodes[j].type, anywhere)
+                    else:
+                        candidates = anywhere
+                    for alt in candidates:
+                        r = alt(nodes, j, binds, lambda j, binds: repeat(j,
+                            binds, count + 1))
+                        if r:
+                            return r
+                return False
+            return repeat(i, binds, 0)
+        return m
+
 
 class NegatedPattern(BasePattern):
 
@@ -773,6 +1029,26 @@ class NegatedPattern(BasePattern):
                 return
             yield 0, {}
 
+    def _compile_match(self):
+        return lambda node, results=None: False
+
+    def _compile_test(self):
+        return lambda node, binds: _FAIL
+
+    def _compile_seq(self):
+        if self.content is None:
+
+            def m(nodes, i, binds, k):
+                return i == len(nodes) and k(i, binds)
+            return m
+        seq = self.content._compile_seq()
+
+        def m(nodes, i, binds, k):
+            if seq(nodes, i, None, _any_match):
+                return False
+            return k(i, binds)
+        return m
+
 
 def generate_matches(patterns, nodes):
     """
@@ -800,3 +1076,35 @@ def generate_matches(patterns, nodes):
                     r.update(r0)
                     r.update(r1)
                     yield c0 + c1, r
+
+
+_FAIL = object()
+
+
+def _any_match(j, binds):
+    return True
+
+
+def _update_results(results, binds):
+    """Add the named submatches in binds to results, in match order."""
+    items = []
+    while binds is not None:
+        name, value, binds = binds
+        items.append((name, value))
+    for name, value in reversed(items):
+        results[name] = value
+
+
+def _compile_sequence(patterns):
+    """Compile a sequence of patterns, see BasePattern._compile_seq()."""
+    if not patterns:
+        return lambda nodes, i, binds, k: k(i, binds)
+    first = patterns[0]._compile_seq()
+    if len(patterns) == 1:
+        return first
+    rest = _compile_sequence(patterns[1:])
+
+    def m(nodes, i, binds, k):
+        return first(nodes, i, binds, lambda j, binds: rest(nodes, j, binds, k)
+            )
+    return m
@@ -10,9 +10,14 @@ import sys
 import logging
 import operator
 import collections
+import difflib
+import hashlib
 import io
+import json
+import pickle
 from itertools import chain
 from .pgen2 import driver, tokenize, token
+from .pgen2 import grammar as _grammar
 from .fixer_util import find_root
 from . import pytree, pygram
 from . import btm_matcher as bm
@@ -154,9 +159,67 @@ class FixerError(Exception):
     """A fixer could not be loaded."""
 
 
+class RefactoringCache(object):
+    """A directory of refactoring results.
+
+    Results are stored under a key computed by the refactoring tool from the
+    input text, the fixers, the options and the grammar.  Inputs that no
+    fixer changed are recorded too, so that a re-run over an unchanged tree
+    does not have to parse a single file.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the (output, messages) stored under key, or None.
+
+        output is None if the input was left unchanged.
+        """
+        try:
+            with open(os.path.join(self.directory, key), 'r', encoding='ascii'
+                ) as f:
+                entry = json.load(f)
+            result = entry['output'], entry['messages']
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key, output, messages):
+        """Store the result of refactoring under key."""
+        path = os.path.join(self.directory, key)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'w', encoding='ascii') as f:
+                json.dump({'output': output, 'messages': messages}, f)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every entry."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
 class RefactoringTool(object):
-    _default_options = {'print_function': False, 'write_unchanged_files': False
-        }
+    _default_options = {'print_function': False, 'write_unchanged_files':
+        False, 'cache_dir': None}
     CLASS_PREFIX = 'Fix'
     FILE_PREFIX = 'fix_'
 
@@ -198,6 +261,10 @@ class RefactoringTool(object):
                 self.bmi_post_order.append(fixer)
         self.bmi_pre_order_heads = _get_headnode_dict(self.bmi_pre_order)
         self.bmi_post_order_heads = _get_headnode_dict(self.bmi_post_order)
+        self.cache = None
+        if self.options['cache_dir']:
+            self.cache = RefactoringCache(self.options['cache_dir'])
+            self._cache_salt = self._get_cache_salt()
 
     def get_fixers(self):
         """Inspects the options to load the requested patterns and handlers.
@@ -238,6 +305,44 @@ class RefactoringTool(object):
         post_order_fixers.sort(key=key_func)
         return pre_order_fixers, post_order_fixers
 
+    def _get_cache_salt(self):
+        """Hash everything besides the input that decides the output."""
+        h = hashlib.sha1()
+        h.update(repr(sys.version_info).encode('ascii'))
+        tables = _grammar._make_deterministic(self.grammar.__dict__)
+        h.update(pickle.dumps(tables, 2))
+        modules = {__name__, pytree.__name__, find_root.__module__}
+        for fixer in chain(self.pre_order, self.post_order):
+            cls = fixer.__class__
+            h.update(('%s.%s\0' % (cls.__module__, cls.__qualname__)).encode(
+                'utf-8'))
+            modules.update(base.__module__ for base in cls.__mro__)
+        for name in sorted(modules):
+            h.update(name.encode('utf-8') + b'\0')
+            filename = getattr(sys.modules.get(name), '__file__', None)
+            if filename:
+                try:
+                    with open(filename, 'rb') as fp:
+                        h.update(hashlib.sha1(fp.read()).digest())
+                except OSError:
+                    pass
+        options = sorted((k, v) for k, v in self.options.items() if k !=
+            'cache_dir')
+        h.update(repr(options).encode('utf-8', 'backslashreplace'))
+        return h.digest()
+
+    def _cache_key(self, input, filename, doctests_only):
+        h = hashlib.sha1(self._cache_salt)
+        h.update(b'd' if doctests_only else b'f')
+        filename = os.path.abspath(filename)
+        h.update(filename.encode('utf-8', 'surrogateescape') + b'\0')
+        for fixer in chain(self.pre_order, self.post_order):
+            extra = fixer.cache_key(filename)
+            if extra is not None:
+                h.update(repr(extra).encode('utf-8', 'surrogateescape'))
+        h.update(input.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
     def log_error(self, msg, *args, **kwds):
         """Called when an error occurs."""
         raise
@@ -307,20 +412,59 @@ class RefactoringTool(object):
         if input is None:
             return
         input += '\n'
+        output = self._refactor_input(input, filename, doctests_only)
+        self._processed_output(output, input, filename, write, doctests_only,
+            encoding)
+
+    def _refactor_input(self, input, filename, doctests_only):
+        """Refactor the text of a file, using the cache if there is one.
+
+        Returns the new text, or None if it is unchanged.
+        """
+        key = entry = None
+        if self.cache is not None:
+            key = self._cache_key(input, filename, doctests_only)
+            entry = self.cache.get(key)
+        if entry is not None:
+            self.log_debug('Using cached result for %s', filename)
+            output, messages = entry
+            self.fixer_log.extend(messages)
+            return output
+        start = len(self.fixer_log)
         if doctests_only:
             self.log_debug('Refactoring doctests in %s', filename)
             output = self.refactor_docstring(input, filename)
-            if self.write_unchanged_files or output != input:
+            if output == input:
+                output = None
+        else:
+            tree = self.refactor_string(input, filename)
+            if tree is None:
+                key = None
+                output = None
+            elif tree.was_changed:
+                output = str(tree)[:-1]
+            else:
+                output = None
+        if key is not None:
+            self.cache.put(key, output, self.fixer_log[start:])
+        return output
+
+    def _processed_output(self, output, input, filename, write,
+        doctests_only, encoding):
+        if doctests_only:
+            if self.write_unchanged_files or output is not None:
+                if output is None:
+                    output = input
                 self.processed_file(output, filename, input, write, encoding)
             else:
                 self.log_debug('No doctest changes in %s', filename)
+        elif self.write_unchanged_files or output is not None:
+            if output is None:
+                output = input[:-1]
+            self.processed_file(output, filename, write=write, encoding=
+                encoding)
         else:
-            tree = self.refactor_string(input, filename)
-            if self.write_unchanged_files or tree and tree.was_changed:
-                self.processed_file(str(tree)[:-1], filename, write=write,
-                    encoding=encoding)
-            else:
-                self.log_debug('No changes in %s', filename)
+            self.log_debug('No changes in %s', filename)
 
     def refactor_string(self, data, name):
         """Refactor a given input string.
@@ -578,6 +722,9 @@ class RefactoringTool(object):
                 self.log_message('There were %d errors:', len(self.errors))
             for msg, args, kwds in self.errors:
                 self.log_message(msg, *args, **kwds)
+        if self.cache is not None:
+            self.log_message('Refactoring cache: %d hits, %d misses', self.
+                cache.hits, self.cache.misses)
 
     def parse_block(self, block, lineno, indent):
         """Parses a block into a tree.
@@ -622,15 +769,86 @@ class MultiprocessingUnsupported(Exception):
     pass
 
 
+def _text_delta(old, new):
+    """Return the line edits that turn old into new."""
+    a = old.splitlines(True)
+    b = new.splitlines(True)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [(i1, i2, b[j1:j2]) for tag, i1, i2, j1, j2 in matcher.
+        get_opcodes() if tag != 'equal']
+
+
+def _apply_delta(old, delta):
+    """Apply the line edits returned by _text_delta() to old."""
+    lines = old.splitlines(True)
+    for i1, i2, new in reversed(delta):
+        lines[i1:i2] = new
+    return ''.join(lines)
+
+
+def _size_batches(filenames, count):
+    """Split filenames into about count batches of similar total size.
+
+    The largest files come first, so that they do not end up holding up
+    the last worker.
+    """
+    sized = []
+    for filename in filenames:
+        try:
+            size = os.path.getsize(filename)
+        except OSError:
+            size = 0
+        sized.append((size, filename))
+    sized.sort(key=operator.itemgetter(0), reverse=True)
+    target = sum(size for size, filename in sized) / max(count, 1)
+    batches = []
+    batch = []
+    batch_size = 0
+    for size, filename in sized:
+        batch.append(filename)
+        batch_size += size
+        if batch_size >= target:
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+_pool_tool = None
+
+
+def _pool_init(tool):
+    global _pool_tool
+    _pool_tool = tool
+
+
+def _pool_refactor(task):
+    doctests_only, filenames = task
+    return [_pool_tool._refactor_remote(filename, doctests_only) for
+        filename in filenames]
+
+
 class MultiprocessRefactoringTool(RefactoringTool):
+    BATCHES_PER_PROCESS = 4
 
     def __init__(self, *args, **kwargs):
         super(MultiprocessRefactoringTool, self).__init__(*args, **kwargs)
         self.queue = None
         self.output_lock = None
+        self._pending = None
 
     def refactor(self, items, write=False, doctests_only=False, num_processes=1
-        ):
+        , batched=False):
+        """Refactor a list of files and directories.
+
+        With batched true, the files are collected first and handed out in
+        batches of similar total size to a pool of worker processes, which
+        keep their fixers for the whole run.  The workers only send back
+        line edits of the files they changed; printing and writing is done
+        in this process.
+        """
         if num_processes == 1:
             return super(MultiprocessRefactoringTool, self).refactor(items,
                 write, doctests_only)
@@ -638,8 +856,19 @@ class MultiprocessRefactoringTool(RefactoringTool):
             import multiprocessing
         except ImportError:
             raise MultiprocessingUnsupported
-        if self.queue is not None:
+        if self.queue is not None or self._pending is not None:
             raise RuntimeError('already doing multiple processes')
+        if batched:
+            self._pending = []
+            try:
+                super(MultiprocessRefactoringTool, self).refactor(items,
+                    write, doctests_only)
+                filenames = self._pending
+            finally:
+                self._pending = None
+            self._refactor_batched(multiprocessing, filenames, write,
+                doctests_only, num_processes)
+            return
         self.queue = multiprocessing.JoinableQueue()
         self.output_lock = multiprocessing.Lock()
         processes = [multiprocessing.Process(target=self._child) for i in
@@ -658,6 +887,58 @@ class MultiprocessRefactoringTool(RefactoringTool):
                     p.join()
             self.queue = None
 
+    def _refactor_batched(self, multiprocessing, filenames, write,
+        doctests_only, num_processes):
+        batches = _size_batches(filenames, num_processes * self.
+            BATCHES_PER_PROCESS)
+        tasks = [(doctests_only, batch) for batch in batches]
+        with multiprocessing.Pool(num_processes, _pool_init, (self,)) as pool:
+            for results in pool.imap_unordered(_pool_refactor, tasks):
+                for result in results:
+                    self._finish_remote(result, write, doctests_only)
+
+    def _refactor_remote(self, filename, doctests_only):
+        """Refactor a file in a worker process.
+
+        Returns what _finish_remote() needs to complete the job in the main
+        process.
+        """
+        del self.fixer_log[:]
+        del self.errors[:]
+        hits = misses = 0
+        if self.cache is not None:
+            hits, misses = self.cache.hits, self.cache.misses
+        delta = None
+        input = self._read_python_source(filename)[0]
+        if input is not None:
+            input += '\n'
+            output = self._refactor_input(input, filename, doctests_only)
+            if output is not None:
+                delta = _text_delta(input, output)
+        if self.cache is not None:
+            hits, misses = self.cache.hits - hits, self.cache.misses - misses
+        errors = [((msg % args if args else msg), (), {}) for msg, args,
+            kwds in self.errors]
+        return filename, delta, list(self.fixer_log), errors, hits, misses
+
+    def _finish_remote(self, result, write, doctests_only):
+        filename, delta, messages, errors, hits, misses = result
+        self.fixer_log.extend(messages)
+        self.errors.extend(errors)
+        if self.cache is not None:
+            self.cache.hits += hits
+            self.cache.misses += misses
+        if delta is None and not self.write_unchanged_files:
+            self.log_debug('No changes in %s', filename)
+            return
+        input, encoding = self._read_python_source(filename)
+        if input is None:
+            return
+        input += '\n'
+        output = None if delta is None else _apply_delta(input, delta)
+        self._processed_output(output, input, filename, write,
+            doctests_only, encoding)
+
     def _child(self):
         task = self.queue.get()
         while task is not None:
@@ -670,7 +951,9 @@ class MultiprocessRefactoringTool(RefactoringTool):
             task = self.queue.get()
 
     def refactor_file(self, *args, **kwargs):
-        if self.queue is not None:
+        if self._pending is not None:
+            self._pending.append(args[0])
+        elif self.queue is not None:
             self.queue.put((args, kwargs))
         else:
             return super(MultiprocessRefactoringTool, self).refactor_file(*
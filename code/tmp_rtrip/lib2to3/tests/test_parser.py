@@ -16,8 +16,10 @@ import tempfile
 import unittest
 import warnings
 from lib2to3.pgen2 import driver as pgen2_driver
+from lib2to3.pgen2 import grammar as pgen2_grammar
 from lib2to3.pgen2 import tokenize
 from ..pgen2.parse import ParseError
+from lib2to3 import pygram
 from lib2to3.pygram import python_symbols as syms
 
 
@@ -29,6 +31,13 @@ class TestDriver(support.TestCase):
         self.assertEqual(t.children[0].children[0].type, syms.print_stmt)
         self.assertEqual(t.children[1].children[0].type, syms.print_stmt)
 
+    def test_interned_names(self):
+        t = driver.parse_string('foo = 1\nfoo.bar = foo\n')
+        names = [leaf.value for leaf in t.leaves() if leaf.value == 'foo']
+        self.assertEqual(len(names), 3)
+        self.assertIs(names[0], names[1])
+        self.assertIs(names[0], names[2])
+
 
 class TestPgen2Caching(support.TestCase):
 
@@ -49,6 +58,37 @@ class TestPgen2Caching(support.TestCase):
         finally:
             shutil.rmtree(tmpdir)
 
+    def test_load_grammar_from_tables(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        grammar_file = os.path.join(tmpdir, 'SimpleGrammar.txt')
+        with open(grammar_file, 'w') as f:
+            f.write('file_input: (NAME | NEWLINE)* ENDMARKER\n')
+        tables = pgen2_driver.generate_tables(grammar_file)
+        self.assertEqual(os.path.basename(tables),
+            '_simple_grammar_tables.py')
+        g = pgen2_driver.load_grammar(grammar_file, save=False)
+        self.assertEqual(g.symbol2number, {'file_input': 256})
+        os.unlink(grammar_file)
+        g2 = pgen2_driver.load_grammar(grammar_file, save=False)
+        self.assertEqual(g2.__dict__, g.__dict__)
+        with open(grammar_file, 'w') as f:
+            f.write('file_input: NAME* ENDMARKER\n')
+        g3 = pgen2_driver.load_grammar(grammar_file, save=False)
+        self.assertNotEqual(g3.labels, g.labels)
+
+    def test_dump_module(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        filename = os.path.join(tmpdir, 'tables.py')
+        for g in (pygram.python_grammar, pygram.pattern_grammar):
+            g.dump_module(filename, 'hash')
+            g2 = pgen2_grammar.Grammar()
+            self.assertEqual(g2.load_module(filename), 'hash')
+            self.assertEqual(g2.__dict__, g.__dict__)
+            for number, (states, first) in g2.dfas.items():
+                self.assertIn(states, g2.states)
+
     @unittest.skipIf(sys.executable is None, 'sys.executable required')
     def test_load_grammar_from_subprocess(self):
         tmpdir = tempfile.mkdtemp()
@@ -319,6 +319,19 @@ class TestNodes(support.TestCase):
         self.assertEqual(l1.prev_sibling, None)
         self.assertEqual(p1.prev_sibling, None)
 
+    def test_slots(self):
+        l1 = pytree.Leaf(100, 'foo')
+        n1 = pytree.Node(1000, [l1])
+        self.assertEqual(l1.__dict__, {})
+        self.assertEqual(n1.__dict__, {})
+        self.assertIsNone(l1.fixers_applied)
+        self.assertIsNone(n1.fixers_applied)
+        self.assertEqual((l1.lineno, l1.column), (0, 0))
+        n1.used_names = {'foo'}
+        self.assertEqual(n1.used_names, {'foo'})
+        l2 = pytree.Leaf(100, 'bar', fixers_applied=['fix'])
+        self.assertEqual(l2.clone().fixers_applied, ['fix'])
+
 
 class TestPatterns(support.TestCase):
     """Unit tests for tree matching patterns."""
@@ -383,6 +396,33 @@ class TestPatterns(support.TestCase):
         self.assertIs(r['pl'], l3)
         r = {}
 
+    def test_compile(self):
+        l1 = pytree.Leaf(100, 'foo')
+        l2 = pytree.Leaf(100, 'bar')
+        l3 = pytree.Leaf(100, 'foo')
+        n1 = pytree.Node(1000, [l1, l2])
+        n2 = pytree.Node(1000, [l3])
+        root = pytree.Node(1000, [n1, n2])
+        pl = pytree.LeafPattern(100, 'foo', name='pl')
+        pn = pytree.NodePattern(1000, [pl], name='pn')
+        pw = pytree.WildcardPattern([[pn], [pl, pl]], name='pw')
+        pr = pytree.NodePattern(1000, [pytree.WildcardPattern(name='a'),
+            pytree.WildcardPattern([[pn]], min=1, name='b')], name='pr')
+        pa = pytree.NodePattern(1000, [pytree.NegatedPattern(pl), pytree.
+            WildcardPattern(name='c')])
+        for pattern in (pl, pn, pw, pr, pa):
+            match = pattern.compile()
+            self.assertIs(pattern.compile(), match)
+            for node in (root, n1, n2, l1, l2):
+                r1 = {}
+                r2 = {}
+                self.assertEqual(match(node, r2), pattern.match(node, r1))
+                self.assertEqual(r2, r1)
+        r = {}
+        self.assertTrue(pr.compile()(root, r))
+        self.assertEqual(r, {'pr': root, 'a': [n1], 'b': [n2], 'pn': n2,
+            'pl': l3})
+
     def test_generate_matches(self):
         la = pytree.Leaf(1, 'a')
         lb = pytree.Leaf(1, 'b')
@@ -9,6 +9,7 @@ import re
 import tempfile
 import shutil
 import unittest
+from unittest import mock
 from lib2to3 import refactor, pygram, fixer_base
 from lib2to3.pgen2 import token
 TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
@@ -213,6 +214,103 @@ class TestRefactoringTool(unittest.TestCase):
         else:
             self.fail('%r not matched in %r' % (message_regex, debug_messages))
 
+    def test_refactor_file_cache(self):
+        cache_dir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, cache_dir)
+        test_file = os.path.join(FIXER_DIR, 'parrot_example.py')
+        options = {'cache_dir': cache_dir}
+        new_contents = self.check_file_refactoring(test_file,
+            _DEFAULT_FIXERS, options)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        tmpdir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, tmpdir)
+        shutil.copy(test_file, tmpdir)
+        test_file = os.path.join(tmpdir, os.path.basename(test_file))
+        rt = self.rt(options)
+        rt.refactor_file(test_file)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (0, 1))
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        rt = self.rt(options)
+        rt.refactor_file(test_file, True)
+        with open(test_file, 'rb') as fp:
+            self.assertEqual(fp.read(), new_contents)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (1, 0))
+        rt.refactor_file(test_file, True)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (1, 1))
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
+        rt.refactor_file(test_file, True)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (2, 1))
+        self.assertEqual(rt.files, [test_file])
+        rt = self.rt(options, fixers=['myfixes.fix_first'])
+        rt.refactor_file(test_file)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (0, 1))
+
+    def test_refactor_file_cache_siblings(self):
+        cache_dir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, cache_dir)
+        tmpdir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, tmpdir)
+        test_file = os.path.join(tmpdir, 'eggs.py')
+        for name, source in (('__init__.py', ''), ('eggs.py', 'import spam\n')
+            ):
+            with open(os.path.join(tmpdir, name), 'w') as fp:
+                fp.write(source)
+        fixers = ['lib2to3.fixes.fix_import']
+        rt = self.rt({'cache_dir': cache_dir}, fixers)
+        rt.refactor_file(test_file)
+        self.assertEqual(rt.files, [])
+        with open(os.path.join(tmpdir, 'spam.py'), 'w') as fp:
+            fp.write('')
+        rt = self.rt({'cache_dir': cache_dir}, fixers)
+        rt.refactor_file(test_file, True)
+        self.assertEqual((rt.cache.hits, rt.cache.misses), (0, 1))
+        with open(test_file) as fp:
+            self.assertEqual(fp.read(), 'from . import spam\n')
+
+    def test_cache_salt_covers_fixer_code(self):
+        cache_dir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, cache_dir)
+        rt = self.rt({'cache_dir': cache_dir})
+        salt = rt._get_cache_salt()
+        fixer_file = sys.modules[type(rt.post_order[0]).__module__].__file__
+        real_open = open
+
+        def fake_open(filename, *args, **kwds):
+            fp = real_open(filename, *args, **kwds)
+            if filename == fixer_file:
+                return io.BytesIO(fp.read() + b'\n# changed\n')
+            return fp
+        with mock.patch('builtins.open', fake_open):
+            self.assertNotEqual(rt._get_cache_salt(), salt)
+        self.assertEqual(rt._get_cache_salt(), salt)
+
+    def test_refactor_batched(self):
+        tmpdir = tempfile.mkdtemp(prefix='2to3-test_refactor')
+        self.addCleanup(shutil.rmtree, tmpdir)
+        sources = ['def parrot(): pass\n', 'x = 1\n' * 50 +
+            'def parrot(): pass\n', 'y = 2\n', '# parrot\n' * 200]
+        for i, source in enumerate(sources):
+            with open(os.path.join(tmpdir, 'f%d.py' % i), 'w') as fp:
+                fp.write(source)
+        rt = refactor.MultiprocessRefactoringTool(_DEFAULT_FIXERS)
+        rt.refactor([tmpdir], True, num_processes=2, batched=True)
+        expected = [source.replace('parrot()', 'cheese()') for source in
+            sources]
+        for i, source in enumerate(expected):
+            with open(os.path.join(tmpdir, 'f%d.py' % i)) as fp:
+                self.assertEqual(fp.read(), source)
+        self.assertEqual(sorted(rt.files), [os.path.join(tmpdir, 'f%d.py' %
+            i) for i in (0, 1)])
+
+    def test_text_delta(self):
+        old = 'a\nb\nc\nd\n'
+        for new in ['a\nb\nc\nd\n', 'a\nB\nc\nd\n', 'x\na\nc\n',
+            '', 'a\nb\nc\nd\ne']:
+            delta = refactor._text_delta(old, new)
+            self.assertEqual(refactor._apply_delta(old, delta), new)
+        self.assertEqual(refactor._text_delta(old, 'a\nB\nc\nd\n'), [(1,
+            2, ['B\n'])])
+
     def test_refactor_dir(self):
 
         def check(structure, expected):
@@ -3,16 +3,74 @@
 This is intended to read lines from modules imported -- hence if a filename
 is not found, it will look down the module search path for a file by
 that name.
+
+The cache keeps the files it read as undecoded bytes with an index of line
+offsets, so getline() only decodes the line it returns.  It is bounded by
+maxbytes, the total size of the files in it; when it grows beyond that, the
+least recently used files are dropped.
 """
+from array import array
 import functools
+import io
+from itertools import accumulate, chain
 import sys
 import os
 import tokenize
 __all__ = ['getline', 'clearcache', 'checkcache']
+maxbytes = 32 * 1024 * 1024
+_LAZY_ENCODINGS = frozenset(['utf-8', 'utf-8-sig', 'iso-8859-1', 'ascii'])
+
+
+class _FileLines:
+    """The lines of a source file, decoded one at a time when accessed."""
+    __slots__ = 'data', 'encoding', 'offsets'
+
+    def __init__(self, data, encoding):
+        start = 3 if data.startswith(b'\xef\xbb\xbf') else 0
+        self.data = data
+        self.encoding = 'utf-8' if encoding == 'utf-8-sig' else encoding
+        self.offsets = array('l', accumulate(chain((start,), map(len, data[
+            start:].splitlines(True)))))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('line index out of range')
+        line = self.data[self.offsets[index]:self.offsets[index + 1]].decode(
+            self.encoding)
+        if not line.endswith('\n'):
+            line += '\n'
+        return line
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self):
+        """Return all the lines as a list of strings."""
+        lines = self.data[self.offsets[0]:].decode(self.encoding).split('\n')
+        last = lines.pop()
+        lines = [(line + '\n') for line in lines]
+        if last:
+            lines.append(last + '\n')
+        return lines
 
 
 def getline(filename, lineno, module_globals=None):
-    lines = getlines(filename, module_globals)
+    """Get a line for a Python source file from the cache.
+    Return '' if there is no such line."""
+    try:
+        lines = _getlines(filename, module_globals)
+    except MemoryError:
+        clearcache()
+        return ''
+    if lines is None:
+        lines = getlines(filename, module_globals)
     if 1 <= lineno <= len(lines):
         return lines[lineno - 1]
     else:
@@ -20,12 +78,14 @@ def getline(filename, lineno, module_globals=None):
 
 
 cache = {}
+_recent = set()
 
 
 def clearcache():
     """Clear the cache entirely."""
-    global cache
+    global cache, _recent
     cache = {}
+    _recent = set()
 
 
 def getlines(filename, module_globals=None):
@@ -34,7 +94,8 @@ def getlines(filename, module_globals=None):
     if filename in cache:
         entry = cache[filename]
         if len(entry) != 1:
-            return cache[filename][2]
+            _touch(filename, entry)
+            return _listlines(filename, entry[2])
     try:
         return updatecache(filename, module_globals)
     except MemoryError:
@@ -42,11 +103,48 @@ def getlines(filename, module_globals=None):
         return []
 
 
-def checkcache(filename=None):
+def _getlines(filename, module_globals):
+    """Return the cached lines, in whichever form they are stored.
+
+    Return None if the filename is not one that can be read.
+    """
+    entry = cache.get(filename)
+    if entry is not None and len(entry) != 1:
+        _touch(filename, entry)
+        return entry[2]
+    if not filename or filename.startswith('<') and filename.endswith('>'):
+        return None
+    return _updatecache(filename, module_globals)
+
+
+def _touch(filename, entry):
+    del cache[filename]
+    cache[filename] = entry
+    _recent.add(filename)
+
+
+def _listlines(filename, lines):
+    """Return lines as a list, storing the list in the cache entry."""
+    if isinstance(lines, _FileLines):
+        lines = lines.tolist()
+        size, mtime, _, fullname = cache[filename]
+        cache[filename] = size, mtime, lines, fullname
+    return lines
+
+
+def checkcache(filename=None, recent=False):
     """Discard cache entries that are out of date.
-    (This is not checked upon each call!)"""
+    (This is not checked upon each call!)
+
+    If no filename is given and recent is true, only the entries used since
+    the last such check are checked."""
+    global _recent
     if filename is None:
-        filenames = list(cache.keys())
+        if recent:
+            filenames = [name for name in _recent if name in cache]
+        else:
+            filenames = list(cache.keys())
+        _recent = set()
     elif filename in cache:
         filenames = [filename]
     else:
@@ -71,6 +169,10 @@ def updatecache(filename, module_globals=None):
     """Update a cache entry and return its list of lines.
     If something's wrong, print a message, discard the cache entry,
     and return an empty list."""
+    return _listlines(filename, _updatecache(filename, module_globals))
+
+
+def _updatecache(filename, module_globals):
     if filename in cache:
         if len(cache[filename]) != 1:
             del cache[filename]
@@ -107,17 +209,49 @@ def updatecache(filename, module_globals=None):
         else:
             return []
     try:
-        with tokenize.open(fullname) as fp:
-            lines = fp.readlines()
+        with open(fullname, 'rb') as fp:
+            data = fp.read()
     except OSError:
         return []
-    if lines and not lines[-1].endswith('\n'):
-        lines[-1] += '\n'
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    if encoding in _LAZY_ENCODINGS and b'\r' not in data:
+        lines = _FileLines(data, encoding)
+    else:
+        lines = io.StringIO(data.decode(encoding), None).readlines()
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
     size, mtime = stat.st_size, stat.st_mtime
     cache[filename] = size, mtime, lines, fullname
+    _recent.add(filename)
+    _shrink(filename)
     return lines
 
 
+def _shrink(keep):
+    """Drop the least recently used files until the cache fits in maxbytes.
+
+    Only entries that can be read again from their file are dropped, and
+    never the entry for keep.
+    """
+    if maxbytes is None:
+        return
+    total = 0
+    for entry in cache.values():
+        if len(entry) != 1:
+            total += entry[0]
+    if total <= maxbytes:
+        return
+    for filename, entry in list(cache.items()):
+        if total <= maxbytes:
+            break
+        if filename == keep or len(entry) == 1 or entry[1] is None:
+            continue
+        if filename.startswith('<') and filename.endswith('>'):
+            continue
+        del cache[filename]
+        total -= entry[0]
+
+
 def lazycache(filename, module_globals):
     """Seed the cache for filename with module_globals.
 
@@ -79,6 +79,9 @@ This module exports the following functions:
     finditer  Return an iterator yielding a match object for each match.
     compile   Compile a pattern into a RegexObject.
     purge     Clear the regular expression cache.
+    preload   Compile patterns into the cache ahead of their use.
+    cache_info     Return statistics of the regular expression cache.
+    set_cache_size Set the number of patterns kept in the cache.
     escape    Backslash all non-alphanumerics in a string.
 
 Some of the functions in this module takes flags as optional parameters:
@@ -106,14 +109,16 @@ import enum
 import sre_compile
 import sre_parse
 import functools
+from collections import namedtuple
 try:
     import _locale
 except ImportError:
     _locale = None
 __all__ = ['match', 'fullmatch', 'search', 'sub', 'subn', 'split',
     'findall', 'finditer', 'compile', 'purge', 'template', 'escape',
-    'error', 'A', 'I', 'L', 'M', 'S', 'X', 'U', 'ASCII', 'IGNORECASE',
-    'LOCALE', 'MULTILINE', 'DOTALL', 'VERBOSE', 'UNICODE']
+    'cache_info', 'set_cache_size', 'preload', 'error', 'A', 'I', 'L',
+    'M', 'S', 'X', 'U', 'ASCII', 'IGNORECASE', 'LOCALE', 'MULTILINE',
+    'DOTALL', 'VERBOSE', 'UNICODE']
 __version__ = '2.2.1'
 
 
@@ -219,9 +224,45 @@ def compile(pattern, flags=0):
 def purge():
     """Clear the regular expression caches"""
     _cache.clear()
+    _cache2.clear()
     _compile_repl.cache_clear()
 
 
+def cache_info():
+    """Return statistics of the compiled pattern cache.
+
+    The result is a named tuple (hits, misses, evictions, maxsize, currsize):
+    hits counts lookups answered from the cache, misses the patterns that
+    had to be compiled.  The cache is shared with the fnmatch module."""
+    return _CacheInfo(_hits, _misses, _evictions, _cache_size, len(_cache))
+
+
+def set_cache_size(maxsize):
+    """Set the number of compiled patterns kept in the cache.
+
+    The least recently used patterns beyond the new size are dropped.  A
+    size of 0 disables the cache."""
+    global _cache_size
+    if maxsize < 0:
+        raise ValueError('cache size must be non-negative')
+    _cache_size = maxsize
+    _cache_shrink()
+
+
+def preload(patterns, flags=0):
+    """Compile the given patterns into the cache ahead of their use.
+
+    Each item is a pattern or a (pattern, flags) pair.  Returns the list
+    of compiled pattern objects."""
+    compiled = []
+    for pattern in patterns:
+        if isinstance(pattern, tuple):
+            compiled.append(_compile(*pattern))
+        else:
+            compiled.append(_compile(pattern, flags))
+    return compiled
+
+
 def template(pattern, flags=0):
     """Compile a template pattern, returning a pattern object"""
     return _compile(pattern, flags | T)
@@ -262,18 +303,81 @@ def escape(pattern):
         return bytes(s)
 
 
+_CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize'
+    )
+
+
 _cache = {}
+_cache2 = {}
 _pattern_type = type(sre_compile.compile('', 0))
 _MAXCACHE = 512
+_cache_size = _MAXCACHE
+_hits = _misses = _evictions = 0
+
+
+def _cache_lookup(key):
+    try:
+        return _cache2[key]
+    except KeyError:
+        pass
+    try:
+        value = _cache.pop(key)
+    except KeyError:
+        return None
+    _cache[key] = value
+    _cache_promote(key, value)
+    return value
+
+
+def _cache_promote(key, value):
+    if len(_cache2) >= _cache_size // 2:
+        try:
+            del _cache2[next(iter(_cache2))]
+        except (StopIteration, RuntimeError, KeyError):
+            pass
+    _cache2[key] = value
+
+
+def _cache_get(key):
+    global _hits
+    value = _cache_lookup(key)
+    if value is not None:
+        _hits += 1
+    return value
+
+
+def _cache_add(key, value):
+    _cache.pop(key, None)
+    _cache[key] = value
+    _cache_promote(key, value)
+    if len(_cache) > _cache_size:
+        _cache_shrink()
+
+
+def _cache_shrink():
+    global _evictions
+    while len(_cache) > _cache_size:
+        try:
+            key = next(iter(_cache))
+            del _cache[key]
+        except (StopIteration, RuntimeError, KeyError):
+            break
+        _cache2.pop(key, None)
+        _evictions += 1
 
 
 def _compile(pattern, flags):
+    global _hits, _misses
+    key = type(pattern), pattern, flags
     try:
-        p, loc = _cache[type(pattern), pattern, flags]
+        value = _cache2[key]
+    except KeyError:
+        value = _cache_lookup(key)
+    if value is not None:
+        p, loc = value
         if loc is None or loc == _locale.setlocale(_locale.LC_CTYPE):
+            _hits += 1
             return p
-    except KeyError:
-        pass
     if isinstance(pattern, _pattern_type):
         if flags:
             raise ValueError(
@@ -281,17 +385,16 @@ def _compile(pattern, flags):
         return pattern
     if not sre_compile.isstring(pattern):
         raise TypeError('first argument must be string or compiled pattern')
+    _misses += 1
     p = sre_compile.compile(pattern, flags)
     if not flags & DEBUG:
-        if len(_cache) >= _MAXCACHE:
-            _cache.clear()
         if p.flags & LOCALE:
             if not _locale:
                 return p
             loc = _locale.setlocale(_locale.LC_CTYPE)
         else:
             loc = None
-        _cache[type(pattern), pattern, flags] = p, loc
+        _cache_add(key, (p, loc))
     return p
 
 
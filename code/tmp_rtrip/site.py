@@ -341,6 +341,28 @@ def sethelper():
     builtins.help = _sitebuiltins._Helper()
 
 
+def enableimportindex():
+    """Use the directory index named by PYTHONIMPORTINDEX, if set.
+
+    The index holds the listings of the directories on sys.path, so that
+    imports do not have to list the directories that did not change since
+    the last run.  It is written back at exit when it changed.
+    """
+    filename = os.environ.get('PYTHONIMPORTINDEX')
+    if not filename:
+        return
+    from importlib.machinery import FileFinder
+    import atexit
+    FileFinder.load_index(filename)
+
+    def save_index():
+        try:
+            FileFinder.save_index(filename)
+        except OSError:
+            pass
+    atexit.register(save_index)
+
+
 def enablerlcompleter():
     """Enable default readline configuration on interactive prompts, by
     registering a sys.__interactivehook__.
@@ -461,6 +483,8 @@ def main():
     global ENABLE_USER_SITE
     abs_paths()
     known_paths = removeduppaths()
+    if not sys.flags.ignore_environment:
+        enableimportindex()
     known_paths = venv(known_paths)
     if ENABLE_USER_SITE is None:
         ENABLE_USER_SITE = check_enableusersite()
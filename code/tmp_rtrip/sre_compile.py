@@ -1,5 +1,7 @@
 """Internal support module for sre"""
 import _sre
+import marshal
+import sys
 import sre_parse
 from sre_constants import *
 assert _sre.MAGIC == MAGIC, 'SRE module mismatch'
@@ -469,16 +471,165 @@ def _code(p, flags):
     return code
 
 
+class CodeCache:
+    """A file of compiled pattern programs that outlives the process.
+
+    Parsing a pattern and generating its code is done in Python and is the
+    bulk of what re.compile() costs.  The cache keeps the code of the
+    patterns compiled by the process in a file under *directory*, one file
+    per interpreter and engine version, and gives it back to later
+    processes.  New entries are written when the process exits; the oldest
+    entries are dropped once there are more than *maxentries*.
+
+    The cache used by compile() is the module's codecache, set from the
+    PYTHONRECACHE environment variable when the module is imported.
+    """
+
+    def __init__(self, directory, maxentries=4096):
+        import os
+        self.directory = directory
+        self.filename = os.path.join(directory, 'sre-%s-%d-%d.cache' % (sys
+            .implementation.cache_tag, MAGIC, _sre.CODESIZE))
+        self.maxentries = maxentries
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._used = set()
+        self._new = {}
+        self._registered = False
+
+    def __repr__(self):
+        return '<%s %r hits=%d misses=%d>' % (self.__class__.__name__, self
+            .filename, self.hits, self.misses)
+
+    def _load(self):
+        try:
+            with open(self.filename, 'rb') as f:
+                entries = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def get(self, pattern, flags):
+        """Return the entry stored for pattern and flags, or None.
+
+        An entry is a (flags, code, groups, groupindex, indexgroup) tuple
+        of the arguments _sre.compile() takes after the pattern.
+        """
+        if self._entries is None:
+            self._entries = self._load()
+        key = isinstance(pattern, bytes), pattern, int(flags)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.add(key)
+        return entry
+
+    def put(self, pattern, flags, entry):
+        """Store entry for pattern and flags, to be saved at exit.
+
+        The directory is created by the first call.
+        """
+        if self._entries is None:
+            self._entries = self._load()
+        if not self._registered:
+            import atexit
+            import os
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+            except OSError:
+                pass
+            atexit.register(self.save)
+            self._registered = True
+        key = isinstance(pattern, bytes), pattern, int(flags)
+        self._entries[key] = entry
+        self._new[key] = entry
+
+    def save(self):
+        """Merge the new entries into the file.
+
+        Nothing is written if the directory no longer exists.
+        """
+        if not self._new:
+            return
+        import os
+        stored = self._load()
+        entries = {key: entry for key, entry in stored.items() if key not in
+            self._used}
+        entries.update((key, stored.get(key, self._entries.get(key))) for
+            key in self._used)
+        entries.update(self._new)
+        self._new = {}
+        for key in list(entries)[:max(len(entries) - self.maxentries, 0)]:
+            del entries[key]
+        tmp = '%s.%d.tmp' % (self.filename, os.getpid())
+        try:
+            with open(tmp, 'wb') as f:
+                marshal.dump(entries, f)
+            os.replace(tmp, self.filename)
+        except (OSError, ValueError):
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove the file, forget every entry and cancel the save at exit."""
+        import os
+        try:
+            os.unlink(self.filename)
+        except OSError:
+            pass
+        if self._registered:
+            import atexit
+            atexit.unregister(self.save)
+            self._registered = False
+        self._entries = {}
+        self._used.clear()
+        self._new = {}
+
+
+def _cache_from_environment():
+    if sys.flags.ignore_environment:
+        return None
+    import os
+    directory = os.environ.get('PYTHONRECACHE')
+    if not directory:
+        return None
+    return CodeCache(directory)
+
+
+codecache = _cache_from_environment()
+
+
 def compile(p, flags=0):
     if isstring(p):
         pattern = p
+        cache = codecache
+        if cache is not None and not flags & (SRE_FLAG_DEBUG |
+            SRE_FLAG_LOCALE):
+            entry = cache.get(pattern, flags)
+            if entry is not None:
+                try:
+                    return _sre.compile(pattern, *entry)
+                except (RuntimeError, TypeError, ValueError):
+                    pass
         p = sre_parse.parse(p, flags)
     else:
-        pattern = None
+        pattern = cache = None
     code = _code(p, flags)
     groupindex = p.pattern.groupdict
     indexgroup = [None] * p.pattern.groups
     for k, i in groupindex.items():
         indexgroup[i] = k
-    return _sre.compile(pattern, flags | p.pattern.flags, code, p.pattern.
-        groups - 1, groupindex, indexgroup)
+    final = flags | p.pattern.flags
+    if (cache is not None and not final & (SRE_FLAG_DEBUG | SRE_FLAG_LOCALE
+        ) and not p.pattern.warned):
+        cache.put(pattern, flags, (int(final), list(map(int, code)), p.
+            pattern.groups - 1, groupindex, indexgroup))
+    return _sre.compile(pattern, final, code, p.pattern.groups - 1,
+        groupindex, indexgroup)
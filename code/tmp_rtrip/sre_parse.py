@@ -38,6 +38,7 @@ class Pattern:
         self.groupdict = {}
         self.groupwidths = [None]
         self.lookbehindgroups = None
+        self.warned = False
 
     @property
     def groups(self):
@@ -679,6 +680,7 @@ def _parse(source, state, verbose, nested, first=False):
                     if flags is None:
                         if not first or subpattern:
                             import warnings
+                            state.warned = True
                             warnings.warn(
                                 'Flags not at the start of the expression %r%s'
                                  % (source.string[:20], ' (truncated)' if 
@@ -289,6 +289,40 @@ class ASTHelpers_Test(unittest.TestCase):
                 ast.literal_eval("'\\U'")
             self.assertIsNotNone(e.exception.__context__)
 
+    def check_reparse(self, source, old, new, count=1):
+        start = source.index(old)
+        end = start + len(old)
+        tree = ast.parse(source)
+        first = tree.body[0]
+        tree, new_source = ast.reparse(tree, source, start, end, new)
+        self.assertEqual(new_source, source.replace(old, new, 1))
+        self.assertEqual(ast.dump(tree, include_attributes=True), ast.dump(
+            ast.parse(new_source), include_attributes=True))
+        return tree, first
+
+    def test_reparse(self):
+        source = (
+            '"""doc\nstring"""\nimport os\n\n@dec\ndef f(x):\n    return x\n\nclass C:\n    a = 1; b = 2\ny = f(2)\n'
+            )
+        tree, first = self.check_reparse(source, 'return x', 'return (x +\n 1)'
+            )
+        self.assertIs(tree.body[0], first)
+        tree, first = self.check_reparse(source, 'b = 2', 'b = 3\n    c = 4')
+        self.assertIs(tree.body[0], first)
+        self.check_reparse(source, 'import os\n', '')
+        self.check_reparse(source, 'string', 'string\n\nx = 1\n')
+        self.check_reparse(source, '@dec', '@dec\n@other')
+        self.check_reparse(source, 'y = f(2)\n', 'y = f(2); z = 3\n')
+        tree, first = self.check_reparse('x = 1\n2\n', '1', '1 + \\')
+        self.assertIsNot(tree.body[0], first)
+        self.assertEqual(len(tree.body), 1)
+
+    def test_reparse_error(self):
+        source = 'x = 1\ny = 2\n'
+        tree = ast.parse(source)
+        with self.assertRaises(SyntaxError):
+            ast.reparse(tree, source, 0, 1, '(')
+
     def test_dump(self):
         node = ast.parse('spam(eggs, "and cheese")')
         self.assertEqual(ast.dump(node),
@@ -301,6 +335,88 @@ class ASTHelpers_Test(unittest.TestCase):
             "Module(body=[Expr(value=Call(func=Name(id='spam', ctx=Load(), lineno=1, col_offset=0), args=[Name(id='eggs', ctx=Load(), lineno=1, col_offset=5), Str(s='and cheese', lineno=1, col_offset=11)], keywords=[], lineno=1, col_offset=0), lineno=1, col_offset=0)])"
             )
 
+    def test_compare(self):
+        a = ast.parse('spam(eggs, "and cheese")')
+        b = ast.parse('spam(eggs,\n     "and cheese")')
+        self.assertTrue(ast.compare(a, b))
+        self.assertFalse(ast.compare(a, b, include_attributes=True))
+        self.assertEqual(ast.first_difference(a, b, include_attributes=True),
+            'body[0].value.args[1].lineno')
+        self.assertEqual(ast.first_difference(a, ast.parse(
+            'spam(eggs, "and ham")')), 'body[0].value.args[1].s')
+        self.assertEqual(ast.first_difference(a, ast.parse('spam(eggs)')),
+            'body[0].value.args')
+        self.assertEqual(ast.first_difference(ast.parse('1'), ast.parse(
+            '1.0')), 'body[0].value.n')
+        self.assertFalse(ast.compare(ast.parse('0.0'), ast.parse('-0.0')))
+
+    def test_structural_hash(self):
+        a = ast.parse('spam(eggs, "and cheese")')
+        b = ast.parse('spam(eggs,\n     "and cheese")')
+        self.assertEqual(ast.structural_hash(a), ast.structural_hash(b))
+        self.assertNotEqual(ast.structural_hash(a, include_attributes=True),
+            ast.structural_hash(b, include_attributes=True))
+        self.assertNotEqual(ast.structural_hash(a), ast.structural_hash(ast
+            .parse('spam(eggs, "and ham")')))
+        self.assertNotEqual(ast.structural_hash(ast.parse('[a], b')), ast.
+            structural_hash(ast.parse('[a, b]')))
+        self.assertEqual(ast.structural_hash(ast.parse('x')),
+            4255113088803673053)
+
+    def test_dumpb(self):
+        for statements, kind in ((exec_tests, 'exec'), (single_tests,
+            'single'), (eval_tests, 'eval')):
+            for statement in statements:
+                tree = ast.parse(statement, '?', kind)
+                self.assertEqual(ast.dump(ast.loadb(ast.dumpb(tree)),
+                    include_attributes=True), ast.dump(tree,
+                    include_attributes=True))
+        tree = ast.Module([ast.Expr(ast.Constant((1, 2.5, -3j, 1 << 70,
+            frozenset({b'x'}), None, ...)))])
+        self.assertEqual(ast.dump(ast.loadb(bytearray(ast.dumpb(tree)))),
+            ast.dump(tree))
+        self.assertRaises(TypeError, ast.dumpb, ast.Expr(object()))
+
+    def test_dumpb_byte_order(self):
+        import array, struct
+        from unittest import mock
+        other_order = 'big' if sys.byteorder == 'little' else 'little'
+        prefix = '>' if other_order == 'big' else '<'
+        real_struct = struct.Struct
+
+        def other_struct(fmt):
+            return real_struct(fmt if fmt[0] in '<>!=@' else prefix + fmt)
+        tree = ast.parse('x = (1.5, -2.25e-300, 3j, 1.0 + 2.5j, "a", -7)')
+        with mock.patch.object(sys, 'byteorder', other_order
+            ), mock.patch.object(struct, 'Struct', other_struct):
+            data = ast.dumpb(tree)
+        size = struct.calcsize(ast._BINARY_HEADER)
+        nstrings, nindex, nwords = struct.unpack_from('<III', data, 8)
+        end = size + 4 * (nstrings + 1 + nindex + nwords)
+        words = array.array('i', data[size:end])
+        words.byteswap()
+        data = data[:size] + words.tobytes() + data[end:]
+        self.assertEqual(ast.dump(ast.loadb(data), include_attributes=True),
+            ast.dump(tree, include_attributes=True))
+
+    def test_lazy_tree(self):
+        data = ast.dumpb(ast.parse(
+            'import os\n@dec\ndef f(x):\n    return x\n\nclass C(f):\n    pass\n'
+            ))
+        tree = ast.loadb(data, lazy=True)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.kind(0), 'Import')
+        self.assertEqual(tree.definitions(), [('FunctionDef', 'f', 2), (
+            'ClassDef', 'C', 6)])
+        self.assertEqual([ast.dump(node) for node in tree.field(1,
+            'decorator_list')], ["Name(id='dec', ctx=Load())"])
+        self.assertEqual(ast.dump(tree[-1]),
+            "ClassDef(name='C', bases=[Name(id='f', ctx=Load())], keywords=[], body=[Pass()], decorator_list=[])"
+            )
+        self.assertRaises(AttributeError, tree.field, 0, 'name')
+        self.assertRaises(ValueError, ast.loadb, b'AST\x00', lazy=True)
+        self.assertRaises(ValueError, ast.loadb, b'XXXX' + data[4:])
+
     def test_copy_location(self):
         src = ast.parse('1 + 1', mode='eval')
         src.body.right = ast.copy_location(ast.Num(2), src.body.right)
@@ -329,6 +445,21 @@ class ASTHelpers_Test(unittest.TestCase):
             'Expression(body=BinOp(left=Num(n=1, lineno=4, col_offset=0), op=Add(), right=Num(n=1, lineno=4, col_offset=4), lineno=4, col_offset=0))'
             )
 
+    def test_normalize_locations(self):
+        src = ast.parse('x = 1\nif y:\n    pass')
+        src.body[1].body.append(ast.Expr(ast.Call(ast.Name('spam', ast.Load
+            ()), [], [])))
+        self.assertIs(ast.normalize_locations(src, n=2, col=4), src)
+        self.assertEqual(ast.dump(src.body[1], include_attributes=True),
+            "If(test=Name(id='y', ctx=Load(), lineno=4, col_offset=7), body=[Pass( lineno=5, col_offset=8), Expr(value=Call(func=Name(id='spam', ctx=Load(), lineno=4, col_offset=4), args=[], keywords=[], lineno=4, col_offset=4), lineno=4, col_offset=4)], orelse=[], lineno=4, col_offset=4)"
+            )
+        call = src.body[1].body[1].value
+        call.args.append(ast.Num(2))
+        ast.normalize_locations(call.args[0], parent=call)
+        self.assertEqual((call.args[0].lineno, call.args[0].col_offset), (4, 4)
+            )
+        self.assertEqual(src.body[0].lineno, 3)
+
     def test_iter_fields(self):
         node = ast.parse('foo()', mode='eval')
         d = dict(ast.iter_fields(node.body))
@@ -345,6 +476,96 @@ class ASTHelpers_Test(unittest.TestCase):
         self.assertEqual(ast.dump(next(iterator)),
             "keyword(arg='eggs', value=Str(s='leek'))")
 
+    def test_walk(self):
+        node = ast.parse("spam(23, eggs='leek')\nfrom a import b as c")
+        self.assertEqual([n.__class__.__name__ for n in ast.walk(node)], [
+            'Module', 'Expr', 'ImportFrom', 'Call', 'alias', 'Name', 'Num',
+            'keyword', 'Load', 'Str'])
+
+    def test_node_visitor_dispatch(self):
+
+
+        class Visitor(ast.NodeVisitor):
+
+            def __init__(self):
+                self.seen = []
+
+            def visit_Name(self, node):
+                self.seen.append(node.id)
+
+            @staticmethod
+            def visit_Num(node):
+                return node.n
+
+
+        class SubVisitor(Visitor):
+
+            def visit_Name(self, node):
+                self.seen.append(node.id.upper())
+        tree = ast.parse('a + b(1)')
+        visitor = Visitor()
+        visitor.visit(tree)
+        self.assertEqual(visitor.seen, ['a', 'b'])
+        self.assertEqual(visitor.visit(tree.body[0].value.right.args[0]), 1)
+        visitor = SubVisitor()
+        visitor.visit(tree)
+        self.assertEqual(visitor.seen, ['A', 'B'])
+
+    def test_node_visitor_dynamic_dispatch(self):
+
+
+        class Visitor(ast.NodeVisitor):
+
+            def __init__(self):
+                self.seen = []
+
+
+        class GetattrVisitor(Visitor):
+
+            def __getattr__(self, name):
+                if name == 'visit_Name':
+                    return lambda node: self.seen.append(node.id)
+                raise AttributeError(name)
+        tree = ast.parse('a + b(1)')
+        visitor = Visitor()
+        visitor.visit(tree)
+        visitor.visit_Name = lambda node: visitor.seen.append(node.id)
+        visitor.visit(tree)
+        self.assertEqual(visitor.seen, ['a', 'b'])
+        visitor = GetattrVisitor()
+        visitor.visit(tree)
+        visitor.traverse(tree)
+        self.assertEqual(visitor.seen, ['a', 'b', 'a', 'b'])
+        visitor = Visitor()
+        visitor.visit(tree)
+        Visitor.visit_Num = lambda self, node: self.seen.append(node.n)
+        visitor.visit(tree)
+        visitor.traverse(tree)
+        self.assertEqual(visitor.seen, [1, 1])
+
+    def test_node_visitor_traverse(self):
+
+
+        class Visitor(ast.NodeVisitor):
+
+            def __init__(self):
+                self.seen = []
+
+            def visit_Name(self, node):
+                self.seen.append(node.id)
+
+            def visit_Num(self, node):
+                self.seen.append(node.n)
+        visitor = Visitor()
+        visitor.traverse(ast.parse('a + f(1, b)\nc = [2]'))
+        self.assertEqual(visitor.seen, ['a', 'f', 1, 'b', 'c', 2])
+        tree = ast.Name('x', ast.Load())
+        for i in range(sys.getrecursionlimit() * 2):
+            tree = ast.UnaryOp(ast.Not(), tree)
+        visitor = Visitor()
+        visitor.traverse(tree)
+        self.assertEqual(visitor.seen, ['x'])
+
     def test_get_docstring(self):
         node = ast.parse('def foo():\n  """line one\n  line two"""')
         self.assertEqual(ast.get_docstring(node.body[0]), 'line one\nline two')
@@ -363,6 +584,45 @@ class ASTHelpers_Test(unittest.TestCase):
         self.assertEqual(ast.literal_eval('-6j+3'), 3 - 6j)
         self.assertEqual(ast.literal_eval('3.25'), 3.25)
 
+    def test_literal_eval_many(self):
+        sources = ['[1, 2.5, "x"]', '{"a": [1, -2], "b": {}}', '-6j+3',
+            "('a', b'b', None)", '{1, 2}', '"\\u00e9"', '1e1000', '"é"']
+        self.assertEqual(ast.literal_eval_many(sources), [ast.literal_eval(
+            source) for source in sources])
+        memo = {}
+        first = ast.literal_eval_many(sources[:2], memo)
+        self.assertEqual(sorted(memo), sorted(sources[:2]))
+        second = ast.literal_eval_many(sources[:2], memo)
+        self.assertIs(first[0], second[0])
+        node = ast.parse('[1]', mode='eval')
+        self.assertEqual(ast.literal_eval_many([node]), [[1]])
+        for source in ('true', '[null]', 'NaN', '[Infinity]', ' 1', '1, 2',
+            '"a" "b"', '"\x00"', '"\ud800"', '\n 1', '\r\n 2', '\r 1',
+            '\n  "x"', '\n1', '\t[1]'):
+            with self.subTest(source=source):
+                try:
+                    expected = ast.literal_eval(source)
+                except Exception as e:
+                    self.assertRaises(type(e), ast.literal_eval_many, [source])
+                else:
+                    self.assertEqual(ast.literal_eval_many([source]), [
+                        expected])
+
+    def test_literal_eval_many_nesting(self):
+        sources = ['[' * n + ']' * n for n in (92, 93, 94, 100, 500)]
+        sources += ['{"a": ' * n + '1' + '}' * n for n in (92, 93, 500)]
+        for source in sources:
+            with self.subTest(depth=source.count('[') + source.count('{')):
+                try:
+                    expected = ast.literal_eval(source)
+                except Exception as e:
+                    self.assertRaises(type(e), ast.literal_eval_many, [source])
+                else:
+                    self.assertEqual(ast.literal_eval_many([source]), [
+                        expected])
+        wide = '[%s]' % ', '.join(['[1, {"a": []}]'] * 200)
+        self.assertEqual(ast._fast_literal_eval(wide), ast.literal_eval(wide))
+
     def test_literal_eval_issue4907(self):
         self.assertEqual(ast.literal_eval('2j'), 2j)
         self.assertEqual(ast.literal_eval('10 + 2j'), 10 + 2j)
@@ -0,0 +1,121 @@
+""" Tests for the astcache module """
+import ast
+import astcache
+import os
+import tempfile
+import unittest
+from test import support
+from unittest import mock
+SOURCE_1 = """
+def f():
+    return 1 + 1
+
+class C:
+    pass
+"""
+SOURCE_2 = """
+a = f()
+"""
+
+
+class ASTCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.cache = astcache.ASTCache(os.path.join(self.directory, 'cache'))
+        self.file_name = os.path.join(self.directory, 'mod.py')
+        self.write(SOURCE_1)
+
+    def write(self, source):
+        with open(self.file_name, 'w') as f:
+            f.write(source)
+
+    def test_parse(self):
+        tree = self.cache.parse(self.file_name)
+        self.assertEqual(ast.dump(tree, include_attributes=True), ast.dump(
+            ast.parse(SOURCE_1), include_attributes=True))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        tree = self.cache.parse(self.file_name)
+        self.assertEqual(ast.dump(tree), ast.dump(ast.parse(SOURCE_1)))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_invalidation(self):
+        self.cache.parse(self.file_name)
+        self.write(SOURCE_2)
+        st = os.stat(self.file_name)
+        os.utime(self.file_name, ns=(st.st_atime_ns, st.st_mtime_ns + 10 **
+            9))
+        tree = self.cache.parse(self.file_name)
+        self.assertEqual(ast.dump(tree), ast.dump(ast.parse(SOURCE_2)))
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_eviction(self):
+        self.cache.parse(self.file_name)
+        size = os.path.getsize(os.path.join(self.cache.directory, os.
+            listdir(self.cache.directory)[0]))
+        self.cache.max_size = size * 2
+        names = []
+        for i in range(4):
+            name = os.path.join(self.directory, 'mod%d.py' % i)
+            with open(name, 'w') as f:
+                f.write(SOURCE_1)
+            self.cache.parse(name)
+            names.append(name)
+        self.assertLessEqual(len(os.listdir(self.cache.directory)), 2)
+        self.assertIsNotNone(self.cache.get(names[-1]))
+
+    def test_corrupted_entry(self):
+        expected = ast.dump(ast.parse(SOURCE_1))
+        self.cache.parse(self.file_name)
+        path = os.path.join(self.cache.directory, os.listdir(self.cache.
+            directory)[0])
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.cache.misses = 0
+        for i in range(len(data)):
+            corrupted = bytearray(data)
+            corrupted[i] ^= 255
+            with open(path, 'wb') as f:
+                f.write(corrupted[:len(data) - i % 7])
+            with self.subTest(offset=i):
+                tree = self.cache.parse(self.file_name)
+                self.assertEqual(self.cache.misses, 1)
+                self.assertEqual(ast.dump(tree), expected)
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(), data)
+            self.cache.misses = 0
+
+    def test_key_computed_once(self):
+        with mock.patch.object(self.cache, 'key', wraps=self.cache.key
+            ) as key:
+            self.cache.parse(self.file_name)
+        self.assertEqual(key.call_count, 1)
+
+    def test_clear(self):
+        self.cache.parse(self.file_name)
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.cache.directory), [])
+        self.assertIsNone(self.cache.get(self.file_name))
+
+    def test_missing_file(self):
+        self.assertIsNone(self.cache.get(self.file_name + '.missing'))
+        with self.assertRaises(OSError):
+            self.cache.parse(self.file_name + '.missing')
+
+    def test_environment(self):
+        with support.EnvironmentVarGuard() as env:
+            env.unset('PYTHONASTCACHE')
+            self.assertIsNone(astcache.getcache())
+            astcache.parse(self.file_name)
+            env['PYTHONASTCACHE'] = self.cache.directory
+            astcache.parse(self.file_name)
+            self.assertEqual(astcache.getcache().directory, self.cache.
+                directory)
+            self.assertEqual(len(os.listdir(self.cache.directory)), 1)
+            astcache.clearcache()
+            self.assertEqual(os.listdir(self.cache.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -178,6 +178,81 @@ class CompileallTests(unittest.TestCase):
         compileall.compile_dir(self.directory, quiet=True, workers=5)
         self.assertTrue(compile_file_mock.called)
 
+    @mock.patch('compileall.ProcessPoolExecutor')
+    def test_compile_pool_chunksize(self, pool_mock):
+        compileall.compile_dir(self.directory, quiet=True, workers=2)
+        executor = pool_mock.return_value.__enter__.return_value
+        self.assertEqual(executor.map.call_args[1]['chunksize'], 1)
+
+    def test_manifest(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=True,
+            manifest=manifest))
+        self.assertTrue(os.path.isfile(manifest))
+        self.assertEqual(*self.data())
+        self.assertTrue(os.path.isfile(importlib.util.cache_from_source(
+            self.source_path3)))
+        with mock.patch('compileall.compile_file') as compile_file_mock:
+            self.assertTrue(compileall.compile_dir(self.directory, quiet=
+                True, manifest=manifest))
+            self.assertFalse(compile_file_mock.called)
+        st = os.stat(self.source_path)
+        os.utime(self.source_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 **
+            9))
+        with mock.patch('compileall.compile_file') as compile_file_mock:
+            with support.captured_stdout() as stdout:
+                compileall.compile_dir(self.directory, manifest=manifest)
+            self.assertFalse(compile_file_mock.called)
+        self.assertIn('1 restamped, 0 compiled, 0 failed', stdout.getvalue())
+        self.assertEqual(*self.data())
+        with open(self.source_path, 'a') as file:
+            file.write('y = 456\n')
+        with support.captured_stdout() as stdout:
+            compileall.compile_dir(self.directory, manifest=manifest)
+        self.assertIn('Compiling {!r}'.format(self.source_path), stdout.
+            getvalue())
+        self.assertIn('3 files: 2 unchanged', stdout.getvalue())
+        self.add_bad_source_file()
+        self.assertFalse(compileall.compile_dir(self.directory, quiet=2,
+            manifest=manifest))
+        self.assertFalse(compileall.compile_dir(self.directory, quiet=2,
+            manifest=manifest))
+
+    def test_manifest_missing_pyc(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        compileall.compile_dir(self.directory, quiet=True, manifest=manifest)
+        shutil.rmtree(os.path.dirname(self.bc_path))
+        with support.captured_stdout() as stdout:
+            self.assertTrue(compileall.compile_dir(self.directory, manifest
+                =manifest))
+        self.assertIn('3 files: 1 unchanged', stdout.getvalue())
+        self.assertTrue(os.path.isfile(self.bc_path))
+        self.assertTrue(os.path.isfile(self.bc_path2))
+        os.unlink(self.bc_path)
+        with support.captured_stdout() as stdout:
+            self.assertTrue(compileall.compile_dir(self.directory, manifest
+                =manifest))
+        self.assertIn('3 files: 2 unchanged', stdout.getvalue())
+        self.assertTrue(os.path.isfile(self.bc_path))
+
+    def test_manifest_reads_no_pyc(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        compileall.compile_dir(self.directory, quiet=True, manifest=manifest)
+        compileall.compile_dir(self.directory, quiet=True, manifest=manifest)
+        with mock.patch('compileall._pyc_matches') as pyc_matches_mock:
+            with support.captured_stdout() as stdout:
+                compileall.compile_dir(self.directory, manifest=manifest)
+            self.assertFalse(pyc_matches_mock.called)
+        self.assertIn('3 files: 3 unchanged', stdout.getvalue())
+
+    def test_manifest_settings(self):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        compileall.compile_dir(self.directory, quiet=True, manifest=manifest)
+        with mock.patch('compileall.compile_file') as compile_file_mock:
+            compileall.compile_dir(self.directory, quiet=True, optimize=2,
+                manifest=manifest)
+            self.assertTrue(compile_file_mock.called)
+
 
 class EncodingTest(unittest.TestCase):
     """Issue 6716: compileall should escape source code when printing errors
@@ -498,6 +573,14 @@ class CommandLineTests(unittest.TestCase):
         for file in files:
             self.assertCompiled(file)
 
+    @mock.patch('compileall.compile_dir')
+    def test_manifest(self, compile_dir):
+        manifest = os.path.join(self.directory, 'manifest.json')
+        with mock.patch('sys.argv', new=[sys.executable, self.directory,
+            '--manifest', manifest]):
+            compileall.main()
+            self.assertEqual(compile_dir.call_args[-1]['manifest'], manifest)
+
     @mock.patch('compileall.compile_dir')
     def test_workers_available_cores(self, compile_dir):
         with mock.patch('sys.argv', new=[sys.executable, self.directory, '-j0']
@@ -1,6 +1,7 @@
 """Test cases for the fnmatch module."""
 import unittest
 import os
+import re
 from fnmatch import fnmatch, fnmatchcase, translate, filter
 
 
@@ -73,6 +74,17 @@ class FnmatchTestCase(unittest.TestCase):
         check('usr/bin', 'usr\\bin', normsep)
         check('usr\\bin', 'usr\\bin')
 
+    def test_shared_cache(self):
+        re.purge()
+        info = re.cache_info()
+        self.assertTrue(fnmatchcase('abc', '*b?'))
+        self.assertTrue(fnmatchcase('xbc', '*b?'))
+        new = re.cache_info()
+        self.assertEqual(new.currsize, 2)
+        self.assertEqual(new.hits - info.hits, 1)
+        re.purge()
+        self.assertEqual(re.cache_info().currsize, 0)
+
 
 class TranslateTestCase(unittest.TestCase):
 
@@ -7,6 +7,7 @@ import py_compile
 import stat
 import sys
 import tempfile
+from test import support
 from test.support import make_legacy_pyc
 import unittest
 import warnings
@@ -199,5 +200,88 @@ class FinderTestsPEP302(FinderTests):
 
 Frozen_FinderTestsPEP302, Source_FinderTestsPEP302 = util.test_both(
     FinderTestsPEP302, machinery=machinery)
+
+
+class FinderIndexTests(unittest.TestCase):
+    machinery = machinery['Source']
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.addCleanup(setattr, self.machinery.FileFinder, '_index', None)
+        self.index = os.path.join(self.directory, 'index')
+        self.modules = os.path.join(self.directory, 'modules')
+        os.mkdir(self.modules)
+        with open(os.path.join(self.modules, 'indexed.py'), 'w') as file:
+            file.write('')
+        st = os.stat(self.modules)
+        os.utime(self.modules, ns=(st.st_atime_ns, st.st_mtime_ns - 10 ** 10))
+
+    def get_finder(self, path):
+        return self.machinery.FileFinder(path, (self.machinery.
+            SourceFileLoader, self.machinery.SOURCE_SUFFIXES))
+
+    def test_save_and_load(self):
+        FileFinder = self.machinery.FileFinder
+        FileFinder.load_index(self.index)
+        self.assertEqual(FileFinder._index, {})
+        self.assertIsNotNone(self.get_finder(self.modules).find_spec(
+            'indexed'))
+        self.assertEqual(FileFinder._index[self.modules][1], ('indexed.py',))
+        self.assertTrue(FileFinder.save_index(self.index))
+        self.assertFalse(FileFinder.save_index(self.index))
+        FileFinder._index = None
+        FileFinder.load_index(self.index)
+        self.assertEqual(FileFinder._index[self.modules][1], ('indexed.py',))
+
+    def test_listing_skipped(self):
+        FileFinder = self.machinery.FileFinder
+        FileFinder.load_index(self.index)
+        mtime = os.stat(self.modules).st_mtime
+        FileFinder._index[self.modules] = mtime, (), mtime + 10
+        self.assertIsNone(self.get_finder(self.modules).find_spec('indexed'))
+        st = os.stat(self.modules)
+        os.utime(self.modules, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertIsNotNone(self.get_finder(self.modules).find_spec(
+            'indexed'))
+        self.assertTrue(FileFinder._index_changed)
+
+    def test_relative_path_not_indexed(self):
+        FileFinder = self.machinery.FileFinder
+        FileFinder.load_index(self.index)
+        with support.change_cwd(self.modules):
+            self.assertIsNotNone(self.get_finder('').find_spec('indexed'))
+        self.assertEqual(FileFinder._index, {})
+
+    def test_modified_after_save(self):
+        FileFinder = self.machinery.FileFinder
+        FileFinder.load_index(self.index)
+        self.get_finder(self.modules).find_spec('indexed')
+        FileFinder.save_index(self.index)
+        st = os.stat(self.index)
+        os.utime(self.index, ns=(st.st_atime_ns, os.stat(self.modules).
+            st_mtime_ns))
+        FileFinder.load_index(self.index)
+        self.assertEqual(FileFinder._index, {})
+
+    def test_listed_in_same_second(self):
+        FileFinder = self.machinery.FileFinder
+        FileFinder.load_index(self.index)
+        os.utime(self.modules)
+        self.assertIsNotNone(self.get_finder(self.modules).find_spec(
+            'indexed'))
+        self.assertNotIn(self.modules, FileFinder._index)
+        mtime = os.stat(self.modules).st_mtime
+        FileFinder._index[self.modules] = mtime, (), mtime
+        FileFinder._index_changed = True
+        FileFinder.save_index(self.index)
+        FileFinder.load_index(self.index)
+        self.assertEqual(FileFinder._index, {})
+
+    def test_invalid_index(self):
+        with open(self.index, 'wb') as file:
+            file.write(b'invalid')
+        self.machinery.FileFinder.load_index(self.index)
+        self.assertEqual(self.machinery.FileFinder._index, {})
 if __name__ == '__main__':
     unittest.main()
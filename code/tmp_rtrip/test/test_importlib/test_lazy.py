@@ -1,9 +1,11 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
 import types
 import unittest
+from test import support
 from . import util as test_util
 
 
@@ -123,5 +125,90 @@ class LazyLoaderTests(unittest.TestCase):
             module.__name__
 
 
+class LazyFinderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = self.enterContext(support.temp_dir())
+        os.mkdir(os.path.join(self.directory, 'lazy_pkg'))
+        for name in ('lazy_mod.py', os.path.join('lazy_pkg', '__init__.py'),
+            os.path.join('lazy_pkg', 'sub.py')):
+            with open(os.path.join(self.directory, name), 'w') as file:
+                file.write('value = 42\n')
+        self.enterContext(test_util.uncache('lazy_mod', 'lazy_pkg',
+            'lazy_pkg.sub'))
+        self.enterContext(support.DirsOnSysPath(self.directory))
+        importlib.invalidate_caches()
+
+    def enterContext(self, cm):
+        result = cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+        return result
+
+    def test_patterns(self):
+        finder = util.LazyFinder(['email', 'xml.*'])
+        self.assertTrue(finder.matches('email'))
+        self.assertFalse(finder.matches('email.message'))
+        self.assertFalse(finder.matches('xml'))
+        self.assertTrue(finder.matches('xml.dom'))
+        self.assertTrue(finder.matches('xml.dom.minidom'))
+        self.assertFalse(finder.matches('xmlrpc'))
+        self.assertTrue(util.LazyFinder('*').matches('anything'))
+
+    def test_lazy_import(self):
+        with util.LazyFinder(['lazy_mod']) as finder:
+            self.assertIn(finder, sys.meta_path)
+            import lazy_mod
+        self.assertNotIn(finder, sys.meta_path)
+        self.assertEqual(finder.lazy, ['lazy_mod'])
+        self.assertEqual(finder.loaded, {})
+        self.assertEqual(lazy_mod.value, 42)
+        attr, filename, lineno = finder.loaded['lazy_mod']
+        self.assertEqual(attr, 'value')
+        self.assertEqual(filename, __file__)
+        self.assertIsInstance(lazy_mod.__loader__, importlib.machinery.
+            SourceFileLoader)
+
+    def test_unselected(self):
+        with util.LazyFinder(['lazy_pkg.*']) as finder:
+            import lazy_mod
+        self.assertEqual(finder.lazy, [])
+        self.assertEqual(lazy_mod.value, 42)
+
+    def test_from_import_module(self):
+        with util.LazyFinder(['lazy_mod']) as finder:
+            from lazy_mod import value
+        self.assertEqual(value, 42)
+        self.assertIn('lazy_mod', finder.loaded)
+
+    def test_from_import_submodule(self):
+        with util.LazyFinder(['lazy_pkg.*']) as finder:
+            from lazy_pkg import sub
+        self.assertEqual(finder.lazy, ['lazy_pkg.sub'])
+        self.assertEqual(finder.loaded, {})
+        self.assertIs(sys.modules['lazy_pkg'].sub, sub)
+        self.assertEqual(sub.value, 42)
+        self.assertEqual(finder.loaded['lazy_pkg.sub'][0], 'value')
+
+    def test_submodule_of_lazy_package(self):
+        with util.LazyFinder(['lazy_pkg', 'lazy_pkg.*']) as finder:
+            import lazy_pkg.sub
+        self.assertEqual(finder.lazy, ['lazy_pkg', 'lazy_pkg.sub'])
+        self.assertEqual(list(finder.loaded), ['lazy_pkg'])
+        self.assertEqual(lazy_pkg.value, 42)
+        self.assertEqual(lazy_pkg.sub.value, 42)
+        self.assertEqual(len(finder.loaded), 2)
+
+    def test_report(self):
+        with util.LazyFinder(['lazy_mod', 'lazy_pkg']) as finder:
+            import lazy_mod
+            import lazy_pkg
+        lazy_mod.value
+        report = finder.report().splitlines()
+        self.assertEqual(report[0], '2 lazy modules: 1 loaded, 1 not loaded')
+        self.assertTrue(report[1].startswith('  loaded     lazy_mod (.value at '
+            ))
+        self.assertEqual(report[2], '  not loaded lazy_pkg')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -710,6 +710,50 @@ Frozen_PEP3147Tests, Source_PEP3147Tests = util.test_both(PEP3147Tests,
     util=importlib_util)
 
 
+class ImportProfilerTests(unittest.TestCase):
+    util = importlib_util['Source']
+
+    def test_phases(self):
+        external = self.util._bootstrap_external
+        hook = external.FileFinder.path_hook((external.SourceFileLoader,
+            external.SOURCE_SUFFIXES))
+        with support.temp_dir() as directory:
+            with open(os.path.join(directory, 'profiled.py'), 'w') as file:
+                file.write('x = 1\n')
+            with util.import_state(path_hooks=[hook], path_importer_cache={}
+                ), support.swap_attr(sys, 'dont_write_bytecode', True):
+                with self.util.ImportProfiler() as profiler:
+                    self.assertIs(external._import_profiler, profiler)
+                    spec = external.PathFinder.find_spec('profiled', [
+                        directory])
+                    module = self.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+        self.assertIsNone(external._import_profiler)
+        self.assertEqual(module.x, 1)
+        times = profiler.stats['profiled']
+        for kind in ('find', 'load', 'compile', 'exec'):
+            self.assertGreater(times[kind], 0, kind)
+        self.assertEqual(times['unmarshal'], 0)
+        self.assertEqual(profiler.totals(), times)
+        self.assertIn('profiled', profiler.format())
+
+    def test_nested_phases(self):
+        profiler = self.util.ImportProfiler(timer=iter(range(100)).__next__)
+        with profiler.phase('outer', 'exec'):
+            with profiler.phase('inner', 'find'):
+                pass
+            with profiler.phase('inner', 'exec'):
+                pass
+        self.assertEqual(profiler.stats['outer']['exec'], 3)
+        self.assertEqual(profiler.stats['inner']['find'], 1)
+        self.assertEqual(profiler.stats['inner']['exec'], 1)
+        self.assertEqual(profiler.totals()['exec'], 4)
+        lines = profiler.format(limit=1).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[2].startswith('outer'))
+        self.assertTrue(lines[4].startswith('total'))
+
+
 class MagicNumberTests(unittest.TestCase):
     """
     Test release compatibility issues relating to importlib
@@ -1,6 +1,6 @@
 import decimal
 from io import StringIO, BytesIO
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from test.test_json import PyTest, CTest
 
 
@@ -81,6 +81,73 @@ class TestDecode:
         self.assertEqual(self.loads(bom_in_str), '\ufeff')
         self.assertEqual(self.json.load(StringIO(bom_in_str)), '\ufeff')
 
+    def test_decoder_context_keys(self):
+        context = self.json.decoder.DecoderContext()
+        a = context.decode('[{"key": 1, "other": {}}]')
+        b = context.decode('{"other": 2, "key": {"key": 3}}')
+        self.assertEqual(a, [{'key': 1, 'other': {}}])
+        self.assertEqual(b, {'other': 2, 'key': {'key': 3}})
+        key_a = next(iter(a[0]))
+        key_b, = b['key']
+        self.assertEqual(key_a, 'key')
+        self.assertIs(key_a, key_b)
+        self.assertEqual(set(context.keys), {'key', 'other'})
+        context = self.json.decoder.DecoderContext(object_hook=len,
+            max_keys=1)
+        self.assertEqual(context.decode('[{"a": 1, "b": 2}, {}]'), [2, 0])
+        self.assertEqual(context.keys, {})
+
+    def test_decoder_context_schema(self):
+        Point = namedtuple('Point', 'x y')
+
+
+        class Box:
+            __slots__ = 'width', 'height'
+
+
+        class Cube(Box):
+            __slots__ = 'depth',
+        context = self.json.decoder.DecoderContext(schema=[Point, Cube, (
+            'a', 'b', 'c')], parse_float=decimal.Decimal)
+        s = ('[{"x": 1, "y": 2}, {"y": 3, "x": 4}, {"x": 5}, {"x": 1, "y": 2, '
+            '"z": 3}, {"depth": 1.5, "width": 2, "height": 3}, '
+            '{"c": {"x": 0, "y": 0}, "b": 2, "a": 1}, {"a": 1, "a": 2}]')
+        result = context.decode(s)
+        self.assertEqual(result[:4], [Point(1, 2), Point(4, 3), {'x': 5}, {
+            'x': 1, 'y': 2, 'z': 3}])
+        self.assertIs(type(result[0]), Point)
+        cube = result[4]
+        self.assertIs(type(cube), Cube)
+        self.assertEqual((cube.width, cube.height, cube.depth), (2, 3,
+            decimal.Decimal('1.5')))
+        self.assertEqual(result[5], (1, 2, Point(0, 0)))
+        self.assertEqual(result[6], {'a': 2})
+        again = context.decode(s)
+        self.assertEqual(again[:4] + again[5:], result[:4] + result[5:])
+        self.assertIs(type(again[4]), Cube)
+
+        class Private:
+            __slots__ = '__x', 'y'
+
+            def get(self):
+                return self.__x, self.y
+        Keyword = type('Keyword', (), {'__slots__': ('class', 'def')})
+        context = self.json.decoder.DecoderContext(schema=[Private, Keyword])
+        private, keyword = context.decode(
+            '[{"y": 2, "__x": 1}, {"class": 3, "def": 4}]')
+        self.assertIs(type(private), Private)
+        self.assertEqual(private.get(), (1, 2))
+        self.assertEqual((getattr(keyword, 'class'), getattr(keyword, 'def')
+            ), (3, 4))
+
+    def test_decoder_context_errors(self):
+        DecoderContext = self.json.decoder.DecoderContext
+        self.assertRaises(TypeError, DecoderContext, schema=[dict])
+        self.assertRaises(ValueError, DecoderContext, schema=[('a', 'a')])
+        self.assertRaises(ValueError, DecoderContext, schema=[('a', 'b'), (
+            'b', 'a')])
+        self.assertRaises(TypeError, DecoderContext, object_pairs_hook=list)
+
     def test_negative_index(self):
         d = self.json.JSONDecoder()
         self.assertRaises(ValueError, d.raw_decode, 'a' * 42, -50000)
@@ -13,6 +13,40 @@ class TestDump:
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_writes(self):
+
+
+        class Writer(list):
+            write = list.append
+        obj = {'a': [1, 2.5, None, {'b': ('c', True)}], 'd': {}, 'e': []}
+        obj['f'] = [dict(obj) for i in range(1000)]
+        for kw in ({}, {'indent': 2}, {'sort_keys': True, 'indent': '\t'},
+            {'separators': (',', ':')}):
+            with self.subTest(**kw):
+                writer = Writer()
+                self.json.dump(obj, writer, **kw)
+                self.assertEqual(''.join(writer), self.dumps(obj, **kw))
+                chunks = list(self.json.JSONEncoder(**kw).iterencode(obj))
+                self.assertLess(len(writer) * 1000, len(chunks))
+
+    def test_dump_circular(self):
+        a = []
+        a.append([a])
+        for kw in ({}, {'indent': 2}):
+            with self.assertRaisesRegex(ValueError, 'Circular reference'):
+                self.json.dump([a], StringIO(), **kw)
+
+    def test_dump_iterencode_override(self):
+
+
+        class Encoder(self.json.JSONEncoder):
+
+            def iterencode(self, o, _one_shot=False):
+                yield '"overridden"'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '"overridden"')
+
     def test_encode_truefalse(self):
         self.assertEqual(self.dumps({True: False, False: True}, sort_keys=
             True), '{"false": true, "true": false}')
@@ -0,0 +1,89 @@
+from io import StringIO, BytesIO
+from collections import OrderedDict
+from test.test_json import PyTest, CTest
+
+
+def pieces(s, size):
+    return [s[i:i + size] for i in range(0, len(s), size)]
+
+
+class TestIterload:
+    data = ['foo', {'bar': ['baz', None, 1.0, 2]}, -0.5, 12345678901234567890,
+        1e+100, True, '€\U0001d11e', [], {}, '']
+
+    def test_array(self):
+        s = self.dumps(self.data, indent=2)
+        for size in (1, 2, 3, 7, 1000):
+            items = list(self.json.JSONDecoder().iterdecode(pieces(s, size)))
+            self.assertEqual(items, self.data)
+
+    def test_empty_array(self):
+        for s in ('[]', ' [ ] ', '[\n]\n'):
+            self.assertEqual(list(self.json.JSONDecoder().iterdecode(pieces(
+                s, 1))), [])
+
+    def test_lines(self):
+        s = '\n'.join(self.dumps(item) for item in self.data) + '\r\n\n  \n'
+        for size in (1, 3, 1000):
+            items = list(self.json.JSONDecoder().iterdecode(pieces(s, size),
+                lines=True))
+            self.assertEqual(items, self.data)
+        self.assertEqual(list(self.json.JSONDecoder().iterdecode([],
+            lines=True)), [])
+
+    def test_iterload(self):
+        s = self.dumps(self.data)
+        self.assertEqual(list(self.json.iterload(StringIO(s), chunk_size=5)
+            ), self.data)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-32-le'):
+            fp = BytesIO(s.encode(encoding))
+            self.assertEqual(list(self.json.iterload(fp, chunk_size=3)),
+                self.data)
+        fp = BytesIO(b'{"a": 1}\n{"b": 2}\n')
+        self.assertEqual(list(self.json.iterload(fp, lines=True,
+            object_pairs_hook=OrderedDict)), [OrderedDict(a=1), OrderedDict(
+            b=2)])
+
+    def test_bounded_buffer(self):
+        produced = []
+
+        def generate():
+            yield '['
+            for i in range(1000):
+                produced.append(i)
+                yield '{"item": %d}, ' % i
+            yield '0]'
+        for i, item in enumerate(self.json.JSONDecoder().iterdecode(
+            generate())):
+            if i < 1000:
+                self.assertEqual(item, {'item': i})
+                self.assertLessEqual(len(produced), i + 3)
+
+    def test_errors(self):
+        decoder = self.json.JSONDecoder()
+        for s in ('[1, 2', '[1 2]', '[1, 2]]', '["a\\x"]', '[1, [tru]]',
+            '[\n{"a": 1,\n "b" 2}]', '[1, 2.]', '[-]'):
+            with self.subTest(s=s):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.loads(s)
+                expected = cm.exception
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    list(decoder.iterdecode(pieces(s, 2)))
+                err = cm.exception
+                self.assertEqual((err.msg, err.pos, err.lineno, err.colno),
+                    (expected.msg, expected.pos, expected.lineno,
+                    expected.colno))
+        with self.assertRaisesRegex(self.JSONDecodeError,
+            "Expecting '\\['"):
+            list(decoder.iterdecode(['{}']))
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(decoder.iterdecode(pieces('1\n2\n[3,]\n', 2), lines=True))
+        self.assertEqual((cm.exception.lineno, cm.exception.colno), (3, 4))
+
+
+class TestPyIterload(TestIterload, PyTest):
+    pass
+
+
+class TestCIterload(TestIterload, CTest):
+    pass
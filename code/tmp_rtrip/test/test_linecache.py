@@ -201,6 +201,63 @@ class LineCacheTests(unittest.TestCase):
         self.assertEqual(lines3, [])
         self.assertEqual(linecache.getlines(FILENAME), lines)
 
+    def test_maxbytes(self):
+        linecache.clearcache()
+        self.addCleanup(linecache.clearcache)
+        filenames = [os.path.join(MODULE_PATH, entry) + '.py' for entry in
+            MODULES]
+        size = max(os.path.getsize(filename) for filename in filenames)
+        with support.swap_attr(linecache, 'maxbytes', size):
+            for filename in filenames:
+                linecache.getline(filename, 1)
+            self.assertEqual(list(linecache.cache), filenames[-1:])
+            linecache.getline(filenames[0], 1)
+            self.assertEqual(list(linecache.cache), filenames[:1])
+            for index, line in enumerate(linecache.getlines(filenames[0])):
+                self.assertEqual(line, linecache.getline(filenames[0],
+                    index + 1))
+
+    def test_checkcache_recent(self):
+        getline = linecache.getline
+        linecache.clearcache()
+        source_names = [support.TESTFN + '1.py', support.TESTFN + '2.py']
+        for source_name in source_names:
+            self.addCleanup(support.unlink, source_name)
+            with open(source_name, 'w') as source:
+                source.write(SOURCE_1)
+            getline(source_name, 1)
+        linecache.checkcache(recent=True)
+        getline(source_names[0], 1)
+        for source_name in source_names:
+            with open(source_name, 'w') as source:
+                source.write(SOURCE_2)
+        linecache.checkcache(recent=True)
+        self.assertNotIn(source_names[0], linecache.cache)
+        self.assertIn(source_names[1], linecache.cache)
+        self.assertEqual(getline(source_names[0], 2), 'def f():\n')
+        self.assertEqual(getline(source_names[1], 2), '" Docstring "\n')
+        linecache.checkcache()
+        self.assertEqual(getline(source_names[1], 2), 'def f():\n')
+
+    def test_universal_newlines(self):
+        self.addCleanup(support.unlink, support.TESTFN)
+        with open(support.TESTFN, 'wb') as fp:
+            fp.write(b'\xef\xbb\xbfa = 1\r\nb = 2\rc = 3')
+        linecache.checkcache(support.TESTFN)
+        self.assertEqual(linecache.getline(support.TESTFN, 2), 'b = 2\n')
+        self.assertEqual(linecache.getlines(support.TESTFN), ['a = 1\n',
+            'b = 2\n', 'c = 3\n'])
+
+    def test_bom_on_later_line(self):
+        self.addCleanup(support.unlink, support.TESTFN)
+        with open(support.TESTFN, 'wb') as fp:
+            fp.write(b'\xef\xbb\xbfx\n\xef\xbb\xbfy\n')
+        linecache.checkcache(support.TESTFN)
+        self.assertEqual(linecache.getline(support.TESTFN, 1), 'x\n')
+        self.assertEqual(linecache.getline(support.TESTFN, 2), '\ufeffy\n')
+        self.assertEqual(linecache.getlines(support.TESTFN), ['x\n',
+            '\ufeffy\n'])
+
 
 if __name__ == '__main__':
     unittest.main()
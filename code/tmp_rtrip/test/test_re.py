@@ -1,10 +1,13 @@
 from test.support import verbose, run_unittest, gc_collect, bigmemtest, _2G, cpython_only, captured_stdout
+from test import support
 import io
 import locale
+import os
 import re
 import sre_compile
 import string
 import sys
+import tempfile
 import traceback
 import unittest
 import warnings
@@ -1705,6 +1708,37 @@ SUBPATTERN None 0 0
         self.assertEqual(m.group(), b'xyz')
         self.assertEqual(m2.group(), b'')
 
+    def test_cache_lru(self):
+        self.addCleanup(re.set_cache_size, re.cache_info().maxsize)
+        re.purge()
+        re.set_cache_size(3)
+        info = re.cache_info()
+        for c in 'abcd':
+            re.compile(c)
+        re.compile('a')
+        re.compile('c')
+        new = re.cache_info()
+        self.assertEqual(new.currsize, 3)
+        self.assertEqual(new.hits - info.hits, 1)
+        self.assertEqual(new.misses - info.misses, 5)
+        self.assertEqual(new.evictions - info.evictions, 2)
+        self.assertEqual(list(re._cache), [(str, 'd', 0), (str, 'a', 0), (
+            str, 'c', 0)])
+        re.set_cache_size(1)
+        self.assertEqual(list(re._cache), [(str, 'c', 0)])
+        self.assertEqual(re.cache_info().evictions - info.evictions, 4)
+        self.assertRaises(ValueError, re.set_cache_size, -1)
+
+    def test_preload(self):
+        re.purge()
+        info = re.cache_info()
+        compiled = re.preload(['a+', ('b+', re.I), b'c+'], re.M)
+        self.assertEqual([(p.pattern, p.flags & (re.I | re.M)) for p in
+            compiled], [('a+', re.M), ('b+', re.I), (b'c+', re.M)])
+        self.assertIs(re.compile('a+', re.M), compiled[0])
+        self.assertIs(re.compile('b+', re.I), compiled[1])
+        self.assertEqual(re.cache_info().hits - info.hits, 2)
+
 
 class PatternReprTests(unittest.TestCase):
 
@@ -1783,6 +1817,90 @@ class ImplementationTest(unittest.TestCase):
         self.assertEqual(f('abcabdac'), [0, 0, 0, 1, 2, 0, 1, 0])
 
 
+class CodeCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.addCleanup(setattr, sre_compile, 'codecache', sre_compile.
+            codecache)
+        self.cache = self.new_cache()
+
+    def new_cache(self, maxentries=4096):
+        sre_compile.codecache = cache = sre_compile.CodeCache(self.
+            directory, maxentries)
+        self.addCleanup(cache.clear)
+        return cache
+
+    def test_roundtrip(self):
+        patterns = [('(?P<word>\\w+)-(\\d+)', 0), ('a.*b', re.I | re.S), (
+            b'(?P<x>[^\\x00-\\x1f]+)', 0), ('(?x) a  b', 0)]
+        compiled = [sre_compile.compile(p, flags) for p, flags in patterns]
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 4))
+        self.cache.save()
+        cache = self.new_cache()
+        for (p, flags), expected in zip(patterns, compiled):
+            with self.subTest(pattern=p):
+                result = sre_compile.compile(p, flags)
+                self.assertEqual(result, expected)
+                self.assertEqual(result.groupindex, expected.groupindex)
+                self.assertEqual(result.flags, expected.flags)
+        self.assertEqual((cache.hits, cache.misses), (4, 0))
+        m = sre_compile.compile(*patterns[0]).match('abc-42')
+        self.assertEqual((m.group('word'), m.group(2)), ('abc', '42'))
+        self.assertEqual(m.lastgroup, None)
+
+    def test_not_stored(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            sre_compile.compile('a(?i)b')
+        sre_compile.compile(b'a', re.LOCALE)
+        sre_compile.compile(b'(?L)a')
+        with captured_stdout():
+            sre_compile.compile('a', re.DEBUG)
+        self.cache.save()
+        self.assertFalse(os.path.exists(self.cache.filename))
+        cache = self.new_cache()
+        with self.assertWarns(DeprecationWarning):
+            sre_compile.compile('a(?i)b')
+        self.assertEqual(cache.hits, 0)
+
+    def test_maxentries(self):
+        for i in range(5):
+            sre_compile.compile('a%d' % i)
+        self.cache.save()
+        cache = self.new_cache(maxentries=3)
+        sre_compile.compile('a0')
+        sre_compile.compile('b')
+        cache.save()
+        cache = self.new_cache()
+        for p in ('a3', 'a0', 'b', 'a4'):
+            sre_compile.compile(p)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_bad_file(self):
+        sre_compile.compile('a+')
+        self.cache.save()
+        with open(self.cache.filename, 'r+b') as f:
+            f.truncate(5)
+        cache = self.new_cache()
+        self.assertTrue(sre_compile.compile('a+').match('aa'))
+        self.assertEqual(cache.misses, 1)
+        self.cache.clear()
+        self.assertFalse(os.path.exists(self.cache.filename))
+
+    def test_directory_not_recreated(self):
+        directory = os.path.join(self.directory, 'sub')
+        cache = sre_compile.codecache = sre_compile.CodeCache(directory)
+        self.addCleanup(cache.clear)
+        sre_compile.compile('a+')
+        self.assertTrue(os.path.isdir(directory))
+        os.rmdir(directory)
+        sre_compile.compile('b+')
+        cache.save()
+        self.assertFalse(os.path.exists(directory))
+
+
 class ExternalTests(unittest.TestCase):
 
     def test_re_benchmarks(self):
@@ -1,6 +1,7 @@
 from test import support
-from tokenize import tokenize, _tokenize, untokenize, NUMBER, NAME, OP, STRING, ENDMARKER, ENCODING, tok_name, detect_encoding, open as tokenize_open, Untokenizer
+from tokenize import tokenize, _tokenize, untokenize, NUMBER, NAME, OP, STRING, ENDMARKER, ENCODING, tok_name, detect_encoding, open as tokenize_open, Untokenizer, generate_tokens, tokenize_buffer, TokenError
 from io import BytesIO
+import io
 from unittest import TestCase, mock
 from test.test_grammar import VALID_UNDERSCORE_LITERALS, INVALID_UNDERSCORE_LITERALS
 import os
@@ -20,6 +21,8 @@ class TokenizeTest(TestCase):
         self.assertEqual(result, [
             "    ENCODING   'utf-8'       (0, 0) (0, 0)"] + expected.rstrip
             ().splitlines())
+        self.assertEqual(list(tokenize_buffer(s.encode('utf-8'))), list(
+            tokenize(BytesIO(s.encode('utf-8')).readline)))
 
     def test_basic(self):
         self.check_tokenize('1 + 1',
@@ -1310,6 +1313,80 @@ class TestTokenize(TestCase):
         self.assertExactTypeEqual('@          ', token.AT)
 
 
+class TestTokenizeBuffer(TestCase):
+
+    def check(self, source):
+        if isinstance(source, str):
+            expected = list(generate_tokens(io.StringIO(source).readline))
+        else:
+            expected = list(tokenize(BytesIO(source).readline))
+        table = tokenize_buffer(source)
+        self.assertEqual(len(table), len(expected))
+        self.assertEqual(list(table), expected)
+        self.assertEqual([table[i] for i in range(len(table))], expected)
+        self.assertEqual(table[-1], expected[-1])
+        self.assertEqual(table[1:3], expected[1:3])
+        return table
+
+    def test_columns(self):
+        source = 'if x:\n    y = "a"  # c\n'
+        table = self.check(source)
+        self.assertEqual([tok_name[t] for t in table.types], ['NAME',
+            'NAME', 'OP', 'NEWLINE', 'INDENT', 'NAME', 'OP', 'STRING',
+            'COMMENT', 'NEWLINE', 'DEDENT', 'ENDMARKER'])
+        self.assertEqual([source[s:e] for s, e in zip(table.starts, table.
+            ends)][:10], ['if', 'x', ':', '\n', '    ', 'y', '=', '"a"',
+            '# c', '\n'])
+        self.assertEqual(table.string(7), '"a"')
+        self.assertEqual(table.start(7), (2, 8))
+        self.assertEqual(table.end(7), (2, 11))
+        self.assertEqual(table.line(7), '    y = "a"  # c\n')
+        with self.assertRaises(IndexError):
+            table[len(table)]
+
+    def test_bytes(self):
+        table = self.check(b'# -*- coding: latin-1 -*-\nx = "\xe9"\n')
+        self.assertEqual(table.encoding, 'iso-8859-1')
+        self.assertEqual(table[0].string, 'iso-8859-1')
+        self.check(b'\xef\xbb\xbfx = 1\n')
+
+    def test_multiline(self):
+        self.check('x = """a\nb""" + 1\ny = (1,\n     2)\n')
+        self.check("x = 'a\\\nb'\n")
+        self.check("x = 'a\\\nb\n")
+        self.check('x = 1 + \\\n    2\n')
+
+    def test_edge_cases(self):
+        for source in ('', 'x', '#', 'x\n   ', '\n\n', 'x = 1\r\n',
+            '\tif x:\n\t\ty\n', '  $ ?\n', 'a\x0c b\n', '\u00b2\n'):
+            with self.subTest(source=source):
+                self.check(source)
+
+    def test_async(self):
+        self.check('async = 1\n')
+        self.check('async def f():\n    await x\n    async with y: pass\n')
+        self.check('async 1\n')
+        self.check('async async def\n')
+
+    def test_errors(self):
+        for source in ('x = """\n', 'x = (\n'):
+            with self.subTest(source=source):
+                with self.assertRaises(TokenError) as cm:
+                    list(generate_tokens(io.StringIO(source).readline))
+                with self.assertRaises(TokenError) as cm2:
+                    tokenize_buffer(source)
+                self.assertEqual(cm.exception.args, cm2.exception.args)
+        with self.assertRaises(IndentationError):
+            tokenize_buffer('if x:\n    y\n  z\n')
+
+    def test_files(self):
+        for name in ('test_tokenize.py', 'test_grammar.py'):
+            with open(support.findfile(name), 'rb') as f:
+                source = f.read()
+            with self.subTest(file=name):
+                self.check(source)
+
+
 class UntokenizeTest(TestCase):
 
     def test_bad_input_order(self):
@@ -96,7 +96,10 @@ with_two_items = """with f() as x, g() as y:
 class ASTTestCase(unittest.TestCase):
 
     def assertASTEqual(self, ast1, ast2):
-        self.assertEqual(ast.dump(ast1), ast.dump(ast2))
+        path = ast.first_difference(ast1, ast2)
+        if path is not None:
+            self.assertEqual(ast.dump(ast1), ast.dump(ast2),
+                'ASTs differ at %s' % path)
 
     def check_roundtrip(self, code1, filename='internal'):
         ast1 = compile(code1, filename, 'exec', ast.PyCF_ONLY_AST)
@@ -23,10 +23,12 @@ __author__ = 'Ka-Ping Yee <ping@lfw.org>'
 __credits__ = (
     'GvR, ESR, Tim Peters, Thomas Wouters, Fred Drake, Skip Montanaro, Raymond Hettinger, Trent Nelson, Michael Foord'
     )
+from array import array
+from bisect import bisect_right
 from builtins import open as _builtin_open
 from codecs import lookup, BOM_UTF8
 import collections
-from io import TextIOWrapper
+from io import BytesIO, TextIOWrapper
 from itertools import chain
 import itertools as _itertools
 import re
@@ -36,7 +38,7 @@ cookie_re = re.compile('^[ \\t\\f]*#.*?coding[:=][ \\t]*([-\\w.]+)', re.ASCII)
 blank_re = re.compile(b'^[ \\t\\f]*(?:[#\\r\\n]|$)', re.ASCII)
 import token
 __all__ = token.__all__ + ['COMMENT', 'tokenize', 'detect_encoding', 'NL',
-    'untokenize', 'ENCODING', 'TokenInfo']
+    'untokenize', 'ENCODING', 'TokenInfo', 'TokenTable', 'tokenize_buffer']
 del token
 COMMENT = N_TOKENS
 tok_name[COMMENT] = 'COMMENT'
@@ -606,6 +608,374 @@ def generate_tokens(readline):
     return _tokenize(readline, None)
 
 
+class TokenTable:
+    """The tokens of a whole source buffer, stored in columns.
+
+    *types* is an array of token types, and *starts* and *ends* are arrays
+    of offsets into *text*, the decoded source, so that
+    ``text[starts[i]:ends[i]]`` is the string of the i-th token.  Indexing
+    or iterating the table gives the same TokenInfo objects tokenize()
+    would produce, created only for the tokens that are asked for.
+    """
+
+    def __init__(self, text, encoding, types, starts, ends, line_starts,
+        eof_index, eof_row, lines):
+        self.text = text
+        self.encoding = encoding
+        self.types = types
+        self.starts = starts
+        self.ends = ends
+        self._line_starts = line_starts
+        self._eof_index = eof_index
+        self._eof_row = eof_row
+        self._lines = lines
+
+    def __repr__(self):
+        return '<%s of %d tokens>' % (self.__class__.__name__, len(self.types)
+            )
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.types)))]
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError('token index out of range')
+        return TokenInfo(self.types[index], self.string(index), self.start(
+            index), self.end(index), self.line(index))
+
+    def __iter__(self):
+        text, types, starts, ends = (self.text, self.types, self.starts,
+            self.ends)
+        line_starts = self._line_starts
+        rowstart = rowend = 0
+        for index in range(self._eof_index):
+            type = types[index]
+            start, end = starts[index], ends[index]
+            if not rowstart <= start < rowend:
+                row = self._row(start)
+                rowstart, rowend = line_starts[row], line_starts[row + 1]
+                line = text[rowstart:rowend]
+            if end > rowend or type == ENCODING or index in self._lines:
+                yield self[index]
+            else:
+                yield TokenInfo(type, text[start:end], (row, start -
+                    rowstart), (row, end - rowstart), line)
+        for index in range(self._eof_index, len(types)):
+            yield self[index]
+
+    def _row(self, offset):
+        return bisect_right(self._line_starts, offset, 1, len(self.
+            _line_starts) - 1) - 1
+
+    def string(self, index):
+        """Return the string of the token at *index*."""
+        if self.types[index] == ENCODING:
+            return self.encoding
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def start(self, index):
+        """Return the (row, column) where the token at *index* starts."""
+        if index >= self._eof_index:
+            return self._eof_row, 0
+        if self.types[index] == ENCODING:
+            return 0, 0
+        offset = self.starts[index]
+        row = self._row(offset)
+        return row, offset - self._line_starts[row]
+
+    def end(self, index):
+        """Return the (row, column) where the token at *index* ends."""
+        if index >= self._eof_index:
+            return self._eof_row, 0
+        if self.types[index] == ENCODING:
+            return 0, 0
+        offset = self.ends[index]
+        if offset == self.starts[index]:
+            row = self._row(offset)
+        else:
+            row = self._row(offset - 1)
+        return row, offset - self._line_starts[row]
+
+    def line(self, index):
+        """Return the physical line or lines the token at *index* is on."""
+        if index >= self._eof_index or self.types[index] == ENCODING:
+            return ''
+        if index in self._lines:
+            return self._lines[index]
+        first = self._row(self.starts[index])
+        last = self.end(index)[0]
+        return self.text[self._line_starts[first]:self._line_starts[last + 1]]
+
+
+def tokenize_buffer(source):
+    """Tokenize a whole source buffer at once and return a TokenTable.
+
+    *source* is either bytes, decoded the way tokenize() decodes them and
+    giving a table that starts with an ENCODING token, or a string, giving
+    the tokens generate_tokens() would produce.  The tokens are kept as
+    arrays of types and offsets instead of TokenInfo objects, which makes
+    this much cheaper than tokenize() for code that only looks at some of
+    the tokens.
+    """
+    if isinstance(source, str):
+        return _tokenize_buffer(source, None)
+    encoding, consumed = detect_encoding(BytesIO(source).readline)
+    text = bytes(source).decode(encoding)
+    if encoding == 'utf-8-sig':
+        encoding = 'utf-8'
+    return _tokenize_buffer(text, encoding)
+
+
+_dispatch = None
+
+
+def _token_dispatch():
+    global _dispatch
+    if _dispatch is None:
+        funny = _compile(Funny).match
+        dispatch = dict.fromkeys('()[]{}:;,~+-*/%&@|^=<>!', funny)
+        dispatch.update(dict.fromkeys('0123456789', _compile(Number).match))
+        dispatch.update(dict.fromkeys('ABCDEFGHIJKLMNOPQRSTUVWXYZ_'
+            'abcdefghijklmnopqrstuvwxyz', _compile(Name).match))
+        dispatch.update(dict.fromkeys('bBrRuUfF', _compile(group(Triple,
+            ContStr, Name)).match))
+        dispatch.update(dict.fromkeys('\'"', _compile(group(Triple, ContStr)
+            ).match))
+        dispatch['.'] = _compile(group(Number, Funny)).match
+        dispatch['#'] = _compile(Comment).match
+        dispatch['\\'] = _compile('\\\\\\r?\\n').match
+        dispatch['\r'] = dispatch['\n'] = _compile('\\r?\\n').match
+        _dispatch = dispatch, _compile(group(PseudoExtras, Number, Funny,
+            ContStr, Name)).match
+    return _dispatch
+
+
+def _tokenize_buffer(text, encoding):
+    types = array('B')
+    starts = array('l')
+    ends = array('l')
+    add_type, add_start, add_end = types.append, starts.append, ends.append
+    line_starts = array('l', [0])
+    lines = {}
+    dispatch, pseudomatch = _token_dispatch()
+    blankmatch = _compile(Whitespace).match
+    size = len(text)
+    lnum = parenlev = continued = 0
+    numchars = '0123456789'
+    contstart, needcont = -1, 0
+    indents = [0]
+    stashed = None
+    async_def = False
+    async_def_indent = 0
+    async_def_nl = False
+    if encoding is not None:
+        add_type(ENCODING)
+        add_start(0)
+        add_end(0)
+    eol = 0
+    while True:
+        linestart = eol
+        if linestart < size:
+            eol = text.find('\n', linestart) + 1 or size
+            line_starts.append(linestart)
+        lnum += 1
+        pos, max = linestart, eol
+        if contstart >= 0:
+            if pos == max:
+                raise TokenError('EOF in multi-line string', strstart)
+            endmatch = endprog(text, pos, max)
+            if endmatch:
+                pos = endmatch.end(0)
+                add_type(STRING)
+                add_start(contstart)
+                add_end(pos)
+                contstart, needcont = -1, 0
+            elif needcont and not text.endswith('\\\n', pos, max
+                ) and not text.endswith('\\\r\n', pos, max):
+                lines[len(types)] = text[contline:linestart]
+                add_type(ERRORTOKEN)
+                add_start(contstart)
+                add_end(max)
+                contstart = -1
+                continue
+            else:
+                continue
+        elif parenlev == 0 and not continued:
+            if pos == max:
+                break
+            pos = blankmatch(text, pos, max).end()
+            if pos == max:
+                break
+            column = pos - linestart
+            if text.find('\t', linestart, pos) >= 0 or text.find('\x0c',
+                linestart, pos) >= 0:
+                column = 0
+                for char in text[linestart:pos]:
+                    if char == ' ':
+                        column += 1
+                    elif char == '\t':
+                        column = (column // tabsize + 1) * tabsize
+                    else:
+                        column = 0
+            initial = text[pos]
+            if initial in '#\r\n':
+                if initial == '#':
+                    nl_pos = pos + len(text[pos:max].rstrip('\r\n'))
+                    add_type(COMMENT)
+                    add_start(pos)
+                    add_end(nl_pos)
+                    pos = nl_pos
+                add_type(NL)
+                add_start(pos)
+                add_end(max)
+                continue
+            if column > indents[-1]:
+                indents.append(column)
+                add_type(INDENT)
+                add_start(linestart)
+                add_end(pos)
+            while column < indents[-1]:
+                if column not in indents:
+                    raise IndentationError(
+                        'unindent does not match any outer indentation level',
+                        ('<tokenize>', lnum, pos - linestart, text[
+                        linestart:max]))
+                indents = indents[:-1]
+                if async_def and async_def_indent >= indents[-1]:
+                    async_def = False
+                    async_def_nl = False
+                    async_def_indent = 0
+                add_type(DEDENT)
+                add_start(pos)
+                add_end(pos)
+            if async_def and async_def_nl and async_def_indent >= indents[-1]:
+                async_def = False
+                async_def_nl = False
+                async_def_indent = 0
+        else:
+            if pos == max:
+                raise TokenError('EOF in multi-line statement', (lnum, 0))
+            continued = 0
+        while pos < max:
+            start = pos
+            initial = text[pos]
+            if initial in ' \t\x0c':
+                start = blankmatch(text, pos, max).end()
+                if start == max:
+                    break
+                initial = text[start]
+            match = dispatch.get(initial, pseudomatch)(text, start, max)
+            if match:
+                pos = match.end()
+                if initial in numchars or initial == '.' and text[start:pos
+                    ] not in ('.', '...'):
+                    add_type(NUMBER)
+                elif initial in '\r\n':
+                    if stashed is not None:
+                        add_type(NAME)
+                        add_start(stashed)
+                        add_end(stashed + 5)
+                        stashed = None
+                    if parenlev > 0:
+                        add_type(NL)
+                    else:
+                        add_type(NEWLINE)
+                        if async_def:
+                            async_def_nl = True
+                elif initial == '#':
+                    if stashed is not None:
+                        add_type(NAME)
+                        add_start(stashed)
+                        add_end(stashed + 5)
+                        stashed = None
+                    add_type(COMMENT)
+                elif initial == '\\':
+                    continued = 1
+                    continue
+                elif initial in '\'"' or text[pos - 1
+                    ] in '\'"\n' and initial.isidentifier():
+                    token = text[start:pos]
+                    if token in triple_quoted:
+                        endmatch = _compile(endpats[token]).match(text, pos,
+                            max)
+                        if endmatch:
+                            pos = endmatch.end(0)
+                            add_type(STRING)
+                        else:
+                            strstart = lnum, start - linestart
+                            endprog = _compile(endpats[token]).match
+                            contstart, contline = start, linestart
+                            break
+                    elif initial in single_quoted or token[:2
+                        ] in single_quoted or token[:3] in single_quoted:
+                        if token[-1] == '\n':
+                            strstart = lnum, start - linestart
+                            endprog = _compile(endpats.get(initial) or
+                                endpats.get(token[1]) or endpats.get(token[2])
+                                ).match
+                            contstart, contline = start, linestart
+                            needcont = 1
+                            break
+                        add_type(STRING)
+                elif initial.isidentifier():
+                    if stashed is None and not async_def and pos - start != 5:
+                        add_type(NAME)
+                    else:
+                        token = text[start:pos]
+                        if token in ('async', 'await') and async_def:
+                            add_type(ASYNC if token == 'async' else AWAIT)
+                        elif token == 'async' and stashed is None:
+                            stashed = start
+                            continue
+                        else:
+                            if stashed is not None:
+                                add_type(ASYNC if token == 'def' else NAME)
+                                add_start(stashed)
+                                add_end(stashed + 5)
+                                stashed = None
+                                if token == 'def':
+                                    async_def = True
+                                    async_def_indent = indents[-1]
+                            add_type(NAME)
+                else:
+                    if initial in '([{':
+                        parenlev += 1
+                    elif initial in ')]}':
+                        parenlev -= 1
+                    if stashed is not None:
+                        add_type(NAME)
+                        add_start(stashed)
+                        add_end(stashed + 5)
+                        stashed = None
+                    add_type(OP)
+                add_start(start)
+                add_end(pos)
+            else:
+                add_type(ERRORTOKEN)
+                add_start(pos)
+                add_end(pos + 1)
+                pos += 1
+    if stashed is not None:
+        add_type(NAME)
+        add_start(stashed)
+        add_end(stashed + 5)
+    line_starts.append(size)
+    eof_index = len(types)
+    for indent in indents[1:]:
+        add_type(DEDENT)
+        add_start(size)
+        add_end(size)
+    add_type(ENDMARKER)
+    add_start(size)
+    add_end(size)
+    return TokenTable(text, encoding, types, starts, ends, line_starts,
+        eof_index, lnum, lines)
+
+
 def main():
     import argparse
 